@@ -0,0 +1,96 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sys
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteStatements import SelectRoster
+
+def LoadAvailabilityIndex(conn, tableName="positionCounters"):
+    """ This function loads the roster and the attendance table into a player x game bitmap with two queries;
+    bit n of a game's mask is the nth player of the roster, and every player is present unless the attendance
+    table says otherwise
+    :param conn: database connection object
+    :param tableName: the counters table that defines the roster and its order
+    :return: dictionary holding the roster, the bit of each player and the absent mask of each game
+    """
+
+    cur = conn.cursor()
+
+    # The roster in counters table order, which is the order the scheduler breaks ties in
+    cur.execute(SelectRoster(tableName))
+    playerIds = []
+    bits = {}
+    for row in cur:
+        if row[0] not in bits:
+            bits[row[0]] = 1 << len(playerIds)
+            playerIds.append(row[0])
+
+    # Databases created before the attendance table existed have everybody at every game
+    absentMasks = {}
+    cur.execute( """SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'attendance'""" )
+    if cur.fetchone() is not None:
+        cur.execute( """SELECT gameId, playerId FROM attendance WHERE NOT presentFlag""" )
+        for gameId, playerId in cur:
+            absentMasks[gameId] = absentMasks.get(gameId, 0) | bits.get(playerId, 0)
+
+    return {
+        "playerIds": playerIds,
+        "bits": bits,
+        "rosterMask": (1 << len(playerIds)) - 1,
+        "absentMasks": absentMasks
+    }
+
+def AvailableMask(index, gameId):
+    """ This function returns the bitmap of the players expected at a game
+    :param index: the availability index returned by LoadAvailabilityIndex
+    :param gameId: the game ID
+    :return: bitmask over the roster
+    """
+
+    return index["rosterMask"] & ~index["absentMasks"].get(gameId, 0)
+
+def AvailablePlayers(index, gameId):
+    """ This function returns the players expected at a game, in roster order
+    :param index: the availability index returned by LoadAvailabilityIndex
+    :param gameId: the game ID
+    :return: list of player IDs
+    """
+
+    mask = AvailableMask(index, gameId)
+    return [playerId for i, playerId in enumerate(index["playerIds"]) if mask >> i & 1]
+
+def RecordAttendance(conn, gameId, presentPlayerIds=(), absentPlayerIds=()):
+    """ This function records who is and who is not coming to a game in one transaction; earlier answers for
+    the same players are replaced
+    :param conn: database connection object
+    :param gameId: the game ID
+    :param presentPlayerIds: players who are coming
+    :param absentPlayerIds: players who are not coming
+    """
+
+    rows = [(gameId, playerId, 1) for playerId in presentPlayerIds] + \
+           [(gameId, playerId, 0) for playerId in absentPlayerIds]
+
+    # The connection context manager commits once at the end or rolls everything back on an error
+    with conn:
+        conn.executemany( """INSERT OR REPLACE INTO attendance(gameId, playerId, presentFlag) VALUES(?, ?, ?)""", rows)
+
+def main():
+    """ Main program code; prints the players expected at each game ID passed on the command line
+    """
+
+    # create a database connection
+    conn = CreateConnection(DatabasePath())
+
+    if conn is not None:
+        index = LoadAvailabilityIndex(conn)
+        for argument in sys.argv[1:]:
+            if argument.isdigit():
+                print("Game: " + argument + ", Players: " + str(AvailablePlayers(index, int(argument))))
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from SQLiteConnection import CreateConnection
+from SQLiteCreateTables import CreateAllTables
+from SQLiteCounterMatrix import PositionColumns
+from SQLiteSportModel import DEFAULT_MODEL, StaffedPositions
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, UpdateEntireSchedule
+from SQLiteBuildSchedule import FindNextPlayerForPosition, UpdateScheduleWithNextPosition, UpdateTempCountersTable
+
+# Engine that schedules one record at a time with the per-row functions (one insert, update and commit each)
+ROW_ENGINE = "row"
+
+# Engines that can be benchmarked; the greedy and matching engines go through UpdateEntireSchedule
+ENGINES = [ROW_ENGINE, GREEDY_MODE, MATCHING_MODE]
+
+# Storage the synthetic databases can be created in
+STORAGES = ["file", ":memory:"]
+
+# Positions for the synthetic positions table, in position ID order, with the infield flag
+POSITIONS = [("First Base", 1), ("Second Base", 1), ("Third Base", 1), ("Short Stop", 1), ("Pitcher", 1),
+             ("Right Field", 0), ("Left Field", 0), ("Center Field", 0), ("Home Run", 0)]
+
+def GenerateSyntheticTeam(conn, playerCount, gameCount, inningCount, historyGames, seed, attendance=0.85):
+    """ This function fills an empty database with a synthetic team: positions, players, the games already
+    played plus the games to schedule, random counter histories and a random roster for every game
+    :param conn: database connection object
+    :param playerCount: the number of players on the team
+    :param gameCount: the number of games to schedule
+    :param inningCount: the number of innings per game
+    :param historyGames: the number of games already played; the counters are drawn from this history
+    :param seed: random seed so every engine sees the same team
+    :param attendance: the chance that a player shows up for a game
+    :return: a list of (gameId, playerIdList, inningCount) tuples for the games to schedule
+    """
+
+    rnd = random.Random(seed)
+    CreateAllTables(conn)
+
+    with conn:
+        cur = conn.cursor()
+
+        # Positions, players and games
+        cur.executemany("""INSERT INTO positions(name, infieldFlag) VALUES(?, ?)""", POSITIONS)
+        cur.executemany("""INSERT INTO players(firstName, lastName) VALUES(?, ?)""",
+                        [("Player%d" % i, "Team%d" % seed) for i in range(1, playerCount + 1)])
+        cur.executemany("""INSERT INTO games(id, date, vs, startTime, homeFlag) VALUES(?, ?, ?, ?, ?)""",
+                        [(i, "2021-%02d-%02d" % (4 + i // 28, 1 + i % 28), "Opponent%d" % i, "11:00", i % 2)
+                         for i in range(1, historyGames + gameCount + 1)])
+
+        # Counter histories; each player has played some share of the history games at each position
+        columns = []
+        for i in range(len(POSITIONS)):
+            columns.extend(PositionColumns(i))
+        counterRows = []
+        for playerId in range(1, playerCount + 1):
+            row = [playerId]
+            for i in range(len(POSITIONS)):
+                counter = rnd.randint(0, historyGames)
+                row.extend([counter, rnd.randint(1, historyGames) if counter and historyGames else 0,
+                            rnd.randint(1, inningCount) if counter else 0])
+            row.append(rnd.randint(0, 1))
+            row.append(rnd.randint(1, 8) if historyGames else None)
+            counterRows.append(tuple(row))
+        for table in ("positionCounters", "tempCounters"):
+            cur.executemany("""INSERT INTO %s(playerId, %s, lastInningOutfieldFlag, lastPositionId) VALUES(%s)"""
+                            % (table, ", ".join(columns), ", ".join("?" * (len(columns) + 3))), counterRows)
+
+    # A random roster for each game; at least one player always shows up
+    games = []
+    for gameId in range(historyGames + 1, historyGames + gameCount + 1):
+        roster = [playerId for playerId in range(1, playerCount + 1) if rnd.random() < attendance]
+        if not roster:
+            roster = [rnd.randint(1, playerCount)]
+        games.append((gameId, roster, inningCount))
+    return games
+
+def ScheduleGameByRow(conn, playerIdList, gameNumber, inningCount):
+    """ This function builds a game with the per-row functions, one schedule insert and one counter update
+    (each with its own commit) per position, as the scheduler did before the counter matrix
+    :param conn: database connection object
+    :param playerIdList: the list of players present for the game
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    """
+
+    for inningNumber in range(1, inningCount + 1):
+        tempList = list(playerIdList)
+        for i in StaffedPositions(DEFAULT_MODEL, len(playerIdList)):
+            columns = PositionColumns(i)
+            playerForPosition = FindNextPlayerForPosition(conn, columns[0], columns[1], columns[2], tempList, i + 1)
+            assert playerForPosition != None
+            UpdateScheduleWithNextPosition(conn, "gameId", gameNumber, "playerId", playerForPosition, "positionId", (i+1),
+                                           "inningNumber", inningNumber)
+            UpdateTempCountersTable(conn, gameNumber, playerForPosition, columns, i, inningNumber)
+            tempList.remove(playerForPosition)
+
+def RunBenchmark(engine, storage, teamCount=1, playerCount=10, gameCount=12, inningCount=4, historyGames=12, seed=0):
+    """ This function builds synthetic teams in the given storage and schedules all of their games with one
+    engine, measuring every game
+    :param engine: ROW_ENGINE, GREEDY_MODE or MATCHING_MODE
+    :param storage: "file" for a temporary database file or ":memory:"
+    :param teamCount: the number of teams; every team gets its own database
+    :param playerCount: the number of players per team
+    :param gameCount: the number of games to schedule per team
+    :param inningCount: the number of innings per game
+    :param historyGames: the number of games already played per team
+    :param seed: random seed; team n uses seed + n
+    :return: list of per game dictionaries (team, gameId, seconds, statements, commits, peakBytes)
+    """
+
+    assert engine in ENGINES and storage in STORAGES
+    results = []
+    directory = tempfile.mkdtemp() if storage == "file" else None
+
+    try:
+        for team in range(teamCount):
+            path = os.path.join(directory, "team%d.db" % team) if directory else ":memory:"
+            conn = CreateConnection(path, reuse=False)
+            games = GenerateSyntheticTeam(conn, playerCount, gameCount, inningCount, historyGames, seed + team)
+
+            # Count every statement and commit through the trace callback
+            statements = []
+            conn.set_trace_callback(statements.append)
+
+            for gameId, playerIdList, innings in games:
+                del statements[:]
+                tracemalloc.start()
+                start = time.perf_counter()
+
+                if engine == ROW_ENGINE:
+                    ScheduleGameByRow(conn, playerIdList, gameId, innings)
+                else:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        UpdateEntireSchedule(conn, len(playerIdList), gameId, innings, engine, playerIdList)
+
+                seconds = time.perf_counter() - start
+                peakBytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                results.append({
+                    "team": team,
+                    "gameId": gameId,
+                    "seconds": seconds,
+                    "statements": len(statements),
+                    "commits": sum(1 for statement in statements if statement == "COMMIT"),
+                    "peakBytes": peakBytes
+                })
+
+            conn.set_trace_callback(None)
+            conn.close()
+    finally:
+        if directory:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return results
+
+def SummarizeBenchmark(results):
+    """ This function reduces the per game results to per game averages and totals
+    :param results: list returned by RunBenchmark
+    :return: dictionary of summary values
+    """
+
+    games = len(results) or 1
+    return {
+        "games": len(results),
+        "seconds": sum(result["seconds"] for result in results),
+        "msPerGame": 1000.0 * sum(result["seconds"] for result in results) / games,
+        "statementsPerGame": sum(result["statements"] for result in results) / float(games),
+        "commitsPerGame": sum(result["commits"] for result in results) / float(games),
+        "peakKiB": max([result["peakBytes"] for result in results] or [0]) / 1024.0
+    }
+
+def main():
+    """ Main program code; the size of the synthetic league is passed on the command line
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling engines against a synthetic league")
+    parser.add_argument("--teams", type=int, default=1)
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--games", type=int, default=12)
+    parser.add_argument("--innings", type=int, default=4)
+    parser.add_argument("--history", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--engines", nargs="+", default=ENGINES, choices=ENGINES)
+    parser.add_argument("--storages", nargs="+", default=STORAGES, choices=STORAGES)
+    args = parser.parse_args()
+
+    # Run every engine against every storage and print one line each
+    for storage in args.storages:
+        for engine in args.engines:
+            summary = SummarizeBenchmark(RunBenchmark(engine, storage, args.teams, args.players, args.games,
+                                                      args.innings, args.history, args.seed))
+            print("Storage: %-8s Engine: %-8s Games: %4d  ms/game: %8.3f  statements/game: %7.1f  commits/game: %6.1f  peak KiB: %8.1f"
+                  % (storage, engine, summary["games"], summary["msPerGame"], summary["statementsPerGame"],
+                     summary["commitsPerGame"], summary["peakKiB"]))
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,121 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 8/28/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
-from sqlite3 import Error
+import os
+import time
+from SQLiteCounterMatrix import PositionColumns, LoadCounterMatrix, FindNextPlayerInMatrix, UpdateCounterMatrix, SaveCounterMatrix
+from SQLiteCounterMatrix import CopyCounterMatrix, GetCounterMatrixCell, SetCounterMatrixCell, SetCounterMatrixLastPosition
+from SQLiteCounterMatrix import PlayerRowMasks, PlayerRowMask, CounterRowsFor, MatrixModel
+from SQLiteSportModel import DEFAULT_MODEL, IsRestrictedPosition, StaffedPositions
+from SQLiteStatements import SelectCounterColumns, UpdateCounterColumns, SelectCounterRows, InsertSchedule, PlayerListParameter
+from SQLiteAttendance import LoadAvailabilityIndex, AvailablePlayers
+from SQLiteScheduleCache import ScheduleKey, LookupSchedule, StoreSchedule, RememberInMemory, ReplaySchedule
+from SQLiteInningAssignment import FindInningAssignmentInMatrix, ScheduleRuleViolations
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteProfiler import PROFILE_RATE_ENVIRONMENT_VARIABLE, Profiled, StartProfiling, StopProfiling, DumpProfile
 
-def CreateConnection(db_file):
-    """ Create a connection to the database 
-    :param db_file: database file
-    :return: connection object or None
+# Assignment modes for building an inning; greedy fills one position at a time starting with the outfield,
+# matching solves the whole inning at once as a min-cost bipartite matching
+GREEDY_MODE = "greedy"
+MATCHING_MODE = "matching"
+
+# Number of times a session builds a game without holding the write lock; when other sessions keep changing
+# the same players' counters first, the game is built once more while holding the lock
+SESSION_ATTEMPTS = 2
+
+@Profiled
+def LoadCandidateCounters(conn, playerIdList):
+    """ This function loads the tempCounters rows for the available players into memory in a single query so that
+    every position in an inning can be evaluated without going back to the database
+    :param conn: database connection object
+    :param playerIdList: a list of the players available to be scheduled
+    :return: a list of dictionaries (column name -> value), one per player, in table order
     """
-    
-    conn = None
-    try:
-        conn = sqlite3.connect(db_file)
-    except Error as e:
-        print(e)
-        
-    return conn
 
+    # Create the cursor object for navigating the database
+    cur = conn.cursor()
+
+    # Query the counter rows of the available players in table order; table order is what decides ties in the
+    # selection logic, and the player list is bound as one parameter so the statement text never changes
+    cur.execute(SelectCounterRows("tempCounters"), (PlayerListParameter(playerIdList),))
+
+    # Grab the column names so each row can be addressed by the same names used in posArr
+    columns = [description[0] for description in cur.description]
+
+    # Build one dictionary per row
+    candidateRows = []
+    for row in cur:
+        candidateRows.append(dict(zip(columns, row)))
+
+    # Return the candidate rows to the function call
+    return candidateRows
+
+def KeepMinimumRows(rows, column):
+    """ This function keeps only the rows holding the smallest value of the given column; it mirrors the
+    SQL pattern "WHERE column = (SELECT min(column) FROM table)" including the way NULL values are ignored
+    :param rows: a list of candidate rows
+    :param column: the column name to evaluate
+    :return: the rows holding the minimum value
+    """
+
+    # Gather the non-null values for the column; min() in SQL ignores NULL values
+    values = [row[column] for row in rows if row[column] is not None]
+
+    # If there is nothing to compare, then no rows survive (column = NULL never matches)
+    if not values:
+        return []
+
+    # Keep the rows matching the minimum value
+    lowest = min(values)
+    return [row for row in rows if row[column] == lowest]
+
+def SelectNextPlayerForPosition(candidateRows, column1, column2, column3, playerIdList, positionId):
+    """ This function determines which player from the list should play a position the next inning using counter
+    rows that are already in memory (see LoadCandidateCounters); it applies the same process of elimination
+    that used to be done with temp tables in the database
+    :param candidateRows: the tempCounters rows loaded for the inning
+    :param column1: the counter column name for the position
+    :param column2: the last game column name for the position
+    :param column3: the last inning column name for the position
+    :param playerIdList: a list of players still available in the inning
+    :param positionId: the position ID being scheduled
+    :return: player ID or None
+    """
+
+    # If there are no players left, then there is nobody to choose from
+    if not playerIdList:
+        return None
+
+    # Eliminate players who played this position last and players who are not available; a NULL
+    # lastPositionId never satisfies the != comparison in SQL, so those rows are eliminated as well
+    eligibleRows = [row for row in candidateRows
+                    if row["lastPositionId"] is not None
+                    and row["lastPositionId"] != positionId
+                    and row["playerId"] in playerIdList]
+
+    # If the position ID references an outfield position, then players who played outfield the previous
+    # inning should not have to play outfield again in the current inning
+    if IsRestrictedPosition(DEFAULT_MODEL, positionId):
+        eligibleRows = [row for row in eligibleRows if row["lastInningOutfieldFlag"] == 0]
+
+    # Evaluate (1) the number of times a player has played the position, (2) the most recent game they played
+    # at that position, and (3) the most recent inning they played that position
+    for column in (column1, column2, column3):
+        eligibleRows = KeepMinimumRows(eligibleRows, column)
+
+    # If no rows are left, then choose the first player left from the playerIdList parameter
+    if not eligibleRows:
+        player = playerIdList[0]
+    else:
+        player = int(eligibleRows[0]["playerId"])
+
+    # If player exists, then return that player to the function call
+    if player:
+        return player
+
+@Profiled
 def FindNextPlayerForPosition(conn, column1, column2, column3, playerIdList, positionId):
     """ This function takes a list of column names, a list of player IDs, and a position ID and uses
     them to query the database to determine which player from the list should play that position the next inning
@@ -32,89 +128,13 @@ def FindNextPlayerForPosition(conn, column1, column2, column3, playerIdList, pos
     :param positionId: the position ID for dynamic querying
     """
 
-    # Create the cursor object for navigating the database
-    cur = conn.cursor()
-    
-    # Instantiate player value to 0; this prevents player from being empty if one is not found in the queries
-    player = 0
-    
-    # error handling
-    try:
-        
-        # The first series of queries below in the conditional statements create temp tables based on a process of elimination
-        # to determine which players are eligible to play a given position in the current inning.  The queries executed 
-        # after the conditional statements create additional tables to further break down the list of eligible players
-        # based on (1) the number of times a player has played a given position, (2) the most recent game they played at
-        # that position, and (3) the most recent inning they played that position. 
-        
-        # Instantiate a tuple and fill it with the list of players; tuple is required for the IN{} clause in the SQL statements
-        playerIdTuple = tuple(playerIdList)        
-        
-        # If more than one player is in the list, then use IN{} clause in the query 
-        if len(playerIdList) > 1:
-            cur.execute( """CREATE TABLE schedule0_1 AS SELECT * FROM tempCounters WHERE lastPositionId != ?""", (positionId,))
-            cur.execute( """CREATE TABLE schedule1 AS SELECT * FROM schedule0_1 WHERE playerId IN {}""".format(playerIdTuple))
-            
-        # If only one player is in the list, then use an equality operator in the query
-        else:
-            cur.execute( """CREATE TABLE schedule0_1 AS SELECT * FROM tempCounters WHERE lastPositionId != ?""", (positionId,))
-            cur.execute( """CREATE TABLE schedule1 AS SELECT * FROM schedule0_1 WHERE playerId = ?""", (playerIdList))
-        
-        # If the position ID references an outfield position, then assess whether the players played outfield the previous
-        # inning or not; if they played outfield in the previous inning, then they should not have to play outfield
-        # again in the current inning
-        if positionId > 5:
-            cur.execute("""CREATE TABLE schedule1_1 AS SELECT playerId, %s, %s, %s, lastInningOutfieldFlag 
-                        FROM schedule1 WHERE lastInningOutfieldFlag == 0""" % (column1, column2, column3))
-            cur.execute( """CREATE TABLE schedule2 AS SELECT * FROM schedule1_1 WHERE %s = (SELECT min(%s) FROM schedule1_1)""" 
-                         % (column1, column1))
-        
-        # If the current position is infield, then there's no need to check if the players were in the outfield
-        # the previous inning or not.
-        else:
-            cur.execute( """CREATE TABLE schedule2 AS SELECT * FROM schedule1 WHERE %s = 
-                        (SELECT min(%s) FROM schedule1)""" % (column1, column1))
-    
-        # Evaluate most recent game played at a given position
-        cur.execute( """CREATE TABLE schedule3 AS SELECT * FROM schedule2 WHERE %s = (
-                    SELECT min(%s) FROM schedule2)""" % (column2, column2))
-    
-        # Evaluate most recent inning played at a given position
-        cur.execute( """CREATE TABLE schedule4 AS SELECT * FROM schedule3 WHERE %s = (
-                    SELECT min(%s) FROM schedule3)""" % (column3, column3))
-    
-        # Query the player IDs remaining from the previous evaluations
-        cur.execute( """SELECT playerId FROM schedule4""" )
-    
-        # Fetch first record from the final query
-        row = cur.fetchone()
-    
-        # If no rows were returned in the query, then choose the only player left from the playerIdList parameter
-        if row == None:
-            player = playerIdList[0]
-        else:
-            
-        # If any rows were returned in the query, use that player for the function return statement
-            for i in row:
-                player = int(i)
-    
-    # Handle any errors and print to console
-    except Error as e:
-        print(e)
-    finally:
-        
-        # Drop temp tables from the database
-        cur.execute( """DROP TABLE IF EXISTS schedule0_1""" )
-        cur.execute( """DROP TABLE IF EXISTS schedule1""" )
-        cur.execute( """DROP TABLE IF EXISTS schedule1_1""" )
-        cur.execute( """DROP TABLE IF EXISTS schedule2""" )
-        cur.execute( """DROP TABLE IF EXISTS schedule3""" )
-        cur.execute( """DROP TABLE IF EXISTS schedule4""" )
-    
-    # If player exists, then return that player to the function call
-    if player:
-        return(player)
-    
+    # Load the counter rows for the available players and run the process of elimination in memory; database
+    # errors and unknown column names (KeyError) are recorded in the profile by the decorator and raised to
+    # the caller, which must not schedule a position without a player
+    candidateRows = LoadCandidateCounters(conn, playerIdList)
+    return SelectNextPlayerForPosition(candidateRows, column1, column2, column3, playerIdList, positionId)
+
+@Profiled
 def UpdateScheduleWithNextPosition(conn, column1, game, column2, player, column3, position, column4, inning):
     """ This function inserts 1 record into the schedule table with the player, position, game, and inning details
     :param conn: database connection object
@@ -131,13 +151,14 @@ def UpdateScheduleWithNextPosition(conn, column1, game, column2, player, column3
     # Create the cursor object for table navigation
     cur = conn.cursor()
     
-    # Run the SQL statement to insert a new record into the Schedule table 
-    cur.execute( """INSERT INTO schedule (%s, %s, %s, %s) VALUES(?, ?, ?, ?)""" %(column1, column2, column3, column4), 
-                (game, player, position, inning))
+    # Run the SQL statement to insert a new record into the Schedule table; the column names are checked
+    # against the schedule columns the first time the statement is built
+    cur.execute(InsertSchedule((column1, column2, column3, column4)), (game, player, position, inning))
     
     # Commit changes to the database
     conn.commit()
     
+@Profiled
 def UpdateTempCountersTable(conn, game, player, position, positionId, inning):
         """ This function updates the tempCounters table in the database to track position updates as the program
         calculates and determines each position for the schedule
@@ -145,6 +166,7 @@ def UpdateTempCountersTable(conn, game, player, position, positionId, inning):
         :param game: the game id
         :param player: the player id
         :param position: an array for the column numbers which need to be updated
+        :param positionId: the position index (position ID - 1)
         :param inning: the inning number
         """
         
@@ -154,24 +176,51 @@ def UpdateTempCountersTable(conn, game, player, position, positionId, inning):
         # Call the GetCurrentCounters function and store returned value in the sqlValue variable
         sqlValue = GetCurrentCounters(conn, player, position)
         
-        # instantiate flag variable to 0; flag value will be used to indicate infield vs. outfield
-        positionFlag = 0
-        
-        # If the position is greater than or equal to 5 that means it's an outfield position, so set the flag to true
-        if positionId >= 5:
-            positionFlag = 1
-        
-        # If the position is less than 5 that means it's an infield position, so set the flag to false
-        else: positionFlag = 0 
+        # The flag indicates infield vs. outfield; positionId holds the position index, so the ID is one more
+        positionFlag = 1 if IsRestrictedPosition(DEFAULT_MODEL, positionId + 1) else 0
         
         # Execute the SQL statement to update the tempCounters table
-        cur.execute( """UPDATE tempCounters SET %s = ?, %s = ?, %s = ?, %s = ?, %s = ? WHERE playerId = ?""" 
-                         %(position[0], position[1], position[2], "lastInningOutfieldFlag", "lastPositionId"), 
-                         ((sqlValue[0] + 1), game, inning, positionFlag, (positionId + 1), player))
+        cur.execute(UpdateCounterColumns("tempCounters", (position[0], position[1], position[2], "lastInningOutfieldFlag", "lastPositionId")),
+                    ((sqlValue[0] + 1), game, inning, positionFlag, (positionId + 1), player))
         
         # Commit changes to the database
         conn.commit()
         
+@Profiled
+def FlushScheduleUpdates(conn, scheduleRows, matrix, playerIdList, loadedRows=None):
+    """ This function writes the queued schedule records and the counters of the scheduled players to the
+    database in a single transaction; if anything fails, none of the changes are kept
+    :param conn: database connection object
+    :param scheduleRows: a list of (gameId, playerId, positionId, inningNumber) tuples
+    :param matrix: the tempCounters matrix holding the updated counters
+    :param playerIdList: the players whose counters need to be written back
+    :param loadedRows: optional CounterRowsFor result taken when the counters were loaded; when given, nothing
+    is written if those players' counters have changed in the table since then
+    :return: True if the changes were written
+    """
+    
+    # The connection context manager commits once at the end or rolls everything back on an error
+    with conn:
+        
+        # Take the write lock first so the check and the writes see the same counters
+        if loadedRows is not None:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            if CounterRowsFor(LoadCounterMatrix(conn, "tempCounters"), playerIdList) != loadedRows:
+                return False
+        
+        # Create the cursor object for table navigation
+        cur = conn.cursor()
+        
+        # Insert all of the schedule records with one statement
+        cur.executemany(InsertSchedule(), scheduleRows)
+        
+        # Write the counters for the scheduled players back to the tempCounters table
+        SaveCounterMatrix(conn, matrix, "tempCounters", playerIdList)
+    
+    return True
+        
+@Profiled
 def GetCurrentCounters(conn, player, position):
         """ This function grabs the current values from tempCounters table based on player ID and column name
         :param conn: database connection object
@@ -183,123 +232,391 @@ def GetCurrentCounters(conn, player, position):
         # Create a cursor object to navigate the tables
         cur = conn.cursor()
         
-        # Instantiate a new empty list for holding the values returned from the query 
-        valueList = []
+        # Query the values from all of the given column names for the player with a single statement
+        cur.execute(SelectCounterColumns("tempCounters", position), (player,))
         
-        # Loop through the column names in the position list
-        for i in position:
-            
-            # Query to find the value from the given column name and player ID
-            cur.execute( """SELECT %s FROM tempCounters WHERE playerId = ?""" %(i), (player,))
-            
-            # Update the value list with the value retrieved from the query 
-            valueList.append(cur.fetchone())
-
-        # Instantiate a new empty list to hold the individual integer values 
-        returnList = []
+        # Fetch the first record from the query
+        row = cur.fetchone()
         
-        # Loop through the multi-dimensional list from the SQL statements, convert value to integer,
-        # and store it in the new list
-        for i in valueList:
-            for j in i:
-                returnList.append(int(j))
+        # Convert each value to an integer and store it in a new list
+        returnList = [int(i) for i in row]
                 
         # Return the list of integer values to the function call
         return returnList
         
     
-def UpdateEntireSchedule(conn, playerCount, gameNumber, inningCount):
-    """ This function is the main hub for building the schedule table; it holds the calls to the other
-    functions as well as the logic for navigating players, games, innings, etc.
-    :param conn: database connection object
+@Profiled
+def ScheduleGameInMatrix(matrix, playerIdList, playerCount, gameNumber, inningCount, mode=GREEDY_MODE, firstInning=1):
+    """ This function holds the logic for navigating the players, positions and innings of one game; it works
+    entirely against the in-memory counter matrix and returns the schedule records instead of writing them
+    :param matrix: the counter matrix returned by LoadCounterMatrix; it is updated in place
+    :param playerIdList: the list of players present for the game
     :param playerCount: the number of players available to be scheduled
     :param gameNumber: the game ID
     :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param firstInning: the inning to start from; earlier innings are left alone
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples
     """
     
-    # List of column names to be passed dynamically to various function calls
-    posArr = [
-                ["firstBaseCounter", "firstBaseLastGame", "firstBaseLastInning"],
-                ["secondBaseCounter", "secondBaseLastGame", "secondBaseLastInning"],
-                ["thirdBaseCounter", "thirdBaseLastGame", "thirdBaseLastInning"],
-                ["shortStopCounter", "shortStopLastGame", "shortStopLastInning"],
-                ["pitcherCounter", "pitcherLastGame", "pitcherLastInning"],
-                ["rightFieldCounter", "rightFieldLastGame", "rightFieldLastInning"],
-                ["leftFieldCounter", "leftFieldLastGame", "leftFieldLastInning"],
-                ["centerFieldCounter", "centerFieldLastGame", "centerFieldLastInning"]
-            ]
+    # Logic validation
+    assert mode in (GREEDY_MODE, MATCHING_MODE)
     
-    # Instantiate variables
-    inningNumber = 1    # variable to increment through the innings in the loops
-    playerIdList = [1, 2, 3, 4, 8]     # temporary list for players present, will be replaced by user input 
-    tempList = []   # a temporary list that gets used and reused throughout the loops
+    # The positions that can be filled with this many players, in the order the matrix's sport fills them
+    # (outfield first for baseball); the index is the position ID - 1
+    positionIndexes = StaffedPositions(MatrixModel(matrix), playerCount)
     
-    # Populate the temp list with all of the available players
-    for i in playerIdList:
-        tempList.append(i)
+    # Instantiate variables
+    inningNumber = firstInning    # variable to increment through the innings in the loops
+    scheduleRows = []   # schedule records built for the game
+    rowMasks = PlayerRowMasks(matrix)   # matrix rows of each player, as bitmasks
     
     # Loop through each inning
     while inningNumber <= inningCount:
         
-        # Loop through the positions list in reverse order (Starting with outfield positions first)
-        for i in reversed(range(len(posArr))):
+        # Populate the temp list with the list of available players; each player should be scheduled one
+        # time per inning.
+        tempList = list(playerIdList)
+        availableMask = PlayerRowMask(rowMasks, tempList)
+        
+        # In matching mode every position of the inning is filled at once
+        if mode == MATCHING_MODE:
             
-            # As long as there are players left to schedule, this block will execute
-            if i < playerCount:
+            # Solve the inning for the positions that can be filled, in the same order as greedy mode
+            for i, playerForPosition in FindInningAssignmentInMatrix(matrix, tempList, positionIndexes):
                 
-                # Loop through each position
-                for j in range(len(posArr[i])):
-                    
-                    # If the position ID is 0 (This is the 'column' within the list; the idea is that this block
-                    # will only execute on the 'Counter' columns and not the 'last game' or 'last inning' columns)
-                    # then run the block of code 
-                    if j == 0:
-                        
-                        # Call the find next player function passing the connection, 3 column names, list of available
-                        # players, and the position ID; store returned value in the playerForPosition variable
-                        playerForPosition = FindNextPlayerForPosition(conn, posArr[i][j], posArr[i][j+1], posArr[i][j+2], tempList, 
-                                            (posArr.index(posArr[i])+1))
-                        
-                        # Logic validation
-                        assert playerForPosition != None
-                        
-                        # Call the update schedule function passing the connection, column names and values for those columns
-                        UpdateScheduleWithNextPosition(conn, "gameId", gameNumber, "playerId", playerForPosition, "positionId", (i+1), "inningNumber", inningNumber)
-                        
-                        # Update tempCounters table so count = count + 1, last game = gameNumber, and last inning = inningNumber
-                        UpdateTempCountersTable(conn, gameNumber, playerForPosition, posArr[i], i, inningNumber)
-                        
-                        # Remove the player returned from the find next player function from the remp list of
-                        # available players; this prevents a player from inadvertently being scheduled two positions
-                        # within the same inning 
-                        tempList.remove(playerForPosition)
-                        
-                        # Prints results of each schedule record to the console for live feedback/code troubleshooting
-                        print("Inning: " + str(inningNumber) + ", Player: " + str(playerForPosition) + ", Position: " + str(posArr[i][j]))
+                # Queue the schedule record and update the counter matrix
+                scheduleRows.append((gameNumber, playerForPosition, (i+1), inningNumber))
+                UpdateCounterMatrix(matrix, gameNumber, playerForPosition, i, inningNumber)
+            
+            # Move on to the next inning
+            inningNumber += 1
+            continue
+        
+        # Loop through the positions that can be filled (Starting with outfield positions first)
+        for i in positionIndexes:
+            
+            # Call the find next player function passing the counter matrix, list of available players, and
+            # the position index; store returned value in the playerForPosition variable
+            playerForPosition = FindNextPlayerInMatrix(matrix, tempList, i, availableMask)
+            
+            # Logic validation
+            assert playerForPosition != None
+            
+            # Queue the schedule record
+            scheduleRows.append((gameNumber, playerForPosition, (i+1), inningNumber))
+            
+            # Update the counter matrix so count = count + 1, last game = gameNumber, and last inning = inningNumber
+            UpdateCounterMatrix(matrix, gameNumber, playerForPosition, i, inningNumber)
+            
+            # Remove the player returned from the find next player function from the temp list of
+            # available players; this prevents a player from inadvertently being scheduled two positions
+            # within the same inning 
+            tempList.remove(playerForPosition)
+            availableMask &= ~rowMasks.get(playerForPosition, 0)
         
         # Increment the inning by 1; i.e. inning 1 becomes inning 2 and the process repeats
         inningNumber += 1
+    
+    # Return the schedule records to the function call
+    return scheduleRows
+
+def CachedScheduleGame(conn, matrix, playerIdList, playerCount, gameNumber, inningCount, mode=GREEDY_MODE, persist=True):
+    """ This function returns the schedule for a game from the schedule cache when the same counters, roster,
+    game and innings were scheduled before, and builds and caches it otherwise; either way the matrix ends up
+    updated as ScheduleGameInMatrix would leave it
+    :param conn: database connection object holding the cache table
+    :param matrix: the counter matrix; it is updated in place
+    :param playerIdList: the list of players present for the game
+    :param playerCount: the number of players available to be scheduled
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param persist: set to False to keep a new schedule in memory only, without writing the cache table
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples
+    """
+    
+    key = ScheduleKey(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+    scheduleRows = LookupSchedule(conn, key)
+    
+    # On a hit the stored assignments only need to be applied to the counters
+    if scheduleRows is not None:
+        ReplaySchedule(matrix, scheduleRows)
+        return scheduleRows
+    
+    scheduleRows = ScheduleGameInMatrix(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+    if persist:
+        StoreSchedule(conn, key, gameNumber, inningCount, mode, scheduleRows)
+    else:
+        RememberInMemory(key, scheduleRows)
+    return scheduleRows
+
+def PreviewGameSchedule(conn, playerCount, gameNumber, inningCount, mode=GREEDY_MODE, playerIdList=None):
+    """ This function returns the schedule UpdateEntireSchedule would write for a game without writing it;
+    previewing the same game again costs one cache lookup until the counters change
+    :param conn: database connection object
+    :param playerCount: the number of players available to be scheduled
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param playerIdList: the list of players present for the game; defaults to the attendance table
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples
+    """
+    
+    if playerIdList is None:
+        playerIdList = AvailablePlayers(LoadAvailabilityIndex(conn), gameNumber)
+    
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    return CachedScheduleGame(conn, matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+
+def ScheduleGameSession(conn, playerIdList, playerCount, gameNumber, inningCount, mode=GREEDY_MODE, useCache=True):
+    """ This function builds and writes one game as a session: the tempCounters table is loaded into private
+    memory, the game is built there without holding any lock, and a short write transaction stores it as long
+    as no other session changed these players' counters in the meantime; otherwise the game is built again
+    from the new counters, so sessions for different games on the same database can run side by side
+    :param conn: database connection object
+    :param playerIdList: the list of players present for the game
+    :param playerCount: the number of players available to be scheduled
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param useCache: set to False to always build the schedule instead of using the schedule cache
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+    
+    for attempt in range(SESSION_ATTEMPTS):
+        matrix = LoadCounterMatrix(conn, "tempCounters")
+        loadedRows = CounterRowsFor(matrix, playerIdList)
         
-        # Repopulate the temp list with the list of available players; each player should be schedule one
-        # time per inning.
-        for i in playerIdList:
-            tempList.append(i)
+        # Build the schedule records for the game, or reuse them if the same game was previewed or built before;
+        # only a preview writes the cache table, so writing the game stays a single commit
+        if useCache:
+            scheduleRows = CachedScheduleGame(conn, matrix, playerIdList, playerCount, gameNumber, inningCount, mode,
+                                              persist=False)
+        else:
+            scheduleRows = ScheduleGameInMatrix(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+        
+        # Write the schedule records and counters for the game in a single transaction
+        if FlushScheduleUpdates(conn, scheduleRows, matrix, playerIdList, loadedRows):
+            return scheduleRows
+    
+    # Under heavy contention build the game while holding the write lock; building takes milliseconds, so the
+    # lock is still short, and this attempt cannot be overtaken
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        matrix = LoadCounterMatrix(conn, "tempCounters")
+        loadedRows = CounterRowsFor(matrix, playerIdList)
+        scheduleRows = ScheduleGameInMatrix(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+        FlushScheduleUpdates(conn, scheduleRows, matrix, playerIdList, loadedRows)
+    return scheduleRows
+
+def UpdateEntireSchedule(conn, playerCount, gameNumber, inningCount, mode=GREEDY_MODE, playerIdList=None, useCache=True):
+    """ This function is the main hub for building the schedule table for one game; it builds and writes the
+    game with ScheduleGameSession and prints the results
+    :param conn: database connection object
+    :param playerCount: the number of players available to be scheduled
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param playerIdList: the list of players present for the game
+    :param useCache: set to False to always build the schedule instead of using the schedule cache
+    """
+    
+    # Without a list of players present, the attendance table decides who is at the game
+    if playerIdList is None:
+        playerIdList = AvailablePlayers(LoadAvailabilityIndex(conn), gameNumber)
+    
+    # Build the game and write the schedule records and counters in a single short transaction
+    scheduleRows = ScheduleGameSession(conn, playerIdList, playerCount, gameNumber, inningCount, mode, useCache)
+    
+    # Prints results of each schedule record to the console for live feedback/code troubleshooting
+    for game, player, positionId, inning in scheduleRows:
+        print("Inning: " + str(inning) + ", Player: " + str(player) + ", Position: " + PositionColumns(positionId - 1)[0])
+    
+    # Print the profile summary for the game if profiling is on
+    DumpProfile()
+
+def UpdateSeasonSchedule(conn, games, mode=GREEDY_MODE):
+    """ This function builds the schedule for a list of games in one pass; the counters are loaded from the
+    working tempCounters table once, so games already written by sessions or reschedules count, carried in
+    memory from game to game, and the schedule records and final counters are written back to both counters
+    tables at the end, which commits those earlier games the same way CommitTempCounters does; the write lock
+    is held from the load to the write, so no session can change the counters in between
+    :param conn: database connection object
+    :param games: a list of (gameId, playerIdList, inningCount) tuples in the order they are played
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+    
+    # The connection context manager commits once at the end or rolls everything back on an error
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        
+        # Load the working counters into memory once for the whole season
+        matrix = LoadCounterMatrix(conn, "tempCounters")
+        
+        # Build every game in order; each game sees the counters left behind by the games before it
+        scheduleRows = []
+        for gameNumber, playerIdList, inningCount in games:
+            scheduleRows.extend(ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameNumber, inningCount, mode))
+        
+        # Create the cursor object for table navigation
+        cur = conn.cursor()
+        
+        # Insert all of the schedule records with one statement
+        cur.executemany(InsertSchedule(), scheduleRows)
+        
+        # Write the final counters to the working table and commit them to the primary table
+        SaveCounterMatrix(conn, matrix, "positionCounters")
+        SaveCounterMatrix(conn, matrix, "tempCounters")
+    
+    # Return the schedule records to the function call
+    return scheduleRows
+
+def RescheduleGame(conn, gameNumber, resumeInning, playerIdList, inningCount, mode=GREEDY_MODE):
+    """ This function rebuilds the rest of a game when a player leaves or arrives; the schedule records from
+    resumeInning on are removed, their counter effects are rolled back in tempCounters, and those innings are
+    built again for the new roster, all in one transaction
+    :param conn: database connection object
+    :param gameNumber: the game ID
+    :param resumeInning: the first inning that has not been played yet
+    :param playerIdList: the players present from resumeInning on
+    :param inningCount: the number of innings in the game
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+    
+    # The connection context manager commits once at the end or rolls everything back on an error; the
+    # write lock is taken up front so nobody changes the schedule between the reads and the writes
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        cur = conn.cursor()
+        
+        # Find and remove the records for the innings that have not been played
+        cur.execute( """SELECT playerId, positionId FROM schedule WHERE gameId = ? AND inningNumber >= ?""",
+                     (gameNumber, resumeInning))
+        removedRows = cur.fetchall()
+        cur.execute( """DELETE FROM schedule WHERE gameId = ? AND inningNumber >= ?""", (gameNumber, resumeInning))
+        
+        # Load the working counters
+        matrix = LoadCounterMatrix(conn, "tempCounters")
+        
+        # Roll back the counter of every removed record
+        removedCounts = {}
+        for player, positionId in removedRows:
+            removedCounts[(player, positionId)] = removedCounts.get((player, positionId), 0) + 1
+        
+        for (player, positionId), count in removedCounts.items():
+            cell = GetCounterMatrixCell(matrix, player, positionId - 1)
+            if cell is None:
+                continue
+            
+            counter = max(cell[0] - count, 0)
+            
+            # The last game and inning go back to the most recent record left in the schedule; if there is
+            # none, then they go back to the values in the primary positionCounters table as long as its
+            # counter shows it does not already include the removed innings
+            cur.execute( """SELECT gameId, inningNumber FROM schedule WHERE playerId = ? AND positionId = ?
+                            ORDER BY gameId DESC, inningNumber DESC LIMIT 1""", (player, positionId))
+            last = cur.fetchone()
+            if last is None:
+                columns = PositionColumns(positionId - 1)
+                cur.execute(SelectCounterColumns("positionCounters", columns), (player,))
+                primary = cur.fetchone()
+                last = primary[1:] if primary is not None and primary[0] <= counter else (0, 0)
+            SetCounterMatrixCell(matrix, player, positionId - 1, counter, last[0], last[1])
+        
+        # The last position and outfield flag go back to the most recent record left for each player
+        for player in set(player for player, positionId in removedRows):
+            cur.execute( """SELECT positionId FROM schedule WHERE playerId = ?
+                            ORDER BY gameId DESC, inningNumber DESC LIMIT 1""", (player,))
+            last = cur.fetchone()
+            if last is None:
+                cur.execute( """SELECT lastPositionId FROM positionCounters WHERE playerId = ?""", (player,))
+                last = cur.fetchone() or (None,)
+            SetCounterMatrixLastPosition(matrix, player, last[0], IsRestrictedPosition(MatrixModel(matrix), last[0]))
+        
+        # Build the remaining innings for the new roster and write them with the updated counters
+        scheduleRows = ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameNumber, inningCount, mode,
+                                            resumeInning)
+        cur.executemany(InsertSchedule(), scheduleRows)
+        affectedPlayers = set(playerIdList) | set(player for player, positionId in removedRows)
+        SaveCounterMatrix(conn, matrix, "tempCounters", affectedPlayers)
+    
+    # Return the schedule records to the function call
+    return scheduleRows
+
+def CompareAssignmentModes(conn, games):
+    """ This function builds the same list of games in each assignment mode against copies of the
+    positionCounters table and reports the run time and rule violations of each; nothing is written
+    :param conn: database connection object
+    :param games: a list of (gameId, playerIdList, inningCount) tuples in the order they are played
+    :return: dictionary of mode -> {seconds, repeatPositions, repeatOutfield}
+    """
+    
+    # Load the primary counters once; each mode works on its own copy
+    matrix = LoadCounterMatrix(conn, "positionCounters")
+    
+    results = {}
+    for mode in (GREEDY_MODE, MATCHING_MODE):
+        trialMatrix = CopyCounterMatrix(matrix)
+        
+        # Time the schedule build for the mode
+        start = time.perf_counter()
+        scheduleRows = []
+        for gameNumber, playerIdList, inningCount in games:
+            scheduleRows.extend(ScheduleGameInMatrix(trialMatrix, playerIdList, len(playerIdList), gameNumber, inningCount, mode))
+        seconds = time.perf_counter() - start
+        
+        # Store the timing with the rule violations of the schedule
+        results[mode] = ScheduleRuleViolations(scheduleRows)
+        results[mode]["seconds"] = seconds
+    
+    return results
+
+def CommitTempCounters(conn):
+    """ This function copies the working counters in tempCounters to the primary positionCounters table once
+    the schedule built from them has been accepted
+    :param conn: database connection object
+    """
+    
+    # Load the working counters and write them to the primary table in one transaction
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    with conn:
+        SaveCounterMatrix(conn, matrix, "positionCounters")
 
 def main():
     """ Main program code
     """
     
     # Path to database file
-    database = r"C:\sqlite\db\t_ball_db.db"
+    database = DatabasePath()
     
     # Call the create connection function passing the database path; return the connection object and 
     # store it in the conn variable for use throughout the program
     conn = CreateConnection(database)
     
+    # Profile a share of the runs when the COACH_COMPANION_PROFILE environment variable is set (e.g. 0.1)
+    StartProfiling(conn, float(os.environ.get(PROFILE_RATE_ENVIRONMENT_VARIABLE, "0")))
+    
+    # Look up the players expected at the game in the attendance table
+    playerIdList = AvailablePlayers(LoadAvailabilityIndex(conn), 6)
+    
     # Call the update entire schedule function that generates the schedule for the given game; pass
-    # the connection object, the game ID, the number of players available, and the number of innings
+    # the connection object, the number of players available, the game ID, and the number of innings
     # to schedule to the function
-    UpdateEntireSchedule(conn, 5, 6, 4)
+    UpdateEntireSchedule(conn, len(playerIdList), 6, 4, playerIdList=playerIdList)
+    StopProfiling()
+    
+    # To build several games in one pass, call the season schedule function instead, passing a list of
+    # (game ID, players present, number of innings) for each game
+    # UpdateSeasonSchedule(conn, [(6, [1, 2, 3, 4, 8], 4), (7, [1, 2, 3, 4, 5, 8], 4)])
+    
+    # To compare the greedy and matching assignment modes on the same games without writing anything
+    # print(CompareAssignmentModes(conn, [(6, [1, 2, 3, 4, 8], 4), (7, [1, 2, 3, 4, 5, 8], 4)]))
 
 if __name__ == '__main__':
     main()
@@ -308,7 +625,6 @@ if __name__ == '__main__':
     
     # AUTHOR NOTES FOR FURTHER DEVELOPMENT
     ##########
-    # still need to add function(s) to commit changes to the primary positionCounters table.
     # can I come up with a recursive model to look ahead and see if I'm trapping myself into 0 players being available
     # for the last position and then having a player in the same position 2 innings in a row?
     #
@@ -0,0 +1,145 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import argparse
+import csv
+import json
+import os
+import time
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteCounterMatrix import POSITION_NAMES, PositionColumns
+
+# Columns that can be given for each kind of record; anything else in the files is rejected
+PLAYER_COLUMNS = ["id", "firstName", "lastName"]
+GAME_COLUMNS = ["id", "date", "vs", "startTime", "homeFlag"]
+COUNTER_COLUMNS = [column for i in range(len(POSITION_NAMES)) for column in PositionColumns(i)] + \
+                  ["lastInningOutfieldFlag", "lastPositionId"]
+
+# Value the CSV reader gives the columns of a row that has fewer cells than the header
+MISSING_CELL = object()
+
+def ReadRecords(path):
+    """ This function reads the records from a CSV, JSON (a list of objects) or JSON Lines file; the format
+    is chosen by the file extension; an empty CSV cell is read as None, and a CSV row with more or fewer cells
+    than the header is rejected
+    :param path: path to the file
+    :return: list of dictionaries, one per record
+    """
+
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as recordFile:
+        if extension == ".csv":
+            records = []
+            for number, record in enumerate(csv.DictReader(recordFile, restval=MISSING_CELL), 1):
+                if None in record or MISSING_CELL in record.values():
+                    raise ValueError("CSV record %d of %s does not have one value per column" % (number, path))
+                records.append(dict((key, value if value != "" else None) for key, value in record.items()))
+            return records
+        if extension == ".json":
+            return json.load(recordFile)
+        if extension in (".jsonl", ".ndjson"):
+            return [json.loads(line) for line in recordFile if line.strip()]
+    raise ValueError("Unsupported file type: %s" % path)
+
+def CheckColumns(records, allowedColumns, kind, requiredColumns=()):
+    """ This function makes sure every record only uses known columns, since the column names end up in
+    the SQL statements, and has a value for every required column
+    :param records: list of dictionaries
+    :param allowedColumns: the columns allowed for the kind of record
+    :param kind: the kind of record, used in the error message
+    :param requiredColumns: the columns every record must have a value for
+    """
+
+    for number, record in enumerate(records, 1):
+        unknown = set(record) - set(allowedColumns)
+        if unknown:
+            raise ValueError("Unknown %s column(s): %s" % (kind, ", ".join(sorted(unknown))))
+        missing = [column for column in requiredColumns if record.get(column) is None]
+        if missing:
+            raise ValueError("%s record %d is missing: %s" % (kind.capitalize(), number, ", ".join(missing)))
+
+def ImportLeague(conn, rosterPath=None, gamesPath=None, countersPath=None):
+    """ This function loads a roster, a game calendar and starting counters into the database in a single
+    transaction; every player ends up with a positionCounters and a tempCounters row, with zeros unless the
+    counters file says otherwise
+    :param conn: database connection object
+    :param rosterPath: optional file of players (firstName, lastName, optional id)
+    :param gamesPath: optional file of games (date, vs, startTime, homeFlag, optional id)
+    :param countersPath: optional file of counters (playerId plus any counter columns)
+    :return: dictionary with the rows written per table (counterUpdates counts the counter rows updated in
+    both tables), the seconds taken and the rows per second
+    """
+
+    # Read and check every file before anything is written
+    players = ReadRecords(rosterPath) if rosterPath else []
+    games = ReadRecords(gamesPath) if gamesPath else []
+    counters = ReadRecords(countersPath) if countersPath else []
+    CheckColumns(players, PLAYER_COLUMNS, "player")
+    CheckColumns(games, GAME_COLUMNS, "game", ["date"])
+    CheckColumns(counters, ["playerId"] + COUNTER_COLUMNS, "counter", ["playerId"])
+
+    report = {"players": 0, "games": 0, "positionCounters": 0, "tempCounters": 0, "counterUpdates": 0}
+    start = time.perf_counter()
+
+    # The connection context manager commits once at the end or rolls everything back on an error
+    with conn:
+        cur = conn.cursor()
+
+        # Players and games; a missing id lets SQLite assign the next one
+        cur.executemany( """INSERT INTO players(id, firstName, lastName) VALUES(?, ?, ?)""",
+                         [tuple(player.get(column) for column in PLAYER_COLUMNS) for player in players])
+        report["players"] = len(players)
+        cur.executemany( """INSERT INTO games(id, date, vs, startTime, homeFlag) VALUES(?, ?, ?, ?, ?)""",
+                         [tuple(game.get(column) for column in GAME_COLUMNS) for game in games])
+        report["games"] = len(games)
+
+        # Every player without counters gets a row of zeros in both counter tables
+        for table in ("positionCounters", "tempCounters"):
+            cur.execute( """INSERT INTO %s(playerId) SELECT id FROM players
+                            WHERE id NOT IN (SELECT playerId FROM %s) ORDER BY id""" % (table, table))
+            report[table] = cur.rowcount
+
+        # Starting counters; records naming the same columns are written together, and a column without a
+        # value (an empty CSV cell) keeps the value already in the table
+        groups = {}
+        for counter in counters:
+            columns = tuple(column for column in COUNTER_COLUMNS if counter.get(column) is not None)
+            if columns:
+                groups.setdefault(columns, []).append(tuple(counter[column] for column in columns) + (counter["playerId"],))
+        for columns, parameters in groups.items():
+            for table in ("positionCounters", "tempCounters"):
+                cur.executemany( """UPDATE %s SET %s WHERE playerId = ?"""
+                                 % (table, ", ".join("%s = ?" % column for column in columns)), parameters)
+                report["counterUpdates"] += cur.rowcount
+
+    report["seconds"] = time.perf_counter() - start
+    rows = report["players"] + report["games"] + report["positionCounters"] + report["tempCounters"] + report["counterUpdates"]
+    report["rowsPerSecond"] = rows / report["seconds"] if report["seconds"] else float(rows)
+    return report
+
+def main():
+    """ Main program code; the files to import are passed on the command line
+    """
+
+    parser = argparse.ArgumentParser(description="Import a roster, game calendar and counters")
+    parser.add_argument("--database")
+    parser.add_argument("--roster")
+    parser.add_argument("--games")
+    parser.add_argument("--counters")
+    args = parser.parse_args()
+
+    # create a database connection
+    conn = CreateConnection(args.database or DatabasePath())
+
+    if conn is not None:
+        report = ImportLeague(conn, args.roster, args.games, args.counters)
+        print("Players: %d, Games: %d, Counter rows: %d, Counter updates: %d, Seconds: %.3f, Rows/sec: %.0f"
+              % (report["players"], report["games"], report["positionCounters"] + report["tempCounters"],
+                 report["counterUpdates"], report["seconds"], report["rowsPerSecond"]))
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import os
+import re
+import sqlite3
+import sys
+import threading
+from sqlite3 import Error
+
+# Path to the database used when no path is given on the command line or in the environment
+DEFAULT_DATABASE = r"C:\sqlite\db\t_ball_db.db"
+
+# Environment variable that overrides the default database path
+DATABASE_ENVIRONMENT_VARIABLE = "COACH_COMPANION_DB"
+
+# Pragmas applied to every new connection; any of them can be overridden when the connection is created
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",          # readers do not block the writer and commits append to the log
+    "synchronous": "NORMAL",        # safe with WAL and avoids an fsync on every commit
+    "cache_size": -20000,           # page cache size in KiB (negative value) instead of pages
+    "mmap_size": 268435456,         # memory map up to 256 MB of the database file
+    "temp_store": "MEMORY",         # keep temp tables and indexes out of the file system
+    "foreign_keys": "ON",           # enforce the REFERENCES clauses in the table definitions
+    "busy_timeout": 5000            # wait up to 5 seconds for another writer instead of failing straight away
+}
+
+# Number of prepared statements each connection keeps in its statement cache
+CACHED_STATEMENTS = 256
+
+# Pragma values are spliced into the statement, so only plain words and numbers are allowed
+PRAGMA_VALUE = re.compile(r"^-?\w+$")
+
+# Open connections reused across calls, keyed by (path, pragmas); sqlite3 connections can only be used by the
+# thread that created them, so every thread keeps its own dictionary, and a thread's connections are released
+# and closed along with it when the thread exits
+threadConnections = threading.local()
+
+def DatabasePath(argv=None):
+    """ This function works out the path to the database: the --database command line option wins, then the
+    COACH_COMPANION_DB environment variable, then the default path
+    :param argv: command line arguments; defaults to sys.argv
+    :return: path to the database file
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Look for --database PATH or --database=PATH on the command line
+    for i, argument in enumerate(argv):
+        if argument == "--database" and i + 1 < len(argv):
+            return argv[i + 1]
+        if argument.startswith("--database="):
+            return argument.split("=", 1)[1]
+
+    return os.environ.get(DATABASE_ENVIRONMENT_VARIABLE, DEFAULT_DATABASE)
+
+def ApplyPragmas(conn, pragmas):
+    """ This function applies a set of pragmas to a connection
+    :param conn: database connection object
+    :param pragmas: dictionary of pragma name -> value
+    """
+
+    cur = conn.cursor()
+    for name, value in pragmas.items():
+
+        # Validate the name and value before splicing them into the statement
+        if not PRAGMA_VALUE.match(name) or not PRAGMA_VALUE.match(str(value)):
+            raise ValueError("Invalid pragma: %s = %s" % (name, value))
+        cur.execute("PRAGMA %s = %s" % (name, value))
+
+def CachedConnections():
+    """ This function returns the cached connections of the current thread
+    :return: dictionary of (path, pragmas) -> connection object
+    """
+
+    connections = getattr(threadConnections, "connections", None)
+    if connections is None:
+        connections = threadConnections.connections = {}
+    return connections
+
+def CreateConnection(db_file=None, pragmas=None, reuse=True):
+    """ Create a connection to the database with the tuned pragmas applied; an open connection to the same
+    database from the same thread is reused instead of opening a new one
+    :param db_file: database file; defaults to DatabasePath()
+    :param pragmas: optional dictionary of pragmas that override DEFAULT_PRAGMAS
+    :param reuse: set to False to always open a new connection
+    :return: connection object or None
+    """
+
+    if db_file is None:
+        db_file = DatabasePath()
+
+    settings = dict(DEFAULT_PRAGMAS)
+    if pragmas:
+        settings.update(pragmas)
+
+    # In-memory databases are private to their connection, so they are never shared
+    reuse = reuse and db_file != ":memory:"
+    key = (db_file, tuple(sorted(settings.items())))
+
+    # Return the cached connection if it is still open
+    if reuse:
+        conn = CachedConnections().get(key)
+        if conn is not None:
+            try:
+                conn.total_changes
+                return conn
+            except sqlite3.ProgrammingError:
+                CachedConnections().pop(key, None)
+
+    conn = None
+    try:
+        conn = sqlite3.connect(db_file, cached_statements=CACHED_STATEMENTS)
+        ApplyPragmas(conn, settings)
+    except Error as e:
+        print(e)
+        if conn is not None:
+            conn.close()
+        return None
+
+    if reuse:
+        CachedConnections()[key] = conn
+
+    return conn
+
+def DatabaseVersion(conn):
+    """ This function returns a value that changes whenever the database may have changed: data_version
+    moves when another connection commits and total_changes moves when this one writes
+    :param conn: database connection object
+    :return: version tuple
+    """
+
+    return (conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+
+def CloseConnections():
+    """ This function closes every cached connection opened by this thread
+    """
+
+    connections = CachedConnections()
+    while connections:
+        connections.popitem()[1].close()
@@ -1,32 +1,23 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
-from sqlite3 import Error
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteStatements import CheckIdentifiers
 
-def CreateConnection(db_file):
-    """ Create a connection to the database 
-    :param db_file: database file
-    :return: connection object or None
-    """
-        
-    conn = None
-    
-    try:
-        conn = sqlite3.connect(db_file)
-    except Error as e:
-        print(e)
-        
-    return conn
-
-def CopyTable(conn, tableName):
+def CopyTable(conn, tableName, replace=False):
     """ This function makes a copy of the postionCounters table as a new table
     :param conn: database connection object
     :param tableName: name of the table to create
+    :param replace: when the table already exists, replace its rows with the rows of positionCounters; without
+    it an existing table is left as it is; only tempCounters can be replaced
     """
     
+    # The replace path deletes every row of the table, so it is only allowed on the known copy of the counters
+    if replace:
+        CheckIdentifiers([tableName], ["tempCounters"], "table")
+    
     # SQL statement to copy the table
     sql = ("""CREATE TABLE IF NOT EXISTS %s AS SELECT * FROM positionCounters""" %(tableName))
     
@@ -36,12 +27,20 @@ def CopyTable(conn, tableName):
     # Execute the query
     cur.execute(sql)    
     
+    # Refresh the rows of an existing table in one transaction; the table keeps its own definition
+    if replace:
+        cur.execute("""PRAGMA table_info(positionCounters)""")
+        columns = ", ".join(row[1] for row in cur.fetchall())
+        with conn:
+            cur.execute("""DELETE FROM %s""" % tableName)
+            cur.execute("""INSERT INTO %s (%s) SELECT %s FROM positionCounters ORDER BY rowid""" % (tableName, columns, columns))
+    
 def main():
     """ Main function for the module
     """
     
     # Path to the database
-    database = r"C:\sqlite\db\t_ball_db.db"
+    database = DatabasePath()
     
     # Call to the create connection function which passes the database path and creates a connection object
     conn = CreateConnection(database)
@@ -0,0 +1,364 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from array import array
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteProfiler import Profiled
+from SQLiteSportModel import DEFAULT_MODEL, IsRestrictedPosition
+
+# Column name prefixes used by the positionCounters and tempCounters tables, in position ID order
+# (the position ID is the index + 1); each prefix has a Counter, LastGame and LastInning column
+POSITION_NAMES = ["firstBase", "secondBase", "thirdBase", "shortStop", "pitcher",
+                  "rightField", "leftField", "centerField", "homeRun"]
+
+# Tables holding one row per player with the columns above
+COUNTER_TABLES = ("positionCounters", "tempCounters")
+
+# Offsets of the three values stored for every player/position cell of the matrix
+COUNTER = 0
+LAST_GAME = 1
+LAST_INNING = 2
+VALUES_PER_POSITION = 3
+
+# Value stored in the lastPositionIds array when the column is NULL in the table
+NULL_POSITION = -1
+
+# Offset that turns a signed 64 bit counter value into an unsigned one, so the three values of a cell and the
+# row number can be packed into one integer that sorts the same way as the tuple of them
+KEY_OFFSET = 1 << 63
+KEY_BITS = 64
+
+def PositionColumns(positionIndex):
+    """ This function returns the three column names for a position, in the same form as the posArr entries
+    used by SQLiteBuildSchedule
+    :param positionIndex: the position index (position ID - 1)
+    :return: list of [counter column, last game column, last inning column]
+    """
+
+    name = POSITION_NAMES[positionIndex]
+    return [name + "Counter", name + "LastGame", name + "LastInning"]
+
+# Every counter column of the counters tables, in matrix order
+COUNTER_COLUMNS = [column for i in range(len(POSITION_NAMES)) for column in PositionColumns(i)]
+
+# SQL to read and write a whole counters table; the column lists are built once here and the statements
+# once per table by CounterStatements, so the same statement text is always reused from the statement cache
+sql_select_counter_matrix = """SELECT id, playerId, %s, lastInningOutfieldFlag, lastPositionId FROM {table}
+                                ORDER BY rowid""" % ", ".join(COUNTER_COLUMNS)
+sql_update_counter_matrix = """UPDATE {table} SET %s, lastInningOutfieldFlag = ?, lastPositionId = ?
+                                WHERE playerId = ?""" % ", ".join("%s = ?" % column for column in COUNTER_COLUMNS)
+
+# Statements already built for each counters table
+counterStatements = {}
+
+def CounterStatements(tableName):
+    """ This function returns the select and update statements for a counters table
+    :param tableName: the counters table (tempCounters or positionCounters)
+    :return: (select statement, update statement) tuple
+    """
+
+    statements = counterStatements.get(tableName)
+    if statements is None:
+        if tableName not in COUNTER_TABLES:
+            raise ValueError("Unknown table: %r" % (tableName,))
+        statements = (sql_select_counter_matrix.format(table=tableName), sql_update_counter_matrix.format(table=tableName))
+        counterStatements[tableName] = statements
+    return statements
+
+def MatrixModel(matrix):
+    """ This function returns the sport model a counter matrix is scheduled with; matrices built without one
+    use the default model, which matches the counters table columns
+    :param matrix: the counter matrix
+    :return: the compiled model
+    """
+
+    return matrix.get("model", DEFAULT_MODEL)
+
+@Profiled
+def LoadCounterMatrix(conn, tableName="tempCounters", model=None):
+    """ This function loads a counters table into a players x positions x {counter, lastGame, lastInning} matrix
+    with a single query; rows are kept in table order because table order decides ties when choosing a player
+    :param conn: database connection object
+    :param tableName: the counters table to load (tempCounters or positionCounters)
+    :param model: optional sport model to schedule the matrix with; it must have the default model's positions
+    :return: dictionary holding the matrix arrays
+    """
+
+    # The counters tables only have columns for the default model's positions, in that order; any other sport
+    # would read the baseball columns as its own positions
+    model = model or DEFAULT_MODEL
+    if model["positionNames"] != DEFAULT_MODEL["positionNames"]:
+        raise ValueError("The %s table only holds %s positions; load %s counters with "
+                         "SQLiteNormalizedCounters.LoadNormalizedCounterMatrix" % (tableName, DEFAULT_MODEL["name"], model["name"]))
+    columns = COUNTER_COLUMNS
+
+    # Create the cursor object and read the whole table in one statement
+    cur = conn.cursor()
+    cur.execute(CounterStatements(tableName)[0])
+
+    # Instantiate the arrays; values holds the counter columns row by row in the same order as the columns list
+    rowIds = array('q')
+    playerIds = array('q')
+    values = array('q')
+    outfieldFlags = array('b')
+    lastPositionIds = array('q')
+
+    # Fill the arrays from the query results
+    for row in cur:
+        rowIds.append(row[0])
+        playerIds.append(row[1])
+        values.extend(row[2:2 + len(columns)])
+        outfieldFlags.append(1 if row[-2] else 0)
+        lastPositionIds.append(NULL_POSITION if row[-1] is None else row[-1])
+
+    # Return the matrix to the function call
+    return {
+        "rowIds": rowIds,
+        "playerIds": playerIds,
+        "values": values,
+        "outfieldFlags": outfieldFlags,
+        "lastPositionIds": lastPositionIds,
+        "positionCount": len(POSITION_NAMES),
+        "model": model
+    }
+
+def PlayerRows(matrix):
+    """ This function returns the index of the matrix rows of every player, building it the first time; the
+    rows of a matrix never move, so the index is kept on the matrix and shared by its copies
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :return: dictionary of player ID -> tuple of rows in table order
+    """
+
+    playerRows = matrix.get("playerRows")
+    if playerRows is None:
+        rows = {}
+        for row, playerId in enumerate(matrix["playerIds"]):
+            rows.setdefault(playerId, []).append(row)
+        playerRows = dict((playerId, tuple(playerRowList)) for playerId, playerRowList in rows.items())
+        matrix["playerRows"] = playerRows
+    return playerRows
+
+def PlayerRowMasks(matrix):
+    """ This function maps every player to a bitmask of their rows in the matrix (bit n is row n), so the
+    players available in an inning can be held as one integer and filtered with bitwise operations
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :return: dictionary of player ID -> bitmask
+    """
+
+    masks = {}
+    for playerId, rows in PlayerRows(matrix).items():
+        for row in rows:
+            masks[playerId] = masks.get(playerId, 0) | (1 << row)
+    return masks
+
+def PlayerRowMask(rowMasks, playerIdList):
+    """ This function combines the row masks of a list of players
+    :param rowMasks: the dictionary returned by PlayerRowMasks
+    :param playerIdList: a list of player IDs
+    :return: bitmask of the rows belonging to any of the players
+    """
+
+    mask = 0
+    for playerId in playerIdList:
+        mask |= rowMasks.get(playerId, 0)
+    return mask
+
+@Profiled
+def FindNextPlayerInMatrix(matrix, playerIdList, positionIndex, availableMask=None):
+    """ This function picks the player who should play a position next; it masks out the players who are not
+    available, played the position last, or (for positions in a restricted group such as the outfield) played
+    the restricted group the previous inning, and then takes the lexicographic minimum of (counter, last game,
+    last inning, table order); only the available rows are visited, and each one is compared as a single
+    integer packed from the values array instead of as a tuple
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param playerIdList: a list of players still available in the inning
+    :param positionIndex: the position index (position ID - 1)
+    :param availableMask: optional bitmask of the matrix rows of the players in playerIdList (see PlayerRowMask);
+    it is worked out from playerIdList when omitted
+    :return: player ID or None
+    """
+
+    # If there are no players left, then there is nobody to choose from
+    if not playerIdList:
+        return None
+
+    positionId = positionIndex + 1
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    base = positionIndex * VALUES_PER_POSITION
+    values = matrix["values"]
+    lastPositionIds = matrix["lastPositionIds"]
+    outfieldFlags = matrix["outfieldFlags"]
+    outfield = MatrixModel(matrix)["restricted"][positionIndex]
+
+    # Visit the rows of the available players in table order, from the set bits of the mask
+    if availableMask is None:
+        availableMask = PlayerRowMask(PlayerRowMasks(matrix), playerIdList)
+
+    # Keep the smallest packed (counter, last game, last inning, row) key of the eligible rows; the row number
+    # in the lowest bits keeps table order as the final tie breaker
+    bestKey = None
+    while availableMask:
+        lowestBit = availableMask & -availableMask
+        availableMask ^= lowestBit
+        row = lowestBit.bit_length() - 1
+        lastPositionId = lastPositionIds[row]
+        if lastPositionId == NULL_POSITION or lastPositionId == positionId or (outfield and outfieldFlags[row]):
+            continue
+        offset = row * stride + base
+        key = ((((values[offset + COUNTER] + KEY_OFFSET) << KEY_BITS | values[offset + LAST_GAME] + KEY_OFFSET)
+                << KEY_BITS | values[offset + LAST_INNING] + KEY_OFFSET) << KEY_BITS | row)
+        if bestKey is None or key < bestKey:
+            bestKey = key
+
+    # If no rows are eligible, then choose the first player left from the playerIdList parameter
+    if bestKey is None:
+        player = playerIdList[0]
+    else:
+        player = matrix["playerIds"][bestKey & ((1 << KEY_BITS) - 1)]
+
+    # If player exists, then return that player to the function call
+    if player:
+        return player
+
+@Profiled
+def UpdateCounterMatrix(matrix, game, player, positionIndex, inning):
+    """ This function updates the matrix in place the same way UpdateTempCountersTable updates the tempCounters
+    table: counter + 1, last game, last inning, outfield flag and last position ID
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param game: the game id
+    :param player: the player id
+    :param positionIndex: the position index (position ID - 1)
+    :param inning: the inning number
+    """
+
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    base = positionIndex * VALUES_PER_POSITION
+    values = matrix["values"]
+
+    # The outfield flag marks a position from a restricted group of the matrix's sport model
+    positionFlag = 1 if IsRestrictedPosition(MatrixModel(matrix), positionIndex + 1) else 0
+
+    # Update every row for the player
+    for row in PlayerRows(matrix).get(player, ()):
+        offset = row * stride + base
+        values[offset + COUNTER] += 1
+        values[offset + LAST_GAME] = game
+        values[offset + LAST_INNING] = inning
+        matrix["outfieldFlags"][row] = positionFlag
+        matrix["lastPositionIds"][row] = positionIndex + 1
+
+def GetCounterMatrixCell(matrix, player, positionIndex):
+    """ This function returns the counter, last game and last inning of a player at a position
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param player: the player id
+    :param positionIndex: the position index (position ID - 1)
+    :return: [counter, lastGame, lastInning] from the first row of the player, or None if there is no row
+    """
+
+    rows = PlayerRows(matrix).get(player)
+    if not rows:
+        return None
+    offset = rows[0] * matrix["positionCount"] * VALUES_PER_POSITION + positionIndex * VALUES_PER_POSITION
+    return list(matrix["values"][offset:offset + VALUES_PER_POSITION])
+
+def SetCounterMatrixCell(matrix, player, positionIndex, counter, lastGame, lastInning):
+    """ This function overwrites the counter, last game and last inning of a player at a position
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param player: the player id
+    :param positionIndex: the position index (position ID - 1)
+    :param counter: the new counter value
+    :param lastGame: the new last game value
+    :param lastInning: the new last inning value
+    """
+
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    for row in PlayerRows(matrix).get(player, ()):
+        offset = row * stride + positionIndex * VALUES_PER_POSITION
+        matrix["values"][offset:offset + VALUES_PER_POSITION] = array('q', (counter, lastGame, lastInning))
+
+def SetCounterMatrixLastPosition(matrix, player, lastPositionId, outfieldFlag):
+    """ This function overwrites the last position ID and last inning outfield flag of a player
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param player: the player id
+    :param lastPositionId: the new last position ID, or None
+    :param outfieldFlag: the new last inning outfield flag
+    """
+
+    for row in PlayerRows(matrix).get(player, ()):
+        matrix["lastPositionIds"][row] = NULL_POSITION if lastPositionId is None else lastPositionId
+        matrix["outfieldFlags"][row] = 1 if outfieldFlag else 0
+
+def CounterRowsFor(matrix, playerIdList):
+    """ This function returns the matrix rows of a list of players as plain tuples, so the counters a
+    schedule was built from can be compared with the table later on
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param playerIdList: a list of player IDs
+    :return: list of (rowId, playerId, values, outfieldFlag, lastPositionId) tuples in table order
+    """
+
+    playerRows = PlayerRows(matrix)
+    rows = sorted(row for playerId in set(playerIdList) for row in playerRows.get(playerId, ()))
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    return [(matrix["rowIds"][row], matrix["playerIds"][row], tuple(matrix["values"][row * stride:(row + 1) * stride]),
+             matrix["outfieldFlags"][row], matrix["lastPositionIds"][row])
+            for row in rows]
+
+def CopyCounterMatrix(matrix):
+    """ This function makes an independent copy of a counter matrix so alternatives can be tried without
+    touching the original
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :return: the copied matrix
+    """
+
+    # Copy every array; the position count is a plain integer, and the model and the row index are never changed
+    copy = {}
+    for key, value in matrix.items():
+        copy[key] = array(value.typecode, value) if isinstance(value, array) else value
+    return copy
+
+@Profiled
+def SaveCounterMatrix(conn, matrix, tableName="tempCounters", playerIdList=None):
+    """ This function writes the rows of the matrix back to a counters table with one executemany call; the
+    changes are not committed here so they can be part of a larger transaction
+    :param conn: database connection object
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param tableName: the counters table to update (tempCounters or positionCounters)
+    :param playerIdList: optional list of players to write; all rows are written when omitted
+    """
+
+    # Build one parameter tuple per row
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    parameters = []
+    for row, playerId in enumerate(matrix["playerIds"]):
+        if playerIdList is not None and playerId not in playerIdList:
+            continue
+        lastPositionId = matrix["lastPositionIds"][row]
+        parameters.append(tuple(matrix["values"][row * stride:(row + 1) * stride])
+                          + (matrix["outfieldFlags"][row],
+                             None if lastPositionId == NULL_POSITION else lastPositionId,
+                             playerId))
+
+    # Create the cursor object and run the update for every row
+    cur = conn.cursor()
+    cur.executemany(CounterStatements(tableName)[1], parameters)
+
+def main():
+    """ Main program code
+    """
+
+    # Path to database file
+    database = DatabasePath()
+
+    # Call the create connection function passing the database path
+    conn = CreateConnection(database)
+
+    # Load the tempCounters table and print the counters for each player to the console
+    matrix = LoadCounterMatrix(conn)
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    for row, playerId in enumerate(matrix["playerIds"]):
+        print("Player: " + str(playerId) + ", Counters: " + str(list(matrix["values"][row * stride:(row + 1) * stride:VALUES_PER_POSITION])))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from sqlite3 import Error
+from SQLiteConnection import CreateConnection, DatabasePath
+
+def CreateIndex(conn, create_index_sql):
+    """ create an index from the create_index_sql statement
+    :param conn: Connection object
+    :param create_index_sql: a CREATE INDEX statement
+    :return: True if the index exists afterwards, otherwise False
+    """
+    try:
+        c = conn.cursor()
+        c.execute(create_index_sql)
+        return True
+    except Error as e:
+        print(e)
+        return False
+
+def FindScheduleConflicts(conn, tableName="schedule"):
+    """ find the records that break the one player per position per inning rule; these have to be fixed
+    before the unique indexes can be created
+    :param conn: Connection object
+    :param tableName: schedule or innings
+    :return: list of (gameId, inningNumber, positionId or playerId, count, kind) tuples
+    """
+    c = conn.cursor()
+    c.execute("""SELECT gameId, inningNumber, positionId, count(*), 'position' FROM %s
+                 GROUP BY gameId, inningNumber, positionId HAVING count(*) > 1
+                 UNION ALL
+                 SELECT gameId, inningNumber, playerId, count(*), 'player' FROM %s
+                 GROUP BY gameId, inningNumber, playerId HAVING count(*) > 1""" % (tableName, tableName))
+    return c.fetchall()
+
+def CreateAllIndexes(conn):
+    """ create every index for the schedule, innings and counters tables and refresh the query planner
+    statistics with ANALYZE
+    :param conn: Connection object
+    :return: number of indexes that could not be created
+    """
+
+    # One player per position per inning; also serves the lineup lookups by game and inning
+    sql_create_schedule_position_index = """CREATE UNIQUE INDEX IF NOT EXISTS scheduleGameInningPosition
+                                            ON schedule (gameId, inningNumber, positionId);"""
+
+    # One position per player per inning; the playerId column also makes it covering for the scheduleView join
+    sql_create_schedule_player_index = """CREATE UNIQUE INDEX IF NOT EXISTS scheduleGameInningPlayer
+                                          ON schedule (gameId, inningNumber, playerId);"""
+
+    # Per player history lookups
+    sql_create_schedule_playerId_index = """CREATE INDEX IF NOT EXISTS schedulePlayer
+                                            ON schedule (playerId, gameId, inningNumber);"""
+
+    # The same rules for the innings table
+    sql_create_innings_position_index = """CREATE UNIQUE INDEX IF NOT EXISTS inningsGameInningPosition
+                                           ON innings (gameId, inningNumber, positionId);"""
+
+    sql_create_innings_player_index = """CREATE UNIQUE INDEX IF NOT EXISTS inningsGameInningPlayer
+                                         ON innings (gameId, inningNumber, playerId);"""
+
+    # Counter lookups by player (GetCurrentCounters, UpdateTempCountersTable and the counter matrix saves)
+    sql_create_positionCounters_index = """CREATE INDEX IF NOT EXISTS positionCountersPlayer
+                                           ON positionCounters (playerId);"""
+
+    sql_create_tempCounters_index = """CREATE INDEX IF NOT EXISTS tempCountersPlayer
+                                       ON tempCounters (playerId);"""
+
+    failed = 0
+    for sql in (sql_create_schedule_position_index, sql_create_schedule_player_index,
+                sql_create_schedule_playerId_index, sql_create_innings_position_index,
+                sql_create_innings_player_index, sql_create_positionCounters_index,
+                sql_create_tempCounters_index):
+        if not CreateIndex(conn, sql):
+            failed += 1
+
+    # Gather statistics so the query planner picks the new indexes
+    conn.execute("ANALYZE")
+    conn.commit()
+
+    return failed
+
+def main():
+    """ Main program code that adds the indexes to an existing database
+    """
+
+    # Path to the database
+    database = DatabasePath()
+
+    # create a database connection
+    conn = CreateConnection(database)
+
+    # If a connection exists, create the indexes
+    if conn is not None:
+        failed = CreateAllIndexes(conn)
+
+        # If a unique index failed, print the records that break it
+        if failed:
+            for table in ("schedule", "innings"):
+                for conflict in FindScheduleConflicts(conn, table):
+                    print(table + ": " + str(conflict))
+
+    # If no connection to database, print error message to the console
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
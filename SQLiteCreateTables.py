@@ -1,25 +1,11 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
 from sqlite3 import Error
-
-def CreateConnection(db_file):
-    """ create a database connection to the SQLite database
-        specified by db_file
-    :param db_file: database file
-    :return: Connection object or None
-    """
-    conn = None
-    try:
-        conn = sqlite3.connect(db_file)
-        return conn
-    except Error as e:
-        print(e)
-
-    return conn
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteScheduleCache import sql_create_scheduleCache_table
 
 def CreateTable(conn, create_table_sql):
     """ create a table from the create_table_sql statement
@@ -34,12 +20,10 @@ def CreateTable(conn, create_table_sql):
         print(e)
 
 
-def main():
-    """ Main program code holding the SQL scripts that generate the tables using the Create Table function
+def CreateAllTables(conn):
+    """ Holds the SQL scripts that generate the tables and runs them using the Create Table function
+    :param conn: Connection object
     """
-    
-    # Path to the database
-    database = r"C:\sqlite\db\t_ball_db.db"
 
     # SQL to create a table called Games
     sql_create_games_table = """CREATE TABLE IF NOT EXISTS games (
@@ -79,7 +63,7 @@ def main():
                                     id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL UNIQUE,
                                     gameId INTEGER NOT NULL REFERENCES games (id),
                                     playerId INTEGER NOT NULL REFERENCES players(id),
-                                    positionId INTEGER NOT NULL REFERENCES position (id),
+                                    positionId INTEGER NOT NULL REFERENCES positions (id),
                                     inningNumber INTEGER NOT NULL
                                 );"""
 
@@ -148,34 +132,60 @@ def main():
                                             centerFieldLastInning INTEGER NOT NULL DEFAULT 0,
                                             homeRunCounter INTEGER NOT NULL DEFAULT 0,
                                             homeRunLastGame INTEGER NOT NULL DEFAULT 0,
-                                            homeRunLastInning INTEGER NOT NULL DEFAULT 0
+                                            homeRunLastInning INTEGER NOT NULL DEFAULT 0,
+                                            lastInningOutfieldFlag BOOLEAN NOT NULL DEFAULT 0,
+                                            lastPositionId INTEGER REFERENCES positions (id)
                                         );"""
 
+    # SQL to create a table called Attendance; players without a row for a game are expected to be there
+    sql_create_attendance_table = """CREATE TABLE IF NOT EXISTS attendance (
+                                        gameId INTEGER NOT NULL REFERENCES games (id),
+                                        playerId INTEGER NOT NULL REFERENCES players (id),
+                                        presentFlag BOOLEAN NOT NULL DEFAULT 1,
+                                        PRIMARY KEY (gameId, playerId)
+                                    ) WITHOUT ROWID;"""
+
+    # create games table
+    CreateTable(conn, sql_create_games_table)
+
+    # create players table
+    CreateTable(conn, sql_create_players_table)
+    
+    # create positions table
+    CreateTable(conn, sql_create_positions_table)
+    
+    # create schedule table
+    CreateTable(conn, sql_create_schedule_table)
+    
+    # create innings table
+    CreateTable(conn, sql_create_innings_table)
+    
+    # create positionCounters table
+    CreateTable(conn, sql_create_positionCounters_table)
+    
+    # create temp counters table
+    CreateTable(conn, sql_create_tempCounters_table)
+    
+    # create attendance table
+    CreateTable(conn, sql_create_attendance_table)
+    
+    # create schedule cache table
+    CreateTable(conn, sql_create_scheduleCache_table)
+
+
+def main():
+    """ Main program code that generates the tables using the Create All Tables function
+    """
+    
+    # Path to the database
+    database = DatabasePath()
+
     # create a database connection
     conn = CreateConnection(database)
 
-    # If a connection exists, create the below tables
+    # If a connection exists, create the tables
     if conn is not None:
-        # create games table
-        CreateTable(conn, sql_create_games_table)
-
-        # create players table
-        CreateTable(conn, sql_create_players_table)
-        
-        # create positions table
-        CreateTable(conn, sql_create_positions_table)
-        
-        # create schedule table
-        CreateTable(conn, sql_create_schedule_table)
-        
-        # create innings table
-        CreateTable(conn, sql_create_innings_table)
-        
-        # create positionCounters table
-        CreateTable(conn, sql_create_positionCounters_table)
-        
-        # create temp counters table
-        CreateTable(conn, sql_create_tempCounters_table)
+        CreateAllTables(conn)
     
     # If no connection to database, print error message to the console
     else:
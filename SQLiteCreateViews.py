@@ -1,26 +1,10 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
 from sqlite3 import Error
-
-def CreateConnection(db_file):
-    """ create a database connection to the SQLite database
-        specified by db_file
-    :param db_file: database file
-    :return: Connection object or None
-    """
-    conn = None
-    try:
-        conn = sqlite3.connect(db_file)
-        return conn
-    except Error as e:
-        print(e)
-
-    return conn
-
+from SQLiteConnection import CreateConnection, DatabasePath
 
 def CreateView(conn, create_view_sql):
     """ create a view from the create_view_sql statement
@@ -36,7 +20,7 @@ def CreateView(conn, create_view_sql):
 
 
 def main():
-    database = r"C:\sqlite\db\t_ball_db.db"
+    database = DatabasePath()
 
     # SQL to create a view called schedule view which will be used as the output
     # for game-time line-ups.
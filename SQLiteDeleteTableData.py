@@ -1,26 +1,10 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
-from sqlite3 import Error
+from SQLiteConnection import CreateConnection, DatabasePath
 
-def CreateConnection(db_file):
-    """ create a database connection to the SQLite database specified by the db_file
-    :param db_file: database file
-    :return: Connection object or None
-    """
-    
-    conn = None
-    
-    try:
-        conn = sqlite3.connect(db_file)
-    except Error as e:
-        print(e)
-        
-    return conn
-    
 def DeleteSchedule(conn, id):
     """ This function deletes individual records from the Schedule table
     :param conn: database connection object
@@ -46,7 +30,7 @@ def main():
     """
     
     # Create variable with path to the database
-    database = r"C:\sqlite\db\t_ball_db.db"
+    database = DatabasePath()
     
     # create a database connection
     conn = CreateConnection(database)
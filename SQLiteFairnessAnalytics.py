@@ -0,0 +1,155 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import json
+from SQLiteConnection import CreateConnection, DatabasePath, DatabaseVersion
+from SQLiteSportModel import DEFAULT_MODEL, IsRestrictedPosition
+
+# One pass over the schedule table: innings per player and position, and how many of them repeat the
+# position the player had in inning N - 1 of the same game (the same rule as ScheduleRuleViolations); the
+# window gives every record the player's previous record in the game, and an inning the player sat out
+# breaks the run because the previous inning is then not N - 1
+sql_select_position_history = """SELECT playerId, positionId, count(*),
+                                        coalesce(sum(previousInning = inningNumber - 1 AND previousPositionId = positionId), 0)
+                                 FROM (SELECT playerId, positionId, inningNumber,
+                                              LAG(positionId) OVER innings AS previousPositionId,
+                                              LAG(inningNumber) OVER innings AS previousInning
+                                       FROM schedule
+                                       WINDOW innings AS (PARTITION BY gameId, playerId ORDER BY inningNumber))
+                                 GROUP BY playerId, positionId"""
+
+# Results of FairnessReport, kept until the database changes; keyed by connection
+reportCache = {}
+
+def Gini(values):
+    """ This function computes the Gini coefficient of a list of values; 0 means perfectly even and values
+    close to 1 mean one player has nearly everything
+    :param values: list of non-negative numbers
+    :return: the Gini coefficient
+    """
+
+    total = float(sum(values))
+    if not values or total == 0:
+        return 0.0
+    ordered = sorted(values)
+    count = len(ordered)
+    weighted = sum((i + 1) * value for i, value in enumerate(ordered))
+    return (2.0 * weighted) / (count * total) - (count + 1.0) / count
+
+def Variance(values):
+    """ This function computes the population variance of a list of values
+    :param values: list of numbers
+    :return: the variance
+    """
+
+    if not values:
+        return 0.0
+    mean = sum(values) / float(len(values))
+    return sum((value - mean) ** 2 for value in values) / float(len(values))
+
+def PositionHistory(scheduleRows):
+    """ This function computes the same per player and position totals as sql_select_position_history for
+    schedule records held in memory
+    :param scheduleRows: list of (gameId, playerId, positionId, inningNumber) tuples
+    :return: list of (playerId, positionId, innings, repeats) tuples
+    """
+
+    # Every record, so the record for the inning before can be looked up
+    positions = set(scheduleRows)
+
+    totals = {}
+    for gameId, playerId, positionId, inningNumber in scheduleRows:
+        entry = totals.setdefault((playerId, positionId), [0, 0])
+        entry[0] += 1
+        if (gameId, playerId, positionId, inningNumber - 1) in positions:
+            entry[1] += 1
+    return [(playerId, positionId, entry[0], entry[1]) for (playerId, positionId), entry in totals.items()]
+
+def SummarizePositionHistory(positionHistory, model=None):
+    """ This function turns per player and position totals into the fairness report
+    :param positionHistory: iterable of (playerId, positionId, innings, repeats) tuples
+    :param model: optional sport model whose restricted groups count as the outfield, the same rule the
+    scheduler uses; defaults to DEFAULT_MODEL
+    :return: dictionary with "players" and "team" sections
+    """
+
+    # Per player totals
+    model = model or DEFAULT_MODEL
+    players = {}
+    positionIds = set()
+    for playerId, positionId, innings, repeats in positionHistory:
+        player = players.setdefault(playerId, {"positions": {}, "innings": 0, "infield": 0, "outfield": 0, "repeats": 0})
+        player["positions"][positionId] = innings
+        player["innings"] += innings
+        player["repeats"] += repeats
+        if IsRestrictedPosition(model, positionId):
+            player["outfield"] += innings
+        else:
+            player["infield"] += innings
+        positionIds.add(positionId)
+
+    # Per player shares
+    for player in players.values():
+        player["outfieldShare"] = player["outfield"] / float(player["innings"]) if player["innings"] else 0.0
+        player["positionShares"] = dict((positionId, innings / float(player["innings"]))
+                                        for positionId, innings in player["positions"].items())
+
+    # Team level indices; shares are used so players who missed games are compared fairly
+    giniByPosition = {}
+    varianceByPosition = {}
+    for positionId in sorted(positionIds, key=lambda value: (value is None, value)):
+        shares = [player["positionShares"].get(positionId, 0.0) for player in players.values()]
+        giniByPosition[positionId] = Gini(shares)
+        varianceByPosition[positionId] = Variance(shares)
+
+    outfieldShares = [player["outfieldShare"] for player in players.values()]
+    team = {
+        "players": len(players),
+        "innings": sum(player["innings"] for player in players.values()),
+        "repeats": sum(player["repeats"] for player in players.values()),
+        "giniByPosition": giniByPosition,
+        "varianceByPosition": varianceByPosition,
+        "meanPositionGini": sum(giniByPosition.values()) / len(giniByPosition) if giniByPosition else 0.0,
+        "outfieldShareGini": Gini(outfieldShares),
+        "outfieldShareVariance": Variance(outfieldShares),
+        "inningsGini": Gini([player["innings"] for player in players.values()])
+    }
+
+    return {"players": players, "team": team}
+
+def FairnessReport(conn, useCache=True):
+    """ This function measures how fairly positions have been shared out across the whole schedule history:
+    per player position distributions, infield/outfield ratios and repeated positions, plus team level
+    Gini coefficients and variances; the result is cached until the database changes
+    :param conn: database connection object
+    :param useCache: set to False to always recompute
+    :return: dictionary with "players" and "team" sections
+    """
+
+    # Serve the cached report if nothing has changed since it was built
+    version = DatabaseVersion(conn)
+    cached = reportCache.get(id(conn))
+    if useCache and cached is not None and cached[0] is conn and cached[1] == version:
+        return cached[2]
+
+    # Read the per player and position totals in one pass over the schedule
+    report = SummarizePositionHistory(conn.execute(sql_select_position_history))
+    reportCache[id(conn)] = (conn, version, report)
+    return report
+
+def main():
+    """ Main program code; prints the fairness report as JSON
+    """
+
+    # create a database connection
+    conn = CreateConnection(DatabasePath())
+
+    if conn is not None:
+        print(json.dumps(FairnessReport(conn), indent=2, default=str))
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
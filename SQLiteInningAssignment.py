@@ -0,0 +1,177 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteCounterMatrix import VALUES_PER_POSITION, COUNTER, LAST_GAME, LAST_INNING, NULL_POSITION, MatrixModel
+from SQLiteSportModel import DEFAULT_MODEL, IsRestrictedPosition
+from SQLiteProfiler import Profiled
+
+def MinCostAssignment(costs):
+    """ This function solves the assignment problem for a cost table with the Hungarian algorithm; every row
+    is assigned a different column so that the total cost is as small as possible (O(rows^2 * columns))
+    :param costs: a list of rows of integer costs; there cannot be more rows than columns
+    :return: list holding the column index assigned to each row
+    """
+
+    rowCount = len(costs)
+    columnCount = len(costs[0]) if rowCount else 0
+    assert rowCount <= columnCount
+
+    # Potentials for the rows (u) and columns (v), the row matched to each column (p) and the path used to
+    # reach each column (way); index 0 is a dummy column used to start every augmenting path
+    infinity = float('inf')
+    u = [0] * (rowCount + 1)
+    v = [0] * (columnCount + 1)
+    p = [0] * (columnCount + 1)
+    way = [0] * (columnCount + 1)
+
+    # Add the rows one at a time, growing the matching along the cheapest augmenting path
+    for i in range(1, rowCount + 1):
+        p[0] = i
+        j0 = 0
+        minv = [infinity] * (columnCount + 1)
+        used = [False] * (columnCount + 1)
+
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = infinity
+            j1 = 0
+
+            # Find the cheapest column not yet on the path
+            row = costs[i0 - 1]
+            for j in range(1, columnCount + 1):
+                if not used[j]:
+                    current = row[j - 1] - u[i0] - v[j]
+                    if current < minv[j]:
+                        minv[j] = current
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+
+            # Update the potentials
+            for j in range(columnCount + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        # Flip the matching along the path that was found
+        while True:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+            if j0 == 0:
+                break
+
+    # Translate the column -> row matching into row -> column
+    result = [0] * rowCount
+    for j in range(1, columnCount + 1):
+        if p[j]:
+            result[p[j] - 1] = j - 1
+    return result
+
+def InningCostMatrix(matrix, playerIdList, positionIndexes):
+    """ This function builds the positions x players cost table for one inning; the cost keeps the same
+    priorities as the greedy selection (counter, then last game, then last inning) and adds a penalty larger
+    than any fair lineup for playing the same position twice in a row or the outfield two innings in a row;
+    players without a counters row are never eligible in greedy mode, so they carry the same penalty and are
+    only chosen when there is nobody else
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param playerIdList: a list of players available in the inning
+    :param positionIndexes: the position indexes (position ID - 1) to fill
+    :return: list of cost rows, one per position
+    """
+
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    values = matrix["values"]
+
+    # Find the first matrix row for each available player
+    playerRows = {}
+    for row, playerId in enumerate(matrix["playerIds"]):
+        if playerId in playerIdList and playerId not in playerRows:
+            playerRows[playerId] = row
+
+    # Pick a base larger than any stored value so the three values can be combined into one number
+    # without one spilling into another
+    base = max(values) + 2 if values else 2
+    penalty = base ** 3 * (len(positionIndexes) + 1)
+
+    restricted = MatrixModel(matrix)["restricted"]
+    costs = []
+    for positionIndex in positionIndexes:
+        positionId = positionIndex + 1
+        outfield = restricted[positionIndex]
+        costRow = []
+        for playerId in playerIdList:
+            row = playerRows.get(playerId)
+            if row is None:
+                costRow.append(penalty)
+                continue
+            offset = row * stride + positionIndex * VALUES_PER_POSITION
+            cost = ((values[offset + COUNTER] * base + values[offset + LAST_GAME]) * base
+                    + values[offset + LAST_INNING])
+
+            # Playing the same position as last inning or the outfield twice in a row is only chosen
+            # when no lineup can avoid it
+            lastPositionId = matrix["lastPositionIds"][row]
+            if lastPositionId != NULL_POSITION and lastPositionId == positionId:
+                cost += penalty
+            if outfield and matrix["outfieldFlags"][row]:
+                cost += penalty
+            costRow.append(cost)
+        costs.append(costRow)
+
+    return costs
+
+@Profiled
+def FindInningAssignmentInMatrix(matrix, playerIdList, positionIndexes):
+    """ This function chooses the players for all of the positions of an inning at once by solving a min-cost
+    bipartite matching between positions and players
+    :param matrix: the counter matrix returned by LoadCounterMatrix
+    :param playerIdList: a list of players available in the inning
+    :param positionIndexes: the position indexes (position ID - 1) to fill
+    :return: list of (positionIndex, playerId) tuples in the order of positionIndexes
+    """
+
+    # Every position needs its own player
+    assert len(positionIndexes) <= len(playerIdList)
+
+    # Solve the matching and translate the column numbers back into player IDs
+    costs = InningCostMatrix(matrix, playerIdList, positionIndexes)
+    columns = MinCostAssignment(costs)
+    return [(positionIndex, playerIdList[column]) for positionIndex, column in zip(positionIndexes, columns)]
+
+def ScheduleRuleViolations(scheduleRows, model=None):
+    """ This function counts how often a schedule puts a player at the same position two innings in a row
+    and in the outfield two innings in a row; it is used to compare assignment modes
+    :param scheduleRows: a list of (gameId, playerId, positionId, inningNumber) tuples
+    :param model: optional sport model whose restricted groups count as the outfield; defaults to DEFAULT_MODEL
+    :return: dictionary with the repeatPositions and repeatOutfield counts
+    """
+
+    # Index the position of every player by game and inning
+    positions = {}
+    for game, player, positionId, inning in scheduleRows:
+        positions[(game, player, inning)] = positionId
+
+    model = model or DEFAULT_MODEL
+    repeatPositions = 0
+    repeatOutfield = 0
+    for (game, player, inning), positionId in positions.items():
+        previous = positions.get((game, player, inning - 1))
+        if previous is None:
+            continue
+        if previous == positionId:
+            repeatPositions += 1
+        if IsRestrictedPosition(model, previous) and IsRestrictedPosition(model, positionId):
+            repeatOutfield += 1
+
+    return {"repeatPositions": repeatPositions, "repeatOutfield": repeatOutfield}
@@ -1,26 +1,10 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
-from sqlite3 import Error
 from random import randint
-
-def CreateConnection(db_file):
-    """ create a database connection to the SQLite database specificed by db_file
-    :param db_file: database file
-    :return: Connection object or None
-    """
-    
-    conn = None
-    
-    try: 
-        conn = sqlite3.connect(db_file)
-    except Error as e:
-        print(e)
-        
-    return conn
+from SQLiteConnection import CreateConnection, DatabasePath
 
 def CreateSchedule(conn, schedule):
     """ Insert a new schedule into the schedule table
@@ -147,7 +131,7 @@ def CreateTempCounter(conn, counter):
 #===============================================================================
 
 def main():
-    database = r"C:\sqlite\db\t_ball_db.db"
+    database = DatabasePath()
     
     # create a database connection
     conn = CreateConnection(database)
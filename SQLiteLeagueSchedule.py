@@ -0,0 +1,126 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from SQLiteBuildSchedule import GREEDY_MODE, UpdateSeasonSchedule
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteAttendance import LoadAvailabilityIndex, AvailablePlayers
+
+def UnscheduledGames(conn, inningCount):
+    """ This function builds the games list for the season scheduler from a team database: every game that
+    has no schedule records yet, in date order, with the players the attendance table expects at each one
+    :param conn: database connection object
+    :param inningCount: the number of innings to schedule for each game
+    :return: a list of (gameId, playerIdList, inningCount) tuples
+    """
+
+    # Create the cursor object for navigating the database
+    cur = conn.cursor()
+
+    # Every player with a counters row is on the roster; absences are read once for the whole run
+    index = LoadAvailabilityIndex(conn)
+
+    # Games that do not have any schedule records yet
+    cur.execute( """SELECT id FROM games WHERE id NOT IN (SELECT gameId FROM schedule WHERE gameId IS NOT NULL)
+                    ORDER BY date, id""" )
+    return [(row[0], AvailablePlayers(index, row[0]), inningCount) for row in cur.fetchall()]
+
+def ScheduleTeamDatabase(job):
+    """ This function is the worker for one team; it opens the team database, runs the season scheduler and
+    reports the timing and outcome; errors are caught and reported so one team cannot stop the league run
+    :param job: a (databasePath, games, inningCount, mode) tuple; games may be None to schedule every game
+    that has no schedule records yet
+    :return: dictionary with the database, seconds, games, rows and error for the team
+    """
+
+    databasePath, games, inningCount, mode = job
+    result = {"database": databasePath, "seconds": 0.0, "games": 0, "rows": 0, "error": None}
+    start = time.perf_counter()
+
+    # The worker closes the connection when it is done, so it is not taken from the shared cache
+    conn = CreateConnection(databasePath, reuse=False)
+    if conn is None:
+        result["error"] = "Error! cannot create the database connection."
+        return result
+
+    try:
+        # Work out the games for the team if they were not given
+        if games is None:
+            games = UnscheduledGames(conn, inningCount)
+
+        scheduleRows = UpdateSeasonSchedule(conn, games, mode)
+        result["games"] = len(games)
+        result["rows"] = len(scheduleRows)
+
+    # Record the error for the report instead of stopping the other teams
+    except Exception as e:
+        result["error"] = "%s: %s" % (type(e).__name__, e)
+    finally:
+        conn.close()
+        result["seconds"] = time.perf_counter() - start
+
+    return result
+
+def UpdateLeagueSchedule(teams, inningCount=4, mode=GREEDY_MODE, workers=None):
+    """ This function schedules every team of a league, one SQLite database per team, by handing each team
+    database to a worker in a process pool
+    :param teams: a list of database paths, or (databasePath, games) tuples to pass the games explicitly
+    :param inningCount: the number of innings for games that are looked up from the database
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param workers: the number of worker processes; defaults to the number of CPUs
+    :return: dictionary with the per-team results and league totals
+    """
+
+    # Build one job per team database
+    jobs = []
+    for team in teams:
+        if isinstance(team, str):
+            jobs.append((team, None, inningCount, mode))
+        else:
+            jobs.append((team[0], team[1], inningCount, mode))
+
+    # Fan the jobs out across the process pool; map keeps the results in the same order as the teams
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(ScheduleTeamDatabase, jobs))
+
+    # Consolidate the results into one report
+    return {
+        "teams": results,
+        "seconds": time.perf_counter() - start,
+        "games": sum(result["games"] for result in results),
+        "rows": sum(result["rows"] for result in results),
+        "failed": sum(1 for result in results if result["error"])
+    }
+
+def PrintLeagueReport(report):
+    """ This function prints the league report to the console
+    :param report: dictionary returned by UpdateLeagueSchedule
+    """
+
+    for result in report["teams"]:
+        status = result["error"] if result["error"] else "OK"
+        print("Team: " + result["database"] + ", Games: " + str(result["games"]) + ", Rows: " + str(result["rows"])
+              + ", Seconds: " + "%.3f" % result["seconds"] + ", Status: " + status)
+    print("Teams: " + str(len(report["teams"])) + ", Failed: " + str(report["failed"]) + ", Games: " + str(report["games"])
+          + ", Rows: " + str(report["rows"]) + ", Seconds: " + "%.3f" % report["seconds"])
+
+def main():
+    """ Main program code; the team database paths are passed on the command line
+    """
+
+    # Paths to the team databases
+    databases = sys.argv[1:]
+    if not databases:
+        databases = [DatabasePath([])]
+
+    # Schedule every team and print the report to the console
+    report = UpdateLeagueSchedule(databases)
+    PrintLeagueReport(report)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sys
+from sqlite3 import Error
+from SQLiteConnection import CreateConnection, DatabasePath
+
+# SQL to create the materialized lineup table; it holds the same rows as scheduleView and is clustered by
+# game, inning and position so a whole lineup card is one range read no matter how much history there is
+sql_create_lineupCards_table = """CREATE TABLE IF NOT EXISTS lineupCards (
+                                    scheduleId INTEGER NOT NULL,
+                                    gameId INTEGER NOT NULL,
+                                    inningNumber INTEGER NOT NULL,
+                                    positionId INTEGER NOT NULL,
+                                    playerId INTEGER NOT NULL,
+                                    date DATE,
+                                    position TEXT,
+                                    player TEXT,
+                                    PRIMARY KEY (gameId, inningNumber, positionId, scheduleId)
+                                ) WITHOUT ROWID;"""
+
+# Index used by the triggers to find the lineup row for a schedule record
+sql_create_lineupCards_index = """CREATE UNIQUE INDEX IF NOT EXISTS lineupCardsSchedule ON lineupCards (scheduleId);"""
+
+# Index used by the triggers to find the lineup rows for a player
+sql_create_lineupCards_player_index = """CREATE INDEX IF NOT EXISTS lineupCardsPlayer ON lineupCards (playerId);"""
+
+# The scheduleView join, filtered by a condition on the schedule table
+sql_fill_lineupCards = """INSERT OR REPLACE INTO lineupCards (scheduleId, gameId, inningNumber, positionId, playerId, date, position, player)
+                            SELECT schedule.id, schedule.gameId, schedule.inningNumber, schedule.positionId, schedule.playerId,
+                                   games.date, positions.name, players.firstName
+                            FROM schedule
+                            INNER JOIN games ON games.id = schedule.gameId
+                            INNER JOIN positions ON positions.id = schedule.positionId
+                            INNER JOIN players ON players.id = schedule.playerId
+                            WHERE %s;"""
+
+# Triggers that keep the lineup table current: (name, event, rows to remove, schedule rows to add back)
+LINEUP_TRIGGERS = [
+    ("lineupCardsScheduleInsert", "AFTER INSERT ON schedule", None, "schedule.id = NEW.id"),
+    ("lineupCardsScheduleUpdate", "AFTER UPDATE ON schedule", "scheduleId = OLD.id", "schedule.id = NEW.id"),
+    ("lineupCardsScheduleDelete", "AFTER DELETE ON schedule", "scheduleId = OLD.id", None),
+    ("lineupCardsPlayersInsert", "AFTER INSERT ON players", None, "schedule.playerId = NEW.id"),
+    ("lineupCardsPlayersUpdate", "AFTER UPDATE ON players", "playerId IN (OLD.id, NEW.id)", "schedule.playerId IN (OLD.id, NEW.id)"),
+    ("lineupCardsPlayersDelete", "AFTER DELETE ON players", "playerId = OLD.id", None),
+    ("lineupCardsGamesInsert", "AFTER INSERT ON games", None, "schedule.gameId = NEW.id"),
+    ("lineupCardsGamesUpdate", "AFTER UPDATE ON games", "gameId IN (OLD.id, NEW.id)", "schedule.gameId IN (OLD.id, NEW.id)"),
+    ("lineupCardsGamesDelete", "AFTER DELETE ON games", "gameId = OLD.id", None),
+    ("lineupCardsPositionsInsert", "AFTER INSERT ON positions", None, "schedule.positionId = NEW.id"),
+    ("lineupCardsPositionsUpdate", "AFTER UPDATE ON positions", "positionId IN (OLD.id, NEW.id)", "schedule.positionId IN (OLD.id, NEW.id)"),
+    ("lineupCardsPositionsDelete", "AFTER DELETE ON positions", "positionId = OLD.id", None)
+]
+
+# Query that serves a whole lineup card from the lineup table
+sql_select_lineup_card = """SELECT scheduleId AS 'ID', date AS 'Date', inningNumber AS 'Inning', position AS 'Position', player AS 'Player'
+                            FROM lineupCards WHERE gameId = ? ORDER BY inningNumber, positionId"""
+
+def TriggerSql(name, event, removeCondition, addCondition):
+    """ This function builds the CREATE TRIGGER statement for one of the LINEUP_TRIGGERS entries
+    :param name: trigger name
+    :param event: the trigger event, e.g. AFTER INSERT ON schedule
+    :param removeCondition: condition on lineupCards for the rows to remove, or None
+    :param addCondition: condition on schedule for the rows to add back, or None
+    :return: CREATE TRIGGER statement
+    """
+
+    body = ""
+    if removeCondition:
+        body += "DELETE FROM lineupCards WHERE %s;\n" % removeCondition
+    if addCondition:
+        body += sql_fill_lineupCards % addCondition + "\n"
+    return "CREATE TRIGGER IF NOT EXISTS %s %s\nBEGIN\n%sEND;" % (name, event, body)
+
+def CreateLineupCards(conn):
+    """ This function creates the lineup table, its indexes and triggers, and fills it from the schedule
+    table in a single transaction
+    :param conn: Connection object
+    :return: True if everything was created
+    """
+    try:
+        with conn:
+            c = conn.cursor()
+            c.execute(sql_create_lineupCards_table)
+            c.execute(sql_create_lineupCards_index)
+            c.execute(sql_create_lineupCards_player_index)
+            for name, event, removeCondition, addCondition in LINEUP_TRIGGERS:
+                c.execute(TriggerSql(name, event, removeCondition, addCondition))
+            RefreshLineupCards(conn)
+        return True
+    except Error as e:
+        print(e)
+        return False
+
+def RefreshLineupCards(conn):
+    """ This function rebuilds the whole lineup table from the schedule table; the triggers keep it current
+    afterwards, so this is only needed when the table is first created or after the triggers were dropped
+    :param conn: Connection object
+    """
+    c = conn.cursor()
+    c.execute("DELETE FROM lineupCards")
+    c.execute(sql_fill_lineupCards % "1 = 1")
+
+def GetLineupCard(conn, gameId):
+    """ This function returns the lineup card for a game with one indexed read of the lineup table
+    :param conn: Connection object
+    :param gameId: the game ID
+    :return: list of (ID, Date, Inning, Position, Player) rows, the same columns as scheduleView
+    """
+    c = conn.cursor()
+    c.execute(sql_select_lineup_card, (gameId,))
+    return c.fetchall()
+
+def main():
+    """ Main program code; creates the lineup table and prints the lineup card for the game ID passed on
+    the command line
+    """
+
+    # create a database connection
+    conn = CreateConnection(DatabasePath())
+
+    if conn is not None:
+        CreateLineupCards(conn)
+
+        # Print the lineup card for the requested game
+        arguments = [argument for argument in sys.argv[1:] if argument.isdigit()]
+        if arguments:
+            for row in GetLineupCard(conn, int(arguments[0])):
+                print(row)
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
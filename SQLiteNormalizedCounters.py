@@ -0,0 +1,232 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from array import array
+from SQLiteCounterMatrix import VALUES_PER_POSITION, NULL_POSITION, COUNTER_TABLES, LoadCounterMatrix
+from SQLiteBuildSchedule import GREEDY_MODE, ScheduleGameInMatrix
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteSportModel import DEFAULT_MODEL
+
+# SQL to create a table holding one row per counter set, player and position; this replaces the three columns
+# per position of the wide counters tables, so adding a position or a sport does not need a schema change. The
+# counter set names the wide table the rows stand in for (positionCounters or tempCounters), so both can be
+# kept side by side. Positions are not foreign keys because a sport's positions need not be in the positions table
+sql_create_playerPositionCounters_table = """CREATE TABLE IF NOT EXISTS playerPositionCounters (
+                                                counterSet TEXT NOT NULL,
+                                                playerId INTEGER NOT NULL REFERENCES players (id),
+                                                positionId INTEGER NOT NULL,
+                                                counter INTEGER NOT NULL DEFAULT 0,
+                                                lastGame INTEGER NOT NULL DEFAULT 0,
+                                                lastInning INTEGER NOT NULL DEFAULT 0,
+                                                PRIMARY KEY (counterSet, playerId, positionId)
+                                            ) WITHOUT ROWID;"""
+
+# SQL to create a table holding the per player values that are not tied to a position; the id keeps the
+# order of the rows in the wide table, which decides ties when choosing a player
+sql_create_playerCounterState_table = """CREATE TABLE IF NOT EXISTS playerCounterState (
+                                            counterSet TEXT NOT NULL,
+                                            id INTEGER NOT NULL,
+                                            playerId INTEGER NOT NULL REFERENCES players (id),
+                                            lastInningOutfieldFlag BOOLEAN NOT NULL DEFAULT 0,
+                                            lastPositionId INTEGER,
+                                            PRIMARY KEY (counterSet, playerId),
+                                            UNIQUE (counterSet, id)
+                                        ) WITHOUT ROWID;"""
+
+# Parameterized statements; the SQL text never changes so SQLite can keep them prepared in the statement cache
+sql_select_counters = """SELECT playerId, positionId, counter, lastGame, lastInning FROM playerPositionCounters
+                         WHERE counterSet = ?"""
+
+sql_select_state = """SELECT id, playerId, lastInningOutfieldFlag, lastPositionId FROM playerCounterState
+                      WHERE counterSet = ? ORDER BY id"""
+
+sql_upsert_counter = """INSERT INTO playerPositionCounters (counterSet, playerId, positionId, counter, lastGame, lastInning)
+                        VALUES(?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (counterSet, playerId, positionId) DO UPDATE SET
+                            counter = excluded.counter, lastGame = excluded.lastGame, lastInning = excluded.lastInning"""
+
+sql_upsert_state = """INSERT INTO playerCounterState (counterSet, id, playerId, lastInningOutfieldFlag, lastPositionId)
+                      VALUES(?, ?, ?, ?, ?)
+                      ON CONFLICT (counterSet, playerId) DO UPDATE SET
+                          lastInningOutfieldFlag = excluded.lastInningOutfieldFlag, lastPositionId = excluded.lastPositionId"""
+
+sql_upsert_position = """INSERT INTO positions (id, name, infieldFlag) VALUES(?, ?, ?)
+                         ON CONFLICT (id) DO UPDATE SET name = excluded.name, infieldFlag = excluded.infieldFlag
+                         WHERE positions.name IS NOT excluded.name OR positions.infieldFlag IS NOT excluded.infieldFlag"""
+
+sql_insert_schedule = """INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(?, ?, ?, ?)"""
+
+def CheckCounterSet(counterSet):
+    """ This function makes sure a counter set is one of the wide counters tables
+    :param counterSet: positionCounters or tempCounters
+    """
+
+    if counterSet not in COUNTER_TABLES:
+        raise ValueError("Unknown counter set: %r" % (counterSet,))
+
+def CreateNormalizedCounterTables(conn):
+    """ This function creates the normalized counter tables if they do not exist yet
+    :param conn: database connection object
+    """
+
+    cur = conn.cursor()
+    cur.execute(sql_create_playerPositionCounters_table)
+    cur.execute(sql_create_playerCounterState_table)
+
+def MigrateWideCounters(conn, tableName="positionCounters"):
+    """ This function copies a wide counters table into its own counter set of the normalized tables in a single
+    transaction; rows that already exist are overwritten, so the migration can be run again to refresh them
+    :param conn: database connection object
+    :param tableName: the wide counters table to copy (positionCounters or tempCounters)
+    """
+
+    # Load the wide table in one query and write it with the normalized statements
+    matrix = LoadCounterMatrix(conn, tableName)
+    with conn:
+        CreateNormalizedCounterTables(conn)
+        SaveNormalizedCounterMatrix(conn, matrix, tableName)
+
+def SeedPositions(conn, model):
+    """ This function writes the positions of a sport model to the positions table, so the schedule records
+    of the sport satisfy the schedule table's foreign key and lineups show the sport's position names; a row
+    seeded for another sport under the same ID is renamed, and rows that already match are not touched
+    :param conn: database connection object
+    :param model: the compiled model
+    """
+
+    cur = conn.cursor()
+    cur.executemany(sql_upsert_position, [(i + 1, name, 0 if model["restricted"][i] else 1)
+                                          for i, name in enumerate(model["positionNames"])])
+
+def LoadNormalizedCounterMatrix(conn, model=None, counterSet="positionCounters"):
+    """ This function loads a counter set of the normalized tables into the same counter matrix used by
+    SQLiteCounterMatrix, so every scheduling function can run against them unchanged
+    :param conn: database connection object
+    :param model: optional sport model; its positions size the matrix and it is carried with the matrix
+    :param counterSet: the counter set to load (positionCounters or tempCounters)
+    :return: dictionary holding the matrix arrays
+    """
+
+    CheckCounterSet(counterSet)
+    cur = conn.cursor()
+    model = model or DEFAULT_MODEL
+    positionCount = model["positionCount"]
+    stride = positionCount * VALUES_PER_POSITION
+
+    # Instantiate the arrays in table order from the player state table
+    rowIds = array('q')
+    playerIds = array('q')
+    outfieldFlags = array('b')
+    lastPositionIds = array('q')
+    cur.execute(sql_select_state, (counterSet,))
+    for rowId, playerId, outfieldFlag, lastPositionId in cur:
+        rowIds.append(rowId)
+        playerIds.append(playerId)
+        outfieldFlags.append(1 if outfieldFlag else 0)
+        lastPositionIds.append(NULL_POSITION if lastPositionId is None else lastPositionId)
+
+    # Fill in the counters for every player and position; missing rows stay at 0
+    values = array('q', bytes(8 * stride * len(playerIds)))
+    rowForPlayer = {}
+    for row, playerId in enumerate(playerIds):
+        rowForPlayer.setdefault(playerId, row)
+    cur.execute(sql_select_counters, (counterSet,))
+    for playerId, positionId, counter, lastGame, lastInning in cur:
+        row = rowForPlayer.get(playerId)
+        if row is None or not 1 <= positionId <= positionCount:
+            continue
+        offset = row * stride + (positionId - 1) * VALUES_PER_POSITION
+        values[offset:offset + VALUES_PER_POSITION] = array('q', (counter, lastGame, lastInning))
+
+    return {
+        "rowIds": rowIds,
+        "playerIds": playerIds,
+        "values": values,
+        "outfieldFlags": outfieldFlags,
+        "lastPositionIds": lastPositionIds,
+        "positionCount": positionCount,
+        "model": model
+    }
+
+def SaveNormalizedCounterMatrix(conn, matrix, counterSet="positionCounters", playerIdList=None):
+    """ This function writes a counter matrix to a counter set of the normalized tables with executemany; the
+    changes are not committed here so they can be part of a larger transaction
+    :param conn: database connection object
+    :param matrix: the counter matrix
+    :param counterSet: the counter set to write (positionCounters or tempCounters)
+    :param playerIdList: optional list of players to write; all rows are written when omitted
+    """
+
+    CheckCounterSet(counterSet)
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    counterRows = []
+    stateRows = []
+    for row, playerId in enumerate(matrix["playerIds"]):
+        if playerIdList is not None and playerId not in playerIdList:
+            continue
+        lastPositionId = matrix["lastPositionIds"][row]
+        stateRows.append((counterSet, matrix["rowIds"][row], playerId, matrix["outfieldFlags"][row],
+                          None if lastPositionId == NULL_POSITION else lastPositionId))
+        for positionIndex in range(matrix["positionCount"]):
+            offset = row * stride + positionIndex * VALUES_PER_POSITION
+            counterRows.append((counterSet, playerId, positionIndex + 1)
+                               + tuple(matrix["values"][offset:offset + VALUES_PER_POSITION]))
+
+    cur = conn.cursor()
+    cur.executemany(sql_upsert_state, stateRows)
+    cur.executemany(sql_upsert_counter, counterRows)
+
+def UpdateNormalizedSeasonSchedule(conn, games, mode=GREEDY_MODE, model=None):
+    """ This function is the season scheduler for databases that keep their counters in the normalized tables;
+    the positionCounters set is loaded once, carried in memory through the games, and written back to both
+    counter sets in one transaction, the same way UpdateSeasonSchedule treats the wide tables; this is the
+    scheduler for sports other than baseball, whose positions have no columns in the wide tables
+    :param conn: database connection object
+    :param games: a list of (gameId, playerIdList, inningCount) tuples in the order they are played
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param model: optional sport model (see SQLiteSportModel); defaults to DEFAULT_MODEL
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+
+    model = model or DEFAULT_MODEL
+
+    # The connection context manager commits once at the end or rolls everything back on an error; the write
+    # lock is taken up front so no other writer changes the counters between the read and the write
+    with conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+
+        # Load the counters and build every game in order
+        matrix = LoadNormalizedCounterMatrix(conn, model, "positionCounters")
+        scheduleRows = []
+        for gameNumber, playerIdList, inningCount in games:
+            scheduleRows.extend(ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameNumber, inningCount, mode))
+
+        # Write the schedule records and both counter sets
+        cur = conn.cursor()
+        SeedPositions(conn, model)
+        cur.executemany(sql_insert_schedule, scheduleRows)
+        SaveNormalizedCounterMatrix(conn, matrix, "positionCounters")
+        SaveNormalizedCounterMatrix(conn, matrix, "tempCounters")
+
+    return scheduleRows
+
+def main():
+    """ Main program code
+    """
+
+    # Path to database file
+    database = DatabasePath()
+
+    # Create a database connection and copy both counters tables into the normalized tables
+    conn = CreateConnection(database)
+    if conn is not None:
+        for tableName in COUNTER_TABLES:
+            MigrateWideCounters(conn, tableName)
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
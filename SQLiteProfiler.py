@@ -0,0 +1,223 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import functools
+import json
+import random
+import sys
+import threading
+import time
+
+# Environment variable holding the share of runs to profile (0.0 - 1.0) for the command line entry points
+PROFILE_RATE_ENVIRONMENT_VARIABLE = "COACH_COMPANION_PROFILE"
+
+# The scheduling steps a profile reports on and the functions doing each step's work. UpdateEntireSchedule no
+# longer calls the per-row functions; the counter matrix functions do the same work in batches, so each step
+# is measured through whichever of its functions ran
+PROFILE_STAGES = {
+    "FindNextPlayerForPosition": ("FindNextPlayerForPosition", "LoadCandidateCounters", "FindNextPlayerInMatrix",
+                                  "FindInningAssignmentInMatrix"),
+    "UpdateScheduleWithNextPosition": ("UpdateScheduleWithNextPosition", "FlushScheduleUpdates"),
+    "UpdateTempCountersTable": ("UpdateTempCountersTable", "UpdateCounterMatrix", "SaveCounterMatrix"),
+    "GetCurrentCounters": ("GetCurrentCounters", "LoadCounterMatrix")
+}
+
+class ProfileState(threading.local):
+    """ The profile being collected by the current thread, or None when profiling is off; when it is None the
+    only cost of a profiled function is one extra call and one comparison. Every thread collects its own
+    profile, the same way every thread has its own connections
+    """
+
+    profile = None
+
+state = ProfileState()
+
+def NewEntry():
+    """ This function returns an empty set of measurements for one function
+    :return: dictionary of measurements
+    """
+
+    return {"calls": 0, "seconds": 0.0, "selfSeconds": 0.0, "statements": 0, "rowsChanged": 0, "vmSteps": 0, "errors": []}
+
+def StageSummary(functions):
+    """ This function adds up the measurements of the functions behind each step in PROFILE_STAGES; the
+    seconds are selfSeconds, so a step nested inside another is not counted twice
+    :param functions: the measurements for each function
+    :return: dictionary of step name -> measurements
+    """
+
+    stages = {}
+    for stage, names in PROFILE_STAGES.items():
+        total = NewEntry()
+        del total["selfSeconds"]
+        total["functions"] = []
+        for name in names:
+            entry = functions.get(name)
+            if entry is None:
+                continue
+            total["functions"].append(name)
+            total["calls"] += entry["calls"]
+            total["seconds"] += entry["selfSeconds"]
+            total["statements"] += entry["statements"]
+            total["rowsChanged"] += entry["rowsChanged"]
+            total["vmSteps"] += entry["vmSteps"]
+            total["errors"].extend(entry["errors"])
+        stages[stage] = total
+    return stages
+
+def TraceStatement(statement):
+    """ Trace callback; attributes each SQL statement to the innermost profiled function running
+    :param statement: the SQL text
+    """
+
+    profile = state.profile
+    if profile is not None:
+        name = profile["stack"][-1][0] if profile["stack"] else "(outside profiled functions)"
+        profile["functions"].setdefault(name, NewEntry())["statements"] += 1
+
+def CountProgress():
+    """ Progress handler; SQLite calls it every progressInterval virtual machine instructions, which gives a
+    cheap measure of how much work each function asks of the database
+    :return: 0 so the statement keeps running
+    """
+
+    profile = state.profile
+    if profile is not None:
+        name = profile["stack"][-1][0] if profile["stack"] else "(outside profiled functions)"
+        profile["functions"].setdefault(name, NewEntry())["vmSteps"] += profile["progressInterval"]
+    return 0
+
+def StartProfiling(conn, sampleRate=1.0, jsonPath=None, progressInterval=1000):
+    """ This function turns profiling on for a connection used by the current thread; only sampleRate of the
+    calls actually profile, so it can be left on for a share of production runs
+    :param conn: database connection object
+    :param sampleRate: the chance that this run is profiled (0.0 - 1.0)
+    :param jsonPath: optional file to write the JSON summary to when DumpProfile is called
+    :param progressInterval: number of SQLite instructions between progress handler calls
+    :return: True if this run is being profiled
+    """
+
+    if random.random() >= sampleRate:
+        state.profile = None
+        return False
+
+    state.profile = {
+        "conn": conn,
+        "functions": {},
+        "stack": [],
+        "jsonPath": jsonPath,
+        "progressInterval": progressInterval,
+        "start": time.perf_counter()
+    }
+    conn.set_trace_callback(TraceStatement)
+    conn.set_progress_handler(CountProgress, progressInterval)
+    return True
+
+def StopProfiling():
+    """ This function turns profiling off and removes the callbacks from the connection
+    :return: the summary of the profile that was collected, or None
+    """
+
+    profile = state.profile
+    if profile is None:
+        return None
+
+    summary = ProfileSummary()
+    profile["conn"].set_trace_callback(None)
+    profile["conn"].set_progress_handler(None, 0)
+    state.profile = None
+    return summary
+
+def Profiled(function):
+    """ Decorator that measures the calls, time, statements and changed rows of a function while profiling is
+    on; seconds include nested profiled functions, while selfSeconds and the statement and row counts are kept
+    with the innermost function; errors are recorded and raised again
+    :param function: the function to measure
+    :return: the wrapped function
+    """
+
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+
+        # Call straight through when profiling is off
+        profile = state.profile
+        if profile is None:
+            return function(*args, **kwargs)
+
+        entry = profile["functions"].setdefault(name, NewEntry())
+        conn = profile["conn"]
+
+        # The frame collects the time and changes of nested profiled functions: [name, seconds, rows changed]
+        frame = [name, 0.0, 0]
+        stack = profile["stack"]
+        stack.append(frame)
+        changes = conn.total_changes
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception as e:
+            entry["errors"].append("%s: %s" % (type(e).__name__, e))
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            changed = conn.total_changes - changes
+            stack.pop()
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["selfSeconds"] += seconds - frame[1]
+            entry["rowsChanged"] += changed - frame[2]
+            if stack:
+                stack[-1][1] += seconds
+                stack[-1][2] += changed
+
+    return wrapper
+
+def ProfileSummary():
+    """ This function returns the collected measurements
+    :return: dictionary with the total seconds, the measurements for each function and for each step in
+    PROFILE_STAGES, or None
+    """
+
+    profile = state.profile
+    if profile is None:
+        return None
+
+    functions = dict((name, dict(entry, errors=list(entry["errors"]))) for name, entry in profile["functions"].items())
+    return {
+        "seconds": time.perf_counter() - profile["start"],
+        "functions": functions,
+        "stages": StageSummary(functions)
+    }
+
+def DumpProfile(output=None):
+    """ This function prints the profile summary as text and, when a JSON path was given to StartProfiling,
+    writes it as JSON; it does nothing when profiling is off
+    :param output: file object for the text summary; defaults to the console
+    """
+
+    summary = ProfileSummary()
+    if summary is None:
+        return
+
+    if output is None:
+        output = sys.stdout
+
+    # One line per scheduling step, then one line per function, slowest first
+    lineFormat = "%-32s calls: %6d  seconds: %9.4f  statements: %7d  rows changed: %7d  vm steps: %9d  errors: %d\n"
+    output.write("Profile: %.3f seconds\n" % summary["seconds"])
+    for name, entry in summary["stages"].items():
+        output.write(lineFormat % (name, entry["calls"], entry["seconds"], entry["statements"], entry["rowsChanged"],
+                                   entry["vmSteps"], len(entry["errors"])))
+    output.write("Functions:\n")
+    for name, entry in sorted(summary["functions"].items(), key=lambda item: -item[1]["seconds"]):
+        output.write(lineFormat % (name, entry["calls"], entry["seconds"], entry["statements"], entry["rowsChanged"],
+                                   entry["vmSteps"], len(entry["errors"])))
+
+    jsonPath = state.profile["jsonPath"]
+    if jsonPath:
+        with open(jsonPath, "w") as jsonFile:
+            json.dump(summary, jsonFile, indent=2)
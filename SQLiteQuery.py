@@ -1,69 +1,186 @@
 # Author: Seth Hobbes
 # Created: 7/17/2021
 # Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
-# Last Modified: 7/17/2021
+# Last Modified: 10/18/2026
 
-import sqlite3
-from sqlite3 import Error
+import csv
+import json
+from collections import namedtuple
+from SQLiteConnection import CreateConnection, DatabasePath
 
-def CreateConnection(db_file):
-    """ Create a database connection to the SQLite database specified by the db_file
-    :param db_file: database file
-    :return: Connection object or None
+# Number of rows fetched from SQLite per round trip while streaming
+ARRAY_SIZE = 500
+
+# Sources that can be paged or exported: name -> (table or view, key column); the key must be unique and
+# is what keyset pagination continues from
+SOURCES = {
+    "players": ("players", "id"),
+    "schedule": ("schedule", "id"),
+    "scheduleView": ("scheduleView", "ID")
+}
+
+# Row classes built by NamedRowFactory, keyed by the column names of the query
+rowClasses = {}
+
+def NamedRowFactory(cursor, row):
+    """
+    Row factory that returns each row as a named tuple, so columns can be read by name (row.firstName)
+    :param cursor: the Cursor object
+    :param row: the row as a plain tuple
+    :return: named tuple for the row
+    """
+
+    columns = tuple(description[0] for description in cursor.description)
+    rowClass = rowClasses.get(columns)
+    if rowClass is None:
+        rowClass = namedtuple("Row", columns, rename=True)
+        rowClasses[columns] = rowClass
+    return rowClass(*row)
+
+def IterateRows(conn, sql, parameters=(), arraySize=ARRAY_SIZE):
+    """
+    Run a query and yield its rows one at a time; rows are fetched arraySize at a time, so only one batch
+    is ever held in memory
+    :param conn: the Connection object
+    :param sql: the SELECT statement
+    :param parameters: the parameters for the statement
+    :param arraySize: the number of rows fetched per round trip
+    :return: generator of named tuples
     """
-    
-    conn = None
-    
+
+    cur = conn.cursor()
+    cur.row_factory = NamedRowFactory
+    cur.arraysize = arraySize
+    cur.execute(sql, parameters)
+
     try:
-        conn = sqlite3.connect(db_file)
-    except Error as e:
-        print(e)
-        
-    return conn
+        while True:
+            rows = cur.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield row
+    finally:
+        cur.close()
+
+def SourceQuery(source):
+    """
+    Look up the table and key column for a source name
+    :param source: players, schedule or scheduleView
+    :return: (table, key) tuple
+    """
+
+    if source not in SOURCES:
+        raise ValueError("Unknown source: %s" % source)
+    return SOURCES[source]
+
+def SelectPage(conn, source, afterKey=None, pageSize=100):
+    """
+    Query one page of a source with keyset pagination; the next page starts after the last key of this
+    one, so every page costs the same no matter how deep into the table it is
+    :param conn: the Connection object
+    :param source: players, schedule or scheduleView
+    :param afterKey: the key of the last row of the previous page, or None for the first page
+    :param pageSize: the number of rows per page
+    :return: (rows, nextKey) tuple; nextKey is None on the last page
+    """
+
+    table, key = SourceQuery(source)
+    if afterKey is None:
+        rows = list(IterateRows(conn, "SELECT * FROM %s ORDER BY %s LIMIT ?" % (table, key), (pageSize,), pageSize))
+    else:
+        rows = list(IterateRows(conn, "SELECT * FROM %s WHERE %s > ? ORDER BY %s LIMIT ?" % (table, key, key),
+                                (afterKey, pageSize), pageSize))
+
+    nextKey = getattr(rows[-1], key) if len(rows) == pageSize else None
+    return rows, nextKey
+
+def IteratePages(conn, source, pageSize=100):
+    """
+    Yield every page of a source in key order
+    :param conn: the Connection object
+    :param source: players, schedule or scheduleView
+    :param pageSize: the number of rows per page
+    :return: generator of row lists
+    """
+
+    afterKey = None
+    while True:
+        rows, afterKey = SelectPage(conn, source, afterKey, pageSize)
+        if rows:
+            yield rows
+        if afterKey is None:
+            break
+
+def ExportCsv(conn, source, fileObject):
+    """
+    Stream a whole source to a CSV file in key order without loading it into memory
+    :param conn: the Connection object
+    :param source: players, schedule or scheduleView
+    :param fileObject: a text file opened with newline=''
+    :return: the number of rows written
+    """
+
+    table, key = SourceQuery(source)
+    writer = csv.writer(fileObject)
+    count = 0
+    for row in IterateRows(conn, "SELECT * FROM %s ORDER BY %s" % (table, key)):
+        if count == 0:
+            writer.writerow(row._fields)
+        writer.writerow(row)
+        count += 1
+    return count
+
+def ExportJsonLines(conn, source, fileObject):
+    """
+    Stream a whole source to a JSON Lines file (one JSON object per row) in key order without loading it
+    into memory
+    :param conn: the Connection object
+    :param source: players, schedule or scheduleView
+    :param fileObject: a text file
+    :return: the number of rows written
+    """
+
+    table, key = SourceQuery(source)
+    count = 0
+    for row in IterateRows(conn, "SELECT * FROM %s ORDER BY %s" % (table, key)):
+        fileObject.write(json.dumps(row._asdict()) + "\n")
+        count += 1
+    return count
 
 def SelectAllPlayers(conn):
     """
-    Query all rows in the players table
+    Query all rows in the players table and print them as they are read
     :param conn: the Connection object
     :return:
     """
-    
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM players")
-    
-    rows = cur.fetchall()
-    
-    for row in rows:
+
+    for row in IterateRows(conn, "SELECT * FROM players ORDER BY id"):
         print(row)
-        
+
 def SelectPlayerById(conn, id):
     """
-    Query tasks by priority
+    Query a player by id and print it
     :param conn: the Connection object
-    :param priority:
+    :param id: the player id
     :return:
     """
-    
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM players WHERE id=?", (id,))
-    
-    rows = cur.fetchall()
-    
-    for row in rows:
+
+    for row in IterateRows(conn, "SELECT * FROM players WHERE id=?", (id,)):
         print(row)
-        
+
 def main():
-    database = r"C:\sqlite\db\t_ball_db.db"
-    
+    database = DatabasePath()
+
     # create a database conection
     conn = CreateConnection(database)
-    
+
     with conn:
         print("1. Query player by id:")
         SelectPlayerById(conn, 3)
-        
+
         print("2. Query all players")
         SelectAllPlayers(conn)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,265 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import argparse
+import sys
+from sqlite3 import Error
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteCounterMatrix import POSITION_NAMES, VALUES_PER_POSITION, COUNTER, LAST_GAME, LAST_INNING, NULL_POSITION, \
+    LoadCounterMatrix, SaveCounterMatrix, CopyCounterMatrix, PositionColumns, MatrixModel, COUNTER_TABLES
+from SQLiteSportModel import IsRestrictedPosition
+from SQLiteStatements import CheckIdentifiers
+
+# Counter tables checked and rebuilt when none are named; the schedule holds the games that are still only
+# in the working counters, so positionCounters is only rebuilt when it is named, after CommitTempCounters
+DEFAULT_TABLES = ["tempCounters"]
+
+# Innings per player and position with the most recent game and inning at that position packed into one
+# value (gameId << 32 | inningNumber), so a single grouped pass over the schedule gives every counter
+sql_select_position_totals = """SELECT playerId, positionId, count(*), max((gameId << 32) | inningNumber)
+                                FROM schedule
+                                WHERE positionId BETWEEN 1 AND ?
+                                GROUP BY playerId, positionId"""
+
+# Mask for the inning number half of the packed value
+INNING_MASK = 0xFFFFFFFF
+
+def DeriveCounters(conn):
+    """ This function computes every player's counters from the schedule history in one grouped query
+    :param conn: database connection object
+    :return: dictionary of playerId -> (dictionary of position index -> (counter, lastGame, lastInning),
+             lastPositionId)
+    """
+
+    players = {}
+    latest = {}
+
+    cur = conn.cursor()
+    cur.execute(sql_select_position_totals, (len(POSITION_NAMES),))
+    for playerId, positionId, innings, recent in cur:
+        cells = players.setdefault(playerId, {})
+        cells[positionId - 1] = (innings, recent >> 32, recent & INNING_MASK)
+
+        # The last position is the one whose most recent inning is the latest of all the player's positions
+        if playerId not in latest or recent > latest[playerId][0]:
+            latest[playerId] = (recent, positionId)
+
+    # Return the counters and last positions to the function call
+    return dict((playerId, (cells, latest[playerId][1])) for playerId, cells in players.items())
+
+def DeriveCounterMatrix(conn, tableName="tempCounters", derived=None):
+    """ This function computes the counters a table should hold from the schedule history alone; the matrix
+    has the same rows as the table, and players with no schedule records get zeros and no last position
+    :param conn: database connection object
+    :param tableName: the counters table whose rows the matrix follows
+    :param derived: optional result of DeriveCounters, so several tables can share one pass over the schedule
+    :return: the derived counter matrix, in the same form as LoadCounterMatrix returns
+    """
+
+    if derived is None:
+        derived = DeriveCounters(conn)
+
+    # Start from the table's rows with every value cleared
+    matrix = LoadCounterMatrix(conn, tableName)
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    values = matrix["values"]
+    for i in range(len(values)):
+        values[i] = 0
+
+    # A player can have more than one row in the table; all of them get the same values
+    for row, playerId in enumerate(matrix["playerIds"]):
+        cells, lastPositionId = derived.get(playerId, ({}, None))
+        for positionIndex, cell in cells.items():
+            offset = row * stride + positionIndex * VALUES_PER_POSITION
+            values[offset + COUNTER] = cell[0]
+            values[offset + LAST_GAME] = cell[1]
+            values[offset + LAST_INNING] = cell[2]
+
+        # The outfield rule is the one the scheduler uses
+        matrix["lastPositionIds"][row] = NULL_POSITION if lastPositionId is None else lastPositionId
+        matrix["outfieldFlags"][row] = 1 if IsRestrictedPosition(MatrixModel(matrix), lastPositionId) else 0
+
+    # Return the matrix to the function call
+    return matrix
+
+def LatestCell(matrix, row):
+    """ This function finds the most recent inning counted in a row of a counter matrix
+    :param matrix: the counter matrix
+    :param row: the row index
+    :return: (lastGame, lastInning) tuple; (0, 0) when nothing was counted
+    """
+
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    values = matrix["values"]
+    latest = (0, 0)
+    for offset in range(row * stride, (row + 1) * stride, VALUES_PER_POSITION):
+        latest = max(latest, (values[offset + LAST_GAME], values[offset + LAST_INNING]))
+    return latest
+
+def MergeCounterMatrix(stored, derived):
+    """ This function treats the stored counters as a baseline (imported or entered by hand) and only brings
+    forward what the schedule shows they are missing: a counter below the innings in the schedule is raised,
+    a last game and inning older than the schedule's is moved up, and the last position and outfield flag are
+    taken from the schedule when it holds the player's most recent inning; nothing is ever lowered, so schedule
+    records that were deleted or edited are not noticed; it is only used when a baseline is asked for
+    :param stored: the counter matrix loaded from the table
+    :param derived: the matrix returned by DeriveCounterMatrix for the same table
+    :return: a new counter matrix
+    """
+
+    merged = CopyCounterMatrix(stored)
+    stride = stored["positionCount"] * VALUES_PER_POSITION
+    values = merged["values"]
+
+    for row in range(len(stored["playerIds"])):
+        storedLatest = LatestCell(stored, row)
+        for offset in range(row * stride, (row + 1) * stride, VALUES_PER_POSITION):
+            values[offset + COUNTER] = max(values[offset + COUNTER], derived["values"][offset + COUNTER])
+            if (derived["values"][offset + LAST_GAME], derived["values"][offset + LAST_INNING]) > \
+                    (values[offset + LAST_GAME], values[offset + LAST_INNING]):
+                values[offset + LAST_GAME] = derived["values"][offset + LAST_GAME]
+                values[offset + LAST_INNING] = derived["values"][offset + LAST_INNING]
+
+        # The schedule's last position wins when its inning is at least as recent as any the row counted
+        if derived["lastPositionIds"][row] != NULL_POSITION and LatestCell(derived, row) >= storedLatest:
+            merged["lastPositionIds"][row] = derived["lastPositionIds"][row]
+            merged["outfieldFlags"][row] = derived["outfieldFlags"][row]
+
+    # Return the merged matrix to the function call
+    return merged
+
+def MissingCounterRows(conn, tableName):
+    """ This function lists the players who have schedule records but no row in a counters table
+    :param conn: database connection object
+    :param tableName: the counters table to check
+    :return: list of player IDs
+    """
+
+    CheckIdentifiers([tableName], COUNTER_TABLES, "table")
+    cur = conn.cursor()
+    cur.execute( """SELECT DISTINCT playerId FROM schedule WHERE playerId NOT IN (SELECT playerId FROM %s)
+                    ORDER BY playerId""" % tableName)
+    return [row[0] for row in cur.fetchall()]
+
+def VerifyCounters(conn, tableNames=None, baseline=False):
+    """ This function compares the stored counters with the ones derived from the schedule history without
+    changing anything; every value that differs from the schedule is reported, including counters that are
+    ahead of it because schedule records were deleted or edited
+    :param conn: database connection object
+    :param tableNames: the counters tables to check; defaults to DEFAULT_TABLES
+    :param baseline: set to True to treat the stored counters as starting counters and only report values
+    behind the schedule (see MergeCounterMatrix)
+    :return: list of (table, playerId, column, stored value, expected value) differences
+    """
+
+    columns = [column for i in range(len(POSITION_NAMES)) for column in PositionColumns(i)]
+    derivedCounters = DeriveCounters(conn)
+    differences = []
+
+    for tableName in tableNames or DEFAULT_TABLES:
+        stored = LoadCounterMatrix(conn, tableName)
+        derived = DeriveCounterMatrix(conn, tableName, derivedCounters)
+        if baseline:
+            derived = MergeCounterMatrix(stored, derived)
+        stride = stored["positionCount"] * VALUES_PER_POSITION
+
+        for row, playerId in enumerate(stored["playerIds"]):
+            for i, column in enumerate(columns):
+                storedValue = stored["values"][row * stride + i]
+                derivedValue = derived["values"][row * stride + i]
+                if storedValue != derivedValue:
+                    differences.append((tableName, playerId, column, storedValue, derivedValue))
+
+            storedPosition = stored["lastPositionIds"][row]
+            derivedPosition = derived["lastPositionIds"][row]
+            if storedPosition != derivedPosition:
+                differences.append((tableName, playerId, "lastPositionId",
+                                    None if storedPosition == NULL_POSITION else storedPosition,
+                                    None if derivedPosition == NULL_POSITION else derivedPosition))
+            if stored["outfieldFlags"][row] != derived["outfieldFlags"][row]:
+                differences.append((tableName, playerId, "lastInningOutfieldFlag",
+                                    stored["outfieldFlags"][row], derived["outfieldFlags"][row]))
+
+        # Players in the schedule with no counters row at all
+        for playerId in MissingCounterRows(conn, tableName):
+            differences.append((tableName, playerId, "row", None, "missing"))
+
+    # Return the differences to the function call
+    return differences
+
+def RebuildCounters(conn, tableNames=None, baseline=False):
+    """ This function brings the counters, last games, last innings, last positions and outfield flags in
+    step with the schedule history and writes them back in one transaction; use it after the schedule was
+    edited by hand. Every value is derived from the schedule, so counters go down again when schedule records
+    were deleted; with baseline, imported or hand-entered starting counters are kept and only values behind
+    the schedule are raised (see MergeCounterMatrix)
+    :param conn: database connection object
+    :param tableNames: the counters tables to rebuild; defaults to DEFAULT_TABLES
+    :param baseline: set to True to keep the stored counters as starting counters
+    :return: the number of counter rows written
+    """
+
+    rows = 0
+
+    # The connection context manager commits once at the end or rolls everything back on an error
+    with conn:
+        cur = conn.cursor()
+        derived = DeriveCounters(conn)
+        for tableName in tableNames or DEFAULT_TABLES:
+
+            # Players in the schedule without a counters row get one so their history is not lost
+            cur.executemany( """INSERT INTO %s(playerId) VALUES(?)""" % tableName,
+                             [(playerId,) for playerId in MissingCounterRows(conn, tableName)])
+
+            matrix = DeriveCounterMatrix(conn, tableName, derived)
+            if baseline:
+                matrix = MergeCounterMatrix(LoadCounterMatrix(conn, tableName), matrix)
+            SaveCounterMatrix(conn, matrix, tableName)
+            rows += len(matrix["playerIds"])
+
+    # Return the number of rows written to the function call
+    return rows
+
+def main():
+    """ Main program code; rebuilds or verifies the counters of every database passed on the command line
+    """
+
+    parser = argparse.ArgumentParser(description="Rebuild or verify the counters tables from the schedule")
+    parser.add_argument("databases", nargs="*")
+    parser.add_argument("--verify", action="store_true", help="report differences without changing anything")
+    parser.add_argument("--table", action="append", choices=COUNTER_TABLES, dest="tables",
+                        help="counters table to check or rebuild (repeatable); defaults to tempCounters")
+    parser.add_argument("--baseline", action="store_true",
+                        help="keep the stored counters as starting counters and only raise values behind the schedule")
+    args = parser.parse_args()
+
+    failed = 0
+    for database in args.databases or [DatabasePath([])]:
+
+        # create a database connection
+        conn = CreateConnection(database)
+        if conn is None:
+            print("Error! cannot create the database connection.")
+            failed += 1
+            continue
+
+        try:
+            if args.verify:
+                differences = VerifyCounters(conn, args.tables, args.baseline)
+                print("%s: %d difference(s)" % (database, len(differences)))
+                for difference in differences:
+                    print("    %s player %s %s: stored %s, expected %s" % difference)
+                failed += 1 if differences else 0
+            else:
+                print("%s: %d counter row(s) rebuilt" % (database, RebuildCounters(conn, args.tables, args.baseline)))
+        except Error as e:
+            print("%s: %s" % (database, e))
+            failed += 1
+
+    # A non-zero exit code lets a nightly job notice databases that are out of step
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
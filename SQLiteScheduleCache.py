@@ -0,0 +1,155 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from sqlite3 import OperationalError
+from SQLiteCounterMatrix import VALUES_PER_POSITION, UpdateCounterMatrix, MatrixModel
+from SQLiteProfiler import Profiled
+
+# Changes whenever the scheduling rules change, so schedules built by older rules are never served
+CACHE_VERSION = 1
+
+# Number of schedules kept in memory by this process
+CACHE_SIZE = 256
+
+# Number of schedules kept in the cache table; the oldest are removed first
+CACHE_TABLE_SIZE = 1000
+
+# SQL to create the cache table; the key is a hash of everything the schedule depends on
+sql_create_scheduleCache_table = """CREATE TABLE IF NOT EXISTS scheduleCache (
+                                        cacheKey TEXT PRIMARY KEY NOT NULL,
+                                        gameId INTEGER NOT NULL,
+                                        inningCount INTEGER NOT NULL,
+                                        mode TEXT NOT NULL,
+                                        scheduleRows TEXT NOT NULL,
+                                        createdAt REAL NOT NULL
+                                    ) WITHOUT ROWID;"""
+
+# Schedules kept in memory, most recently used last; shared by every connection since a key fully
+# describes its schedule no matter which database it came from
+memoryCache = OrderedDict()
+memoryCacheLock = threading.Lock()
+
+def ScheduleKey(matrix, playerIdList, playerCount, gameNumber, inningCount, mode, firstInning=1):
+    """ This function hashes everything a game's schedule depends on: the counter rows of the players
+    present (in table order, which breaks ties), the sport model, the roster in the order given, the game,
+    the number of innings and the assignment mode; any change to the counters gives a new key
+    :param matrix: the counter matrix the game would be built from
+    :param playerIdList: the list of players present for the game
+    :param playerCount: the number of players available to be scheduled
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings to be scheduled
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param firstInning: the inning the schedule starts from
+    :return: hex digest
+    """
+
+    present = set(playerIdList)
+    stride = matrix["positionCount"] * VALUES_PER_POSITION
+    rows = [(playerId, list(matrix["values"][row * stride:(row + 1) * stride]), matrix["outfieldFlags"][row],
+             matrix["lastPositionIds"][row])
+            for row, playerId in enumerate(matrix["playerIds"]) if playerId in present]
+    payload = json.dumps([CACHE_VERSION, matrix["positionCount"], MatrixModel(matrix)["signature"], rows, list(playerIdList), playerCount, gameNumber,
+                          inningCount, mode, firstInning])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def CreateScheduleCache(conn):
+    """ This function creates the cache table if it does not exist yet
+    :param conn: database connection object
+    """
+
+    with conn:
+        conn.execute(sql_create_scheduleCache_table)
+
+def RememberInMemory(key, scheduleRows):
+    """ This function adds a schedule to the in-memory cache, dropping the least recently used one when full
+    :param key: the schedule key
+    :param scheduleRows: list of (gameId, playerId, positionId, inningNumber) tuples
+    """
+
+    with memoryCacheLock:
+        memoryCache[key] = scheduleRows
+        memoryCache.move_to_end(key)
+        while len(memoryCache) > CACHE_SIZE:
+            memoryCache.popitem(last=False)
+
+@Profiled
+def LookupSchedule(conn, key):
+    """ This function looks a schedule up in memory first and then in the cache table
+    :param conn: database connection object
+    :param key: the schedule key
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples, or None on a miss
+    """
+
+    with memoryCacheLock:
+        scheduleRows = memoryCache.get(key)
+        if scheduleRows is not None:
+            memoryCache.move_to_end(key)
+            return list(scheduleRows)
+
+    # A database without the cache table has nothing cached; CreateAllTables creates it
+    try:
+        row = conn.execute( """SELECT scheduleRows FROM scheduleCache WHERE cacheKey = ?""", (key,)).fetchone()
+    except OperationalError:
+        return None
+    if row is None:
+        return None
+
+    scheduleRows = [tuple(scheduleRow) for scheduleRow in json.loads(row[0])]
+    RememberInMemory(key, scheduleRows)
+    return scheduleRows
+
+@Profiled
+def StoreSchedule(conn, key, gameNumber, inningCount, mode, scheduleRows):
+    """ This function saves a schedule in memory and in the cache table, removing the oldest rows of the
+    table beyond CACHE_TABLE_SIZE; CreateAllTables creates the table, and a database without it, or one that is
+    busy, keeps the schedule in memory only
+    :param conn: database connection object
+    :param key: the schedule key
+    :param gameNumber: the game ID
+    :param inningCount: the number of innings
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :param scheduleRows: list of (gameId, playerId, positionId, inningNumber) tuples
+    """
+
+    RememberInMemory(key, scheduleRows)
+
+    # The connection context manager commits the insert and the trim once or rolls both back on an error
+    try:
+        with conn:
+            conn.execute( """INSERT OR REPLACE INTO scheduleCache(cacheKey, gameId, inningCount, mode, scheduleRows, createdAt)
+                             VALUES(?, ?, ?, ?, ?, ?)""",
+                          (key, gameNumber, inningCount, mode, json.dumps(scheduleRows), time.time()))
+            conn.execute( """DELETE FROM scheduleCache WHERE cacheKey IN (SELECT cacheKey FROM scheduleCache
+                             ORDER BY createdAt DESC LIMIT -1 OFFSET ?)""", (CACHE_TABLE_SIZE,))
+    except OperationalError:
+        pass
+
+def ReplaySchedule(matrix, scheduleRows):
+    """ This function applies a cached schedule to the counter matrix, leaving it exactly as building the
+    schedule would have
+    :param matrix: the counter matrix; it is updated in place
+    :param scheduleRows: list of (gameId, playerId, positionId, inningNumber) tuples in the order they were built
+    """
+
+    for gameId, playerId, positionId, inningNumber in scheduleRows:
+        UpdateCounterMatrix(matrix, gameId, playerId, positionId - 1, inningNumber)
+
+def ClearScheduleCache(conn=None):
+    """ This function empties the in-memory cache and, when a connection is given, the cache table
+    :param conn: optional database connection object
+    """
+
+    with memoryCacheLock:
+        memoryCache.clear()
+
+    if conn is not None:
+        CreateScheduleCache(conn)
+        with conn:
+            conn.execute("DELETE FROM scheduleCache")
@@ -0,0 +1,455 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import argparse
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from sqlite3 import Error
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, UpdateSeasonSchedule, RescheduleGame, ScheduleGameSession
+from SQLiteConnection import CreateConnection, DatabasePath
+from SQLiteAttendance import LoadAvailabilityIndex, AvailablePlayers
+from SQLiteLeagueSchedule import UnscheduledGames
+from SQLiteLineupCards import GetLineupCard
+from SQLiteStatements import SelectRoster
+
+# Address the service listens on; it is meant to run on the club's own box, not the open internet
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Number of threads running SQLite work; each thread keeps one connection per database, so this is also the
+# size of every database's connection pool
+DEFAULT_WORKERS = 8
+
+# Largest request body accepted, in bytes
+MAX_BODY = 1048576
+
+# Seconds an idle keep-alive connection is held open
+IDLE_TIMEOUT = 30
+
+# Lineup card from the schedule tables, for databases that do not have the lineupCards table
+sql_select_lineup_from_schedule = """SELECT schedule.id AS 'ID', games.date AS 'Date', schedule.inningNumber AS 'Inning',
+                                            positions.name AS 'Position', players.firstName AS 'Player'
+                                     FROM schedule
+                                     INNER JOIN games ON games.id = schedule.gameId
+                                     INNER JOIN positions ON positions.id = schedule.positionId
+                                     INNER JOIN players ON players.id = schedule.playerId
+                                     WHERE schedule.gameId = ?
+                                     ORDER BY schedule.inningNumber, schedule.positionId"""
+
+# Routes: (method, pattern, handler name); the named groups are passed to the handler
+ROUTES = [
+    ("GET", re.compile(r"^/health$"), "Health"),
+    ("GET", re.compile(r"^/teams/(?P<team>\w+)/games/(?P<gameId>\d+)/lineup$"), "Lineup"),
+    ("POST", re.compile(r"^/teams/(?P<team>\w+)/schedule$"), "Schedule"),
+    ("POST", re.compile(r"^/teams/(?P<team>\w+)/games/(?P<gameId>\d+)/schedule$"), "ScheduleGame"),
+    ("POST", re.compile(r"^/teams/(?P<team>\w+)/games/(?P<gameId>\d+)/reschedule$"), "Reschedule")
+]
+
+# Reason phrases for the status codes the service sends
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error"}
+
+class ServiceError(Exception):
+    """ Error that is sent back to the client with its HTTP status code
+    """
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+
+def ReadLineupCard(databasePath, gameId):
+    """ This function reads the lineup card for a game; it runs on a pool thread
+    :param databasePath: path to the team database
+    :param gameId: the game ID
+    :return: list of dictionaries with the ID, Date, Inning, Position and Player of each record
+    """
+
+    conn = OpenDatabase(databasePath)
+    cur = conn.cursor()
+    cur.execute( """SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'lineupCards'""" )
+    if cur.fetchone() is not None:
+        rows = GetLineupCard(conn, gameId)
+    else:
+        cur.execute(sql_select_lineup_from_schedule, (gameId,))
+        rows = cur.fetchall()
+    return [dict(zip(("ID", "Date", "Inning", "Position", "Player"), row)) for row in rows]
+
+def WriteSeasonSchedule(databasePath, games, inningCount, mode):
+    """ This function schedules a list of games, or every game without schedule records when games is None;
+    it runs on a pool thread
+    :param databasePath: path to the team database
+    :param games: list of (gameId, playerIdList, inningCount) tuples, or None
+    :param inningCount: the number of innings used when games is None
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+
+    conn = OpenDatabase(databasePath)
+    if games is None:
+        games = UnscheduledGames(conn, inningCount)
+    else:
+        CheckRoster(conn, [game[0] for game in games], [playerId for game in games for playerId in game[1]],
+                    "tempCounters")
+    return UpdateSeasonSchedule(conn, games, mode)
+
+def WriteGameSchedule(databasePath, gameId, playerIdList, inningCount, mode):
+    """ This function schedules one game as a session, so games for the same team can be scheduled side by
+    side; it runs on a pool thread
+    :param databasePath: path to the team database
+    :param gameId: the game ID
+    :param playerIdList: the players present, or None to use the attendance table
+    :param inningCount: the number of innings in the game
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+
+    conn = OpenDatabase(databasePath)
+    if playerIdList is None:
+        playerIdList = AvailablePlayers(LoadAvailabilityIndex(conn), gameId)
+        if not playerIdList:
+            raise ServiceError(400, "Nobody is expected at game %d; give playerIds" % gameId)
+    CheckRoster(conn, [gameId], playerIdList, "tempCounters")
+    return ScheduleGameSession(conn, playerIdList, len(playerIdList), gameId, inningCount, mode)
+
+def WriteReschedule(databasePath, gameId, resumeInning, playerIdList, inningCount, mode):
+    """ This function rebuilds the rest of a game for a new roster; it runs on a pool thread
+    :param databasePath: path to the team database
+    :param gameId: the game ID
+    :param resumeInning: the first inning that has not been played yet
+    :param playerIdList: the players present from resumeInning on
+    :param inningCount: the number of innings in the game
+    :param mode: GREEDY_MODE or MATCHING_MODE
+    :return: list of (gameId, playerId, positionId, inningNumber) tuples that were written
+    """
+
+    conn = OpenDatabase(databasePath)
+    CheckRoster(conn, [gameId], playerIdList, "tempCounters")
+    return RescheduleGame(conn, gameId, resumeInning, playerIdList, inningCount, mode)
+
+def OpenDatabase(databasePath):
+    """ This function returns the calling thread's connection to a database, opening it the first time
+    :param databasePath: path to the team database
+    :return: connection object
+    """
+
+    conn = CreateConnection(databasePath)
+    if conn is None:
+        raise ServiceError(500, "Cannot open the database for this team")
+    return conn
+
+def ScheduleRowsJson(scheduleRows):
+    """ This function turns schedule tuples into JSON objects
+    :param scheduleRows: list of (gameId, playerId, positionId, inningNumber) tuples
+    :return: list of dictionaries
+    """
+
+    return [dict(zip(("gameId", "playerId", "positionId", "inningNumber"), row)) for row in scheduleRows]
+
+def CheckMode(mode):
+    """ This function validates the assignment mode given by a client
+    :param mode: the requested mode
+    :return: the mode
+    """
+
+    if mode not in (GREEDY_MODE, MATCHING_MODE):
+        raise ServiceError(400, "mode must be %s or %s" % (GREEDY_MODE, MATCHING_MODE))
+    return mode
+
+def CheckInteger(value, name, minimum=1):
+    """ This function validates a whole number given by a client, as a JSON number or a string of digits
+    :param value: the requested value
+    :param name: the name of the value, used in the error message
+    :param minimum: the smallest value allowed
+    :return: the value as an integer
+    """
+
+    if isinstance(value, bool) or not isinstance(value, (int, str)) or not re.match(r"^\s*-?\d+\s*$", str(value)):
+        raise ServiceError(400, "%s must be an integer" % name)
+    if int(value) < minimum:
+        raise ServiceError(400, "%s must be at least %d" % (name, minimum))
+    return int(value)
+
+def CheckPlayerIds(playerIds):
+    """ This function validates a list of player IDs given by a client
+    :param playerIds: the requested player IDs
+    :return: the player IDs
+    """
+
+    if not isinstance(playerIds, list) or not playerIds or \
+            not all(isinstance(playerId, int) and not isinstance(playerId, bool) and playerId > 0 for playerId in playerIds):
+        raise ServiceError(400, "playerIds must be a non-empty list of positive integers")
+    if len(set(playerIds)) != len(playerIds):
+        raise ServiceError(400, "playerIds must not repeat a player")
+    return playerIds
+
+def CheckRoster(conn, gameIds, playerIdList, tableName):
+    """ This function makes sure the games exist and every player has a row in the counters table the
+    scheduler reads, so a bad roster is answered with 400 instead of failing part way; it runs on a pool thread
+    :param conn: database connection object
+    :param gameIds: the game IDs to be scheduled
+    :param playerIdList: the players to be scheduled
+    :param tableName: positionCounters or tempCounters
+    """
+
+    cur = conn.cursor()
+    cur.execute( """SELECT id FROM games""" )
+    unknownGames = sorted(set(gameIds) - set(row[0] for row in cur.fetchall()))
+    if unknownGames:
+        raise ServiceError(400, "Unknown game(s): %s" % ", ".join(str(gameId) for gameId in unknownGames))
+
+    cur.execute(SelectRoster(tableName))
+    unknownPlayers = sorted(set(playerIdList) - set(row[0] for row in cur.fetchall()))
+    if unknownPlayers:
+        raise ServiceError(400, "Player(s) without counters: %s" % ", ".join(str(playerId) for playerId in unknownPlayers))
+
+class ScheduleService:
+    """ Asyncio HTTP/JSON front end for the scheduler; SQLite work runs on a bounded thread pool, season and
+    reschedule writes to a team database are serialized while single games run side by side as sessions, and
+    identical lineup requests that arrive together share one query
+    """
+
+    def __init__(self, teams, workers=DEFAULT_WORKERS):
+        """
+        :param teams: dictionary of team name -> database path
+        :param workers: number of threads running SQLite work
+        """
+
+        self.teams = teams
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sqlite")
+        self.writeLocks = dict((team, asyncio.Lock()) for team in teams)
+        self.pendingLineups = {}
+        self.stats = {"requests": 0, "coalesced": 0, "errors": 0}
+
+    def DatabaseFor(self, team):
+        """ This function looks up the database of a team
+        :param team: the team name from the URL
+        :return: path to the team database
+        """
+
+        if team not in self.teams:
+            raise ServiceError(404, "Unknown team: %s" % team)
+        return self.teams[team]
+
+    async def RunBlocking(self, function, *args):
+        """ This function runs a blocking function on the thread pool
+        :param function: the function to run
+        :param args: its arguments
+        :return: the function's result
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def Health(self, body):
+        """ GET /health
+        """
+
+        return {"status": "ok", "teams": sorted(self.teams), "stats": dict(self.stats)}
+
+    async def Lineup(self, body, team, gameId):
+        """ GET /teams/{team}/games/{gameId}/lineup; requests for the same lineup that arrive while one is
+        being read wait for that read instead of starting their own
+        """
+
+        key = (team, int(gameId))
+        future = self.pendingLineups.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.RunBlocking(ReadLineupCard, self.DatabaseFor(team), int(gameId)))
+            self.pendingLineups[key] = future
+            future.add_done_callback(lambda done: self.pendingLineups.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+
+        # shield() keeps one client disconnecting from cancelling the read for everybody else
+        rows = await asyncio.shield(future)
+        return {"gameId": int(gameId), "lineup": rows}
+
+    async def Schedule(self, body, team):
+        """ POST /teams/{team}/schedule; body {"games": [{"gameId", "playerIds", "inningCount"}], "mode",
+        "inningCount"}; without games every game that has no schedule records is scheduled
+        """
+
+        databasePath = self.DatabaseFor(team)
+        mode = CheckMode(body.get("mode", GREEDY_MODE))
+        inningCount = CheckInteger(body.get("inningCount", 4), "inningCount")
+        games = body.get("games")
+        if games is not None:
+            if not isinstance(games, list) or not all(isinstance(game, dict) and "gameId" in game for game in games):
+                raise ServiceError(400, "games must be a list of {gameId, playerIds, inningCount} objects")
+            games = [(CheckInteger(game["gameId"], "gameId"), CheckPlayerIds(game.get("playerIds")),
+                      CheckInteger(game.get("inningCount", inningCount), "inningCount")) for game in games]
+
+        async with self.writeLocks[team]:
+            scheduleRows = await self.RunBlocking(WriteSeasonSchedule, databasePath, games, inningCount, mode)
+        return {"rows": ScheduleRowsJson(scheduleRows)}
+
+    async def ScheduleGame(self, body, team, gameId):
+        """ POST /teams/{team}/games/{gameId}/schedule; body {"playerIds", "inningCount", "mode"}; without
+        playerIds the attendance table decides who plays; games run as sessions that check their players'
+        counters when they write and build again if another writer changed them, so no team lock is taken
+        """
+
+        databasePath = self.DatabaseFor(team)
+        mode = CheckMode(body.get("mode", GREEDY_MODE))
+        inningCount = CheckInteger(body.get("inningCount", 4), "inningCount")
+        playerIds = body.get("playerIds")
+        if playerIds is not None:
+            CheckPlayerIds(playerIds)
+
+        scheduleRows = await self.RunBlocking(WriteGameSchedule, databasePath, int(gameId), playerIds, inningCount, mode)
+        return {"rows": ScheduleRowsJson(scheduleRows)}
+
+    async def Reschedule(self, body, team, gameId):
+        """ POST /teams/{team}/games/{gameId}/reschedule; body {"resumeInning", "playerIds", "inningCount", "mode"}
+        """
+
+        databasePath = self.DatabaseFor(team)
+        mode = CheckMode(body.get("mode", GREEDY_MODE))
+        if "resumeInning" not in body:
+            raise ServiceError(400, "resumeInning is required")
+        resumeInning = CheckInteger(body["resumeInning"], "resumeInning")
+        inningCount = CheckInteger(body.get("inningCount", 4), "inningCount")
+        if resumeInning > inningCount:
+            raise ServiceError(400, "resumeInning must not be after the last inning")
+        playerIds = CheckPlayerIds(body.get("playerIds"))
+
+        async with self.writeLocks[team]:
+            scheduleRows = await self.RunBlocking(WriteReschedule, databasePath, int(gameId), resumeInning, playerIds,
+                                                  inningCount, mode)
+        return {"rows": ScheduleRowsJson(scheduleRows)}
+
+    async def Dispatch(self, method, path, body):
+        """ This function finds the handler for a request and runs it
+        :param method: the HTTP method
+        :param path: the request path without the query string
+        :param body: the request body as bytes
+        :return: (status, response dictionary) tuple
+        """
+
+        self.stats["requests"] += 1
+        try:
+            allowed = False
+            for routeMethod, pattern, handlerName in ROUTES:
+                match = pattern.match(path)
+                if match is None:
+                    continue
+                allowed = True
+                if routeMethod != method:
+                    continue
+                try:
+                    data = json.loads(body.decode("utf-8")) if body else {}
+                except ValueError:
+                    raise ServiceError(400, "The request body is not valid JSON")
+                if not isinstance(data, dict):
+                    raise ServiceError(400, "The request body must be a JSON object")
+                return 200, await getattr(self, handlerName)(data, **match.groupdict())
+            raise ServiceError(405 if allowed else 404, "%s %s is not supported" % (method, path))
+        except ServiceError as e:
+            self.stats["errors"] += 1
+            return e.status, {"error": str(e)}
+        except Error as e:
+            self.stats["errors"] += 1
+            return 500, {"error": "%s: %s" % (type(e).__name__, e)}
+
+        # Anything else is a fault in the service, but the client still gets an answer
+        except Exception as e:
+            self.stats["errors"] += 1
+            return 500, {"error": "Internal error (%s)" % type(e).__name__}
+
+    async def HandleClient(self, reader, writer):
+        """ This function serves the HTTP/1.1 requests on one client connection until it is closed
+        :param reader: the asyncio stream reader
+        :param writer: the asyncio stream writer
+        """
+
+        try:
+            while True:
+                try:
+                    requestLine = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not requestLine.strip():
+                    break
+
+                parts = requestLine.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                if len(parts) != 3:
+                    status, response = 400, {"error": "Malformed request line"}
+                    keepAlive = False
+                else:
+                    method, target, version = parts
+                    keepAlive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                    length = int(headers.get("content-length", "0") or 0)
+                    if length > MAX_BODY:
+                        status, response = 413, {"error": "The request body is too large"}
+                        keepAlive = False
+                    else:
+                        body = await reader.readexactly(length) if length else b""
+                        status, response = await self.Dispatch(method.upper(), target.split("?", 1)[0], body)
+
+                payload = json.dumps(response).encode("utf-8")
+                writer.write(("HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n"
+                              "Connection: %s\r\n\r\n" % (status, REASONS.get(status, ""), len(payload),
+                                                          "keep-alive" if keepAlive else "close")).encode("latin-1")
+                             + payload)
+                await writer.drain()
+                if not keepAlive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def Serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """ This function runs the service until it is cancelled
+        :param host: address to listen on
+        :param port: port to listen on
+        """
+
+        server = await asyncio.start_server(self.HandleClient, host, port, backlog=1024)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+def main():
+    """ Main program code; team databases are given as NAME=PATH arguments, and without any the default
+    database is served as the team "default"
+    """
+
+    parser = argparse.ArgumentParser(description="Serve schedules and lineups over HTTP/JSON")
+    parser.add_argument("teams", nargs="*", help="NAME=PATH for each team database")
+    parser.add_argument("--database")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    teams = {}
+    for team in args.teams:
+        name, _, path = team.partition("=")
+        if not re.match(r"^\w+$", name) or not path:
+            parser.error("teams must be given as NAME=PATH")
+        teams[name] = path
+    if not teams:
+        teams["default"] = args.database or DatabasePath()
+
+    print("Serving %d team(s) on http://%s:%d" % (len(teams), args.host, args.port))
+    try:
+        asyncio.run(ScheduleService(teams, args.workers).Serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import argparse
+import json
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, ScheduleGameInMatrix
+from SQLiteCounterMatrix import VALUES_PER_POSITION
+from SQLiteFairnessAnalytics import PositionHistory, SummarizePositionHistory
+from SQLiteSportModel import SPORTS, GetSportModel
+
+# Scheduling policies the simulator can compare
+POLICIES = [GREEDY_MODE, MATCHING_MODE]
+
+# Season measurements whose distributions are reported for every policy
+METRICS = ["meanPositionGini", "outfieldShareGini", "outfieldShareVariance", "inningsGini", "repeats"]
+
+# Seasons handed to a worker at a time; larger batches mean less inter-process traffic
+BATCH_SIZE = 50
+
+# Last position given to every player of a new season; any value that is not a position ID lets everybody
+# play any position in the first inning
+NO_POSITION = 0
+
+def EmptyCounterMatrix(playerIdList, model):
+    """ This function builds a counter matrix for a new team without a database; every counter is zero
+    :param playerIdList: the players on the team, in table order
+    :param model: the sport model the team plays
+    :return: counter matrix in the same form as LoadCounterMatrix returns
+    """
+
+    positionCount = model["positionCount"]
+    return {
+        "rowIds": array('q', range(1, len(playerIdList) + 1)),
+        "playerIds": array('q', playerIdList),
+        "values": array('q', [0] * (len(playerIdList) * positionCount * VALUES_PER_POSITION)),
+        "outfieldFlags": array('b', [0] * len(playerIdList)),
+        "lastPositionIds": array('q', [NO_POSITION] * len(playerIdList)),
+        "positionCount": positionCount,
+        "model": model
+    }
+
+def SeasonSeed(seed, season):
+    """ This function gives every season its own seed; it only depends on the base seed and the season
+    number, so each policy sees exactly the same attendance and results do not depend on the worker count
+    :param seed: the base seed of the run
+    :param season: the season number
+    :return: seed for the season
+    """
+
+    return seed * 1000003 + season
+
+def SimulateSeason(policy, season, settings):
+    """ This function plays one synthetic season: every player gets their own attendance rate, each game has
+    a random roster, and the games are scheduled in memory with the given policy
+    :param policy: GREEDY_MODE or MATCHING_MODE
+    :param season: the season number
+    :param settings: dictionary with sport, playerCount, gameCount, inningCount, minAttendance, maxAttendance and seed
+    :return: dictionary with the METRICS for the season
+    """
+
+    rnd = random.Random(SeasonSeed(settings["seed"], season))
+    playerIdList = list(range(1, settings["playerCount"] + 1))
+
+    # Some players come to nearly every game and some miss a lot of them
+    attendance = dict((playerId, rnd.uniform(settings["minAttendance"], settings["maxAttendance"]))
+                      for playerId in playerIdList)
+
+    model = GetSportModel(settings["sport"])
+    matrix = EmptyCounterMatrix(playerIdList, model)
+    scheduleRows = []
+    for gameId in range(1, settings["gameCount"] + 1):
+        roster = [playerId for playerId in playerIdList if rnd.random() < attendance[playerId]]
+        if not roster:
+            roster = [rnd.choice(playerIdList)]
+        scheduleRows.extend(ScheduleGameInMatrix(matrix, roster, len(roster), gameId, settings["inningCount"], policy))
+
+    team = SummarizePositionHistory(PositionHistory(scheduleRows), model)["team"]
+    return dict((metric, team[metric]) for metric in METRICS)
+
+def SimulateBatch(job):
+    """ This function is the worker for a batch of seasons of one policy
+    :param job: a (policy, firstSeason, seasonCount, settings) tuple
+    :return: (policy, list of season results) tuple
+    """
+
+    policy, firstSeason, seasonCount, settings = job
+    return policy, [SimulateSeason(policy, season, settings) for season in range(firstSeason, firstSeason + seasonCount)]
+
+def Distribution(values):
+    """ This function summarizes a list of season measurements
+    :param values: list of numbers
+    :return: dictionary with the mean, standard deviation, minimum, 5th, 50th and 95th percentiles and maximum
+    """
+
+    ordered = sorted(values)
+    count = len(ordered)
+    mean = sum(ordered) / float(count)
+
+    def Percentile(share):
+        return ordered[min(count - 1, int(share * count))]
+
+    return {
+        "mean": mean,
+        "stdev": (sum((value - mean) ** 2 for value in ordered) / float(count)) ** 0.5,
+        "min": ordered[0],
+        "p5": Percentile(0.05),
+        "p50": Percentile(0.50),
+        "p95": Percentile(0.95),
+        "max": ordered[-1]
+    }
+
+def RunSimulation(policies=None, seasons=1000, playerCount=10, gameCount=12, inningCount=4, minAttendance=0.6,
+                  maxAttendance=0.95, seed=0, workers=None, sport="baseball"):
+    """ This function simulates many seasons with random attendance for every policy across a process pool
+    and reports the distribution of each fairness measurement
+    :param policies: list of policies to compare; defaults to POLICIES
+    :param seasons: the number of seasons per policy
+    :param playerCount: the number of players on the team
+    :param gameCount: the number of games per season
+    :param inningCount: the number of innings per game
+    :param minAttendance: the lowest attendance rate a player can be given
+    :param maxAttendance: the highest attendance rate a player can be given
+    :param seed: base seed; the same seed always gives the same report
+    :param workers: the number of worker processes; defaults to the number of CPUs
+    :param sport: the built in sport to simulate (see SQLiteSportModel)
+    :return: dictionary with the settings, seconds and the distributions per policy and metric
+    """
+
+    policies = policies or POLICIES
+    settings = {"sport": sport, "playerCount": playerCount, "gameCount": gameCount, "inningCount": inningCount,
+                "minAttendance": minAttendance, "maxAttendance": maxAttendance, "seed": seed}
+
+    # Split every policy's seasons into batches for the process pool
+    jobs = [(policy, first, min(BATCH_SIZE, seasons - first), settings)
+            for policy in policies for first in range(0, seasons, BATCH_SIZE)]
+
+    # map keeps the batches in job order, so the seasons are always combined in the same order
+    start = time.perf_counter()
+    results = dict((policy, []) for policy in policies)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for policy, seasonResults in executor.map(SimulateBatch, jobs):
+            results[policy].extend(seasonResults)
+
+    return {
+        "settings": dict(settings, seasons=seasons),
+        "seconds": time.perf_counter() - start,
+        "policies": dict((policy, dict((metric, Distribution([result[metric] for result in results[policy]]))
+                                       for metric in METRICS))
+                         for policy in policies)
+    }
+
+def PrintSimulationReport(report):
+    """ This function prints the simulation report to the console, one line per policy and metric
+    :param report: dictionary returned by RunSimulation
+    """
+
+    print("Seasons: %d per policy, Seconds: %.3f" % (report["settings"]["seasons"], report["seconds"]))
+    for policy, metrics in report["policies"].items():
+        for metric, distribution in metrics.items():
+            print("%-10s %-22s mean: %8.4f  stdev: %8.4f  p5: %8.4f  p50: %8.4f  p95: %8.4f"
+                  % (policy, metric, distribution["mean"], distribution["stdev"], distribution["p5"],
+                     distribution["p50"], distribution["p95"]))
+
+def main():
+    """ Main program code
+    """
+
+    parser = argparse.ArgumentParser(description="Compare scheduling policies over simulated seasons")
+    parser.add_argument("--policies", nargs="+", choices=POLICIES, default=POLICIES)
+    parser.add_argument("--seasons", type=int, default=1000)
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--games", type=int, default=12)
+    parser.add_argument("--innings", type=int, default=4)
+    parser.add_argument("--min-attendance", type=float, default=0.6)
+    parser.add_argument("--max-attendance", type=float, default=0.95)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sport", choices=sorted(SPORTS), default="baseball")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--json", help="optional file to write the report to as JSON")
+    args = parser.parse_args()
+
+    report = RunSimulation(args.policies, args.seasons, args.players, args.games, args.innings, args.min_attendance,
+                           args.max_attendance, args.seed, args.workers, args.sport)
+    PrintSimulationReport(report)
+
+    if args.json:
+        with open(args.json, "w") as jsonFile:
+            json.dump(report, jsonFile, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sqlite3
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, UpdateSeasonSchedule
+from SQLiteConnection import ApplyPragmas, CreateConnection, DatabasePath, DatabaseVersion, DEFAULT_PRAGMAS, CACHED_STATEMENTS
+from SQLiteLeagueSchedule import UnscheduledGames
+
+# Schema object types in the order they are created; tables come first because the others refer to them
+SCHEMA_TYPES = ("table", "index", "view", "trigger")
+
+class StaleSnapshotError(Exception):
+    """ Raised when a snapshot is promoted after the database it was taken from has changed
+    """
+
+def CreateSnapshot(conn):
+    """ This function copies the whole database into a private in-memory database with the backup API; the
+    scheduler can run against the snapshot's connection without touching the real file
+    :param conn: database connection object for the real database
+    :return: dictionary with the snapshot connection and the source it came from
+    """
+
+    # The backup reads through the source connection, so its own uncommitted changes would be copied too
+    if conn.in_transaction:
+        raise ValueError("Commit or roll back before taking a snapshot")
+
+    snapshotConn = sqlite3.connect(":memory:", cached_statements=CACHED_STATEMENTS)
+    conn.backup(snapshotConn)
+    ApplyPragmas(snapshotConn, {"foreign_keys": DEFAULT_PRAGMAS["foreign_keys"],
+                                "temp_store": DEFAULT_PRAGMAS["temp_store"]})
+
+    return {"conn": snapshotConn, "source": conn, "version": DatabaseVersion(conn)}
+
+def SchemaObjects(conn):
+    """ This function lists the schema objects of a database that a snapshot can change; the internal
+    objects SQLite creates by itself are left out
+    :param conn: database connection object
+    :return: dictionary of (type, name) tuples to their SQL
+    """
+
+    return {(row[0], row[1]): row[2] for row in conn.execute(
+        """SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%'""")}
+
+def QuoteName(name):
+    """ This function quotes a table or column name read from the schema for use in a statement
+    :param name: the name
+    :return: the quoted name
+    """
+
+    return '"%s"' % name.replace('"', '""')
+
+def TableRows(conn, tableName):
+    """ This function reads a whole table keyed by its rowid, or by its primary key for a WITHOUT ROWID table
+    :param conn: database connection object
+    :param tableName: the table name
+    :return: (key columns, columns, dictionary of key tuples to row tuples) tuple
+    """
+
+    info = conn.execute("PRAGMA table_info(%s)" % QuoteName(tableName)).fetchall()
+    columns = [row[1] for row in info]
+    keyColumns = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+    try:
+        conn.execute("SELECT rowid FROM %s LIMIT 0" % QuoteName(tableName))
+        keyColumns = ["rowid"]
+    except sqlite3.OperationalError:
+        pass
+
+    keyCount = len(keyColumns)
+    keyList = ", ".join(QuoteName(column) for column in keyColumns)
+    rows = conn.execute("SELECT %s, * FROM %s" % (keyList, QuoteName(tableName))).fetchall()
+    return keyColumns, columns, {row[:keyCount]: row[keyCount:] for row in rows}
+
+def ApplyTableDiff(source, snapshotConn, tableName):
+    """ This function changes the rows of a table in the real database until they match the snapshot,
+    deleting, updating and inserting only the rows that differ
+    :param source: database connection object for the real database, inside its write transaction
+    :param snapshotConn: the snapshot's connection
+    :param tableName: the table name
+    :return: the number of rows changed
+    """
+
+    keyColumns, columns, sourceRows = TableRows(source, tableName)
+    keyColumns, columns, snapshotRows = TableRows(snapshotConn, tableName)
+    keyCondition = " AND ".join("%s IS ?" % QuoteName(column) for column in keyColumns)
+    table = QuoteName(tableName)
+
+    deleted = [key for key in sourceRows if key not in snapshotRows]
+    updated = [(snapshotRows[key] + key) for key in snapshotRows if key in sourceRows and sourceRows[key] != snapshotRows[key]]
+    inserted = [(key + snapshotRows[key]) for key in snapshotRows if key not in sourceRows]
+
+    source.executemany("DELETE FROM %s WHERE %s" % (table, keyCondition), deleted)
+    source.executemany("UPDATE %s SET %s WHERE %s" % (table, ", ".join("%s = ?" % QuoteName(column) for column in columns),
+                                                      keyCondition), updated)
+    source.executemany("INSERT INTO %s (%s) VALUES(%s)" % (table, ", ".join(QuoteName(column) for column in keyColumns + columns),
+                                                           ", ".join("?" * (len(keyColumns) + len(columns)))), inserted)
+    return len(deleted) + len(updated) + len(inserted)
+
+def ApplySnapshot(source, snapshotConn):
+    """ This function makes the real database match a snapshot inside the caller's write transaction: schema
+    objects the snapshot added, dropped or changed are created, dropped or recreated, and then only the rows
+    that differ are written; triggers may change other tables while rows are written, so the tables are
+    compared again until none of them differs
+    :param source: database connection object for the real database, inside its write transaction
+    :param snapshotConn: the snapshot's connection
+    """
+
+    sourceObjects = SchemaObjects(source)
+    snapshotObjects = SchemaObjects(snapshotConn)
+
+    # Changed objects are dropped and created again; dropping a table also drops its indexes and triggers
+    for kind, name in sourceObjects:
+        if sourceObjects[(kind, name)] != snapshotObjects.get((kind, name)):
+            source.execute("DROP %s IF EXISTS %s" % (kind.upper(), QuoteName(name)))
+    sourceObjects = SchemaObjects(source)
+    for kind in SCHEMA_TYPES:
+        for (objectKind, name), sql in snapshotObjects.items():
+            if objectKind == kind and (objectKind, name) not in sourceObjects:
+                source.execute(sql)
+
+    # AUTOINCREMENT counters are kept in sqlite_sequence, so it is brought over like any other table
+    tableNames = [name for kind, name in snapshotObjects if kind == "table"]
+    if snapshotConn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'").fetchone():
+        tableNames.append("sqlite_sequence")
+    for attempt in range(len(tableNames) + 1):
+        if not sum(ApplyTableDiff(source, snapshotConn, tableName) for tableName in tableNames):
+            return
+    raise sqlite3.DatabaseError("The snapshot could not be applied")
+
+def PromoteSnapshot(snapshot):
+    """ This function makes a snapshot the real database by writing the differences back to the file it came
+    from in one write transaction; it refuses if the real database changed after the snapshot was taken, since
+    those changes would be lost, and the write lock is taken before that check so nothing can change between
+    the check and the write
+    :param snapshot: dictionary returned by CreateSnapshot
+    """
+
+    source = snapshot["source"]
+    snapshot["conn"].commit()
+
+    # Foreign keys are checked once at the commit, after every table matches the snapshot
+    with source:
+        if not source.in_transaction:
+            source.execute("BEGIN IMMEDIATE")
+        if DatabaseVersion(source) != snapshot["version"]:
+            raise StaleSnapshotError("The database changed after the snapshot was taken")
+        source.execute("PRAGMA defer_foreign_keys = ON")
+        ApplySnapshot(source, snapshot["conn"])
+    DiscardSnapshot(snapshot)
+
+def DiscardSnapshot(snapshot):
+    """ This function throws a snapshot away
+    :param snapshot: dictionary returned by CreateSnapshot
+    """
+
+    snapshot["conn"].close()
+
+def TryAlternatives(conn, alternatives):
+    """ This function runs each alternative against its own snapshot of the database, so none of them can
+    see or disturb the others or the real file
+    :param conn: database connection object for the real database
+    :param alternatives: list of functions that take a connection and return a result
+    :return: list of (snapshot, result) tuples in the same order as the alternatives
+    """
+
+    results = []
+    try:
+        for alternative in alternatives:
+            snapshot = CreateSnapshot(conn)
+            results.append((snapshot, None))
+            results[-1] = (snapshot, alternative(snapshot["conn"]))
+    except Exception:
+        for snapshot, result in results:
+            DiscardSnapshot(snapshot)
+        raise
+    return results
+
+def PromoteAlternative(results, choice):
+    """ This function promotes the chosen alternative from TryAlternatives and discards the rest
+    :param results: list returned by TryAlternatives
+    :param choice: index of the alternative to keep, or None to discard them all
+    """
+
+    try:
+        if choice is not None:
+            PromoteSnapshot(results[choice][0])
+    finally:
+        for snapshot, result in results:
+            DiscardSnapshot(snapshot)
+
+def main():
+    """ Main program code; schedules the next unscheduled game in each assignment mode against separate
+    snapshots, prints both and discards them, leaving the database as it was
+    """
+
+    # create a database connection
+    conn = CreateConnection(DatabasePath())
+
+    if conn is not None:
+        games = UnscheduledGames(conn, 4)[:1]
+        modes = [GREEDY_MODE, MATCHING_MODE]
+        results = TryAlternatives(conn, [lambda snapshotConn, mode=mode: UpdateSeasonSchedule(snapshotConn, games, mode)
+                                         for mode in modes])
+        for mode, (snapshot, scheduleRows) in zip(modes, results):
+            print("Mode: " + mode + ", Rows: " + str(scheduleRows))
+        PromoteAlternative(results, None)
+    else:
+        print("Error! cannot create the database connection.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import hashlib
+import json
+import sys
+from SQLiteConnection import CreateConnection, DatabasePath
+
+# Sport definitions; positions are listed in position ID order (the position ID is the index + 1). A player
+# never plays the same position two innings in a row, and never plays a position from a restricted group two
+# innings in a row. Positions are filled in fillOrder ("reverse" fills the last position first); with fewer
+# players than positions, the positions at the end of the list are the ones left empty
+BASEBALL = {
+    "name": "baseball",
+    "positions": [
+        {"name": "First Base", "group": "infield"},
+        {"name": "Second Base", "group": "infield"},
+        {"name": "Third Base", "group": "infield"},
+        {"name": "Short Stop", "group": "infield"},
+        {"name": "Pitcher", "group": "infield"},
+        {"name": "Right Field", "group": "outfield"},
+        {"name": "Left Field", "group": "outfield"},
+        {"name": "Center Field", "group": "outfield"},
+        {"name": "Home Run", "group": "outfield", "scheduled": False}
+    ],
+    "restrictedGroups": ["outfield"],
+    "fillOrder": "reverse"
+}
+
+SOCCER = {
+    "name": "soccer",
+    "positions": [
+        {"name": "Forward", "group": "attack"},
+        {"name": "Left Midfield", "group": "midfield"},
+        {"name": "Center Midfield", "group": "midfield"},
+        {"name": "Right Midfield", "group": "midfield"},
+        {"name": "Left Back", "group": "defense"},
+        {"name": "Center Back", "group": "defense"},
+        {"name": "Right Back", "group": "defense"},
+        {"name": "Goalkeeper", "group": "goal"}
+    ],
+    "restrictedGroups": ["goal"],
+    "fillOrder": "reverse"
+}
+
+BASKETBALL = {
+    "name": "basketball",
+    "positions": [
+        {"name": "Point Guard", "group": "guard"},
+        {"name": "Shooting Guard", "group": "guard"},
+        {"name": "Small Forward", "group": "forward"},
+        {"name": "Power Forward", "group": "forward"},
+        {"name": "Center", "group": "center"}
+    ],
+    "restrictedGroups": [],
+    "fillOrder": "forward"
+}
+
+# Built in sports by name
+SPORTS = {"baseball": BASEBALL, "soccer": SOCCER, "basketball": BASKETBALL}
+
+# Rows of the positions table that are counted but never given a player in an inning
+UNSCHEDULED_POSITIONS = ["Home Run"]
+
+# Compiled models by definition signature, so every definition is only compiled once per process
+compiledModels = {}
+
+def CompileSportModel(definition):
+    """ This function checks a sport definition and compiles it into the lookup tables the scheduler reads on
+    its hot path: the restricted flag of every position, the positions that are scheduled and the order they
+    are filled in
+    :param definition: a sport definition in the same form as BASEBALL
+    :return: dictionary holding the compiled model
+    """
+
+    signature = hashlib.sha256(json.dumps(definition, sort_keys=True).encode("utf-8")).hexdigest()
+    model = compiledModels.get(signature)
+    if model is not None:
+        return model
+
+    positions = definition.get("positions") or []
+    if not positions or not all(position.get("name") for position in positions):
+        raise ValueError("Every sport needs a list of named positions")
+
+    groups = [position.get("group") for position in positions]
+    restrictedGroups = set(definition.get("restrictedGroups", []))
+    unknownGroups = restrictedGroups - set(groups)
+    if unknownGroups:
+        raise ValueError("Unknown restricted group(s): %s" % ", ".join(sorted(unknownGroups)))
+
+    # The positions that get a player every inning, in position ID order
+    scheduled = [i for i, position in enumerate(positions) if position.get("scheduled", True)]
+
+    # The order the scheduled positions are filled in; an explicit list holds position names
+    fillOrder = definition.get("fillOrder", "forward")
+    if fillOrder == "reverse":
+        fillOrder = list(reversed(scheduled))
+    elif fillOrder == "forward":
+        fillOrder = list(scheduled)
+    else:
+        names = [position["name"] for position in positions]
+        if sorted(fillOrder) != sorted(names[i] for i in scheduled):
+            raise ValueError("fillOrder must list every scheduled position once")
+        fillOrder = [names.index(name) for name in fillOrder]
+
+    model = {
+        "name": definition.get("name", "custom"),
+        "signature": signature,
+        "positionCount": len(positions),
+        "positionNames": tuple(position["name"] for position in positions),
+        "groups": tuple(groups),
+        "restricted": tuple(group in restrictedGroups for group in groups),
+        "scheduled": tuple(scheduled),
+        "fillOrder": tuple(fillOrder)
+    }
+    compiledModels[signature] = model
+    return model
+
+def GetSportModel(name):
+    """ This function returns the compiled model of a built in sport
+    :param name: baseball, soccer or basketball
+    :return: the compiled model
+    """
+
+    if name not in SPORTS:
+        raise ValueError("Unknown sport: %s" % name)
+    return CompileSportModel(SPORTS[name])
+
+def LoadSportModelFile(path):
+    """ This function compiles a sport definition kept in a JSON file
+    :param path: path to the JSON file
+    :return: the compiled model
+    """
+
+    with open(path) as definitionFile:
+        return CompileSportModel(json.load(definitionFile))
+
+def LoadSportModel(conn, name="team", unscheduledNames=UNSCHEDULED_POSITIONS):
+    """ This function compiles the sport of a team database from its positions table: infield positions
+    (infieldFlag = 1) and outfield positions, where outfield is the restricted group and the outfield is filled
+    first; the position IDs must run from 1 without gaps because they index the counters
+    :param conn: database connection object
+    :param name: the name given to the model
+    :param unscheduledNames: names of positions that are counted but never scheduled
+    :return: the compiled model
+    """
+
+    cur = conn.cursor()
+    cur.execute( """SELECT id, name, infieldFlag FROM positions ORDER BY id""" )
+    rows = cur.fetchall()
+    if [row[0] for row in rows] != list(range(1, len(rows) + 1)):
+        raise ValueError("Position IDs must run from 1 without gaps")
+
+    return CompileSportModel({
+        "name": name,
+        "positions": [{"name": row[1], "group": "infield" if row[2] else "outfield",
+                       "scheduled": row[1] not in unscheduledNames} for row in rows],
+        "restrictedGroups": ["outfield"] if any(not row[2] for row in rows) else [],
+        "fillOrder": "reverse"
+    })
+
+def IsRestrictedPosition(model, positionId):
+    """ This function tells whether a position belongs to a restricted group
+    :param model: the compiled model
+    :param positionId: the position ID, or None
+    :return: True or False
+    """
+
+    return positionId is not None and 1 <= positionId <= model["positionCount"] and model["restricted"][positionId - 1]
+
+def StaffedPositions(model, playerCount):
+    """ This function returns the positions filled in an inning, in the order they are filled
+    :param model: the compiled model
+    :param playerCount: the number of players available
+    :return: list of position indexes (position ID - 1)
+    """
+
+    staffed = set(model["scheduled"][:playerCount])
+    return [i for i in model["fillOrder"] if i in staffed]
+
+# Model used when none is given; it matches the columns of the positionCounters and tempCounters tables
+DEFAULT_MODEL = CompileSportModel(BASEBALL)
+
+def main():
+    """ Main program code; prints the model compiled from the positions table, or from the sport name or JSON
+    file passed on the command line
+    """
+
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    if arguments:
+        model = GetSportModel(arguments[0]) if arguments[0] in SPORTS else LoadSportModelFile(arguments[0])
+    else:
+        conn = CreateConnection(DatabasePath())
+        if conn is None:
+            print("Error! cannot create the database connection.")
+            return
+        model = LoadSportModel(conn)
+
+    for i, name in enumerate(model["positionNames"]):
+        print("Position: %d %s, Group: %s, Restricted: %s, Scheduled: %s"
+              % (i + 1, name, model["groups"][i], model["restricted"][i], i in model["scheduled"]))
+    print("Fill order: " + ", ".join(model["positionNames"][i] for i in model["fillOrder"]))
+
+if __name__ == '__main__':
+    main()
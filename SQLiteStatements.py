@@ -0,0 +1,124 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import json
+from SQLiteCounterMatrix import COUNTER_TABLES, COUNTER_COLUMNS
+
+# Columns of the counters tables that statements may name
+COUNTER_TABLE_COLUMNS = frozenset(COUNTER_COLUMNS + ["lastInningOutfieldFlag", "lastPositionId"])
+
+# Columns of the schedule table that statements may name
+SCHEDULE_COLUMNS = ("gameId", "playerId", "positionId", "inningNumber")
+
+# Statement text already built, keyed by shape, table and columns; identifiers are only ever checked and
+# spliced once per key, and every later call gets back the identical string, which is what lets the
+# connection's statement cache (CACHED_STATEMENTS) keep it prepared
+statementCache = {}
+
+def CheckIdentifiers(names, allowed, kind):
+    """ This function makes sure every table or column name spliced into a statement is on a whitelist
+    :param names: the names to check
+    :param allowed: the names that may be used
+    :param kind: "table" or "column", used in the error message
+    """
+
+    for name in names:
+        if name not in allowed:
+            raise ValueError("Unknown %s: %r" % (kind, name))
+
+def CachedStatement(shape, table, columns, build):
+    """ This function returns the statement text for a shape, table and columns, building it the first time
+    :param shape: the name of the statement shape
+    :param table: the table name
+    :param columns: tuple of column names
+    :param build: function that checks the identifiers and returns the statement text
+    :return: the statement text
+    """
+
+    key = (shape, table, columns)
+    sql = statementCache.get(key)
+    if sql is None:
+        sql = build()
+        statementCache[key] = sql
+    return sql
+
+def SelectCounterColumns(table, columns):
+    """ This function returns the statement that reads some counter columns of one player
+    :param table: positionCounters or tempCounters
+    :param columns: the counter columns to read
+    :return: statement taking (playerId,)
+    """
+
+    columns = tuple(columns)
+
+    def Build():
+        CheckIdentifiers([table], COUNTER_TABLES, "table")
+        CheckIdentifiers(columns, COUNTER_TABLE_COLUMNS, "column")
+        return """SELECT %s FROM %s WHERE playerId = ?""" % (", ".join(columns), table)
+
+    return CachedStatement("selectCounterColumns", table, columns, Build)
+
+def UpdateCounterColumns(table, columns):
+    """ This function returns the statement that sets some counter columns of one player
+    :param table: positionCounters or tempCounters
+    :param columns: the counter columns to set
+    :return: statement taking one value per column followed by the playerId
+    """
+
+    columns = tuple(columns)
+
+    def Build():
+        CheckIdentifiers([table], COUNTER_TABLES, "table")
+        CheckIdentifiers(columns, COUNTER_TABLE_COLUMNS, "column")
+        return """UPDATE %s SET %s WHERE playerId = ?""" % (table, ", ".join("%s = ?" % column for column in columns))
+
+    return CachedStatement("updateCounterColumns", table, columns, Build)
+
+def SelectCounterRows(table):
+    """ This function returns the statement that reads the whole counter rows of a list of players in table
+    order; the list is bound as one JSON array, so the text is the same for any number of players
+    :param table: positionCounters or tempCounters
+    :return: statement taking (PlayerListParameter(playerIdList),)
+    """
+
+    def Build():
+        CheckIdentifiers([table], COUNTER_TABLES, "table")
+        return """SELECT * FROM %s WHERE playerId IN (SELECT value FROM json_each(?)) ORDER BY rowid""" % table
+
+    return CachedStatement("selectCounterRows", table, (), Build)
+
+def SelectRoster(table):
+    """ This function returns the statement that reads the player IDs of a counters table in table order
+    :param table: positionCounters or tempCounters
+    :return: statement without parameters
+    """
+
+    def Build():
+        CheckIdentifiers([table], COUNTER_TABLES, "table")
+        return """SELECT playerId FROM %s ORDER BY rowid""" % table
+
+    return CachedStatement("selectRoster", table, (), Build)
+
+def InsertSchedule(columns=SCHEDULE_COLUMNS):
+    """ This function returns the statement that inserts one schedule record
+    :param columns: the schedule columns to set, in the order the values are given
+    :return: statement taking one value per column
+    """
+
+    columns = tuple(columns)
+
+    def Build():
+        CheckIdentifiers(columns, SCHEDULE_COLUMNS, "column")
+        return """INSERT INTO schedule (%s) VALUES(%s)""" % (", ".join(columns), ", ".join("?" * len(columns)))
+
+    return CachedStatement("insertSchedule", "schedule", columns, Build)
+
+def PlayerListParameter(playerIdList):
+    """ This function turns a list of player IDs into the single parameter read by json_each
+    :param playerIdList: a list of player IDs
+    :return: JSON array text
+    """
+
+    return json.dumps(list(playerIdList))
@@ -0,0 +1,44 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import os
+import sys
+
+import pytest
+
+# The modules live in the repository root and import each other by name
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SQLiteBenchmark import GenerateSyntheticTeam
+from SQLiteConnection import CreateConnection
+
+def OpenTeam(path, playerCount=10, gameCount=6, inningCount=4, historyGames=6, seed=0):
+    """ This function creates a synthetic team database for a test
+    :param path: path to the database file
+    :return: (connection, games) tuple; games is the list of (gameId, playerIdList, inningCount) tuples to schedule
+    """
+
+    conn = CreateConnection(str(path), reuse=False)
+    games = GenerateSyntheticTeam(conn, playerCount, gameCount, inningCount, historyGames, seed)
+    return conn, games
+
+@pytest.fixture
+def team(tmp_path):
+    """ A synthetic team of ten players with six history games and six games to schedule
+    """
+
+    conn, games = OpenTeam(tmp_path / "team.db")
+    yield conn, games
+    conn.close()
+
+@pytest.fixture
+def teamPath(tmp_path):
+    """ Path to a synthetic team database whose connection is already closed
+    """
+
+    path = tmp_path / "team.db"
+    conn, games = OpenTeam(path)
+    conn.close()
+    return str(path)
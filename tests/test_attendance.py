@@ -0,0 +1,42 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteAttendance import LoadAvailabilityIndex, AvailableMask, AvailablePlayers, RecordAttendance
+from SQLiteBuildSchedule import UpdateEntireSchedule
+from SQLiteLeagueSchedule import UnscheduledGames
+
+def test_everybody_is_available_without_attendance_records(team):
+    conn, games = team
+    index = LoadAvailabilityIndex(conn)
+    assert AvailablePlayers(index, 7) == list(range(1, 11))
+    assert AvailableMask(index, 7) == (1 << 10) - 1
+
+def test_absences_are_read_from_the_attendance_table(team):
+    conn, games = team
+    RecordAttendance(conn, 7, presentPlayerIds=[1, 2], absentPlayerIds=[3, 5])
+    RecordAttendance(conn, 8, absentPlayerIds=[10])
+    index = LoadAvailabilityIndex(conn)
+    assert AvailablePlayers(index, 7) == [1, 2, 4, 6, 7, 8, 9, 10]
+    assert AvailablePlayers(index, 8) == list(range(1, 10))
+    assert AvailablePlayers(index, 9) == list(range(1, 11))
+
+def test_later_answers_replace_earlier_ones(team):
+    conn, games = team
+    RecordAttendance(conn, 7, absentPlayerIds=[3])
+    RecordAttendance(conn, 7, presentPlayerIds=[3])
+    assert 3 in AvailablePlayers(LoadAvailabilityIndex(conn), 7)
+
+def test_scheduler_skips_absent_players(team, capsys):
+    conn, games = team
+    RecordAttendance(conn, 7, absentPlayerIds=[2, 4])
+    UpdateEntireSchedule(conn, 8, 7, 4, useCache=False)
+    scheduled = set(row[0] for row in conn.execute("SELECT playerId FROM schedule WHERE gameId = 7"))
+    assert scheduled == {1, 3, 5, 6, 7, 8, 9, 10}
+
+def test_unscheduled_games_use_attendance(team):
+    conn, games = team
+    RecordAttendance(conn, 12, absentPlayerIds=[1])
+    unscheduled = dict((gameId, playerIdList) for gameId, playerIdList, inningCount in UnscheduledGames(conn, 4))
+    assert 1 not in unscheduled[12] and 1 in unscheduled[11]
@@ -0,0 +1,41 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+from conftest import OpenTeam
+from SQLiteBenchmark import ENGINES, STORAGES, ROW_ENGINE, RunBenchmark, SummarizeBenchmark
+from SQLiteBuildSchedule import GREEDY_MODE
+
+def test_synthetic_teams_are_repeatable(tmp_path):
+    first, firstGames = OpenTeam(tmp_path / "first.db", seed=3)
+    second, secondGames = OpenTeam(tmp_path / "second.db", seed=3)
+    assert firstGames == secondGames
+    assert first.execute("SELECT * FROM positionCounters").fetchall() == second.execute("SELECT * FROM positionCounters").fetchall()
+    assert len(firstGames) == 6 and all(playerIdList for gameId, playerIdList, inningCount in firstGames)
+    first.close()
+    second.close()
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("storage", STORAGES)
+def test_every_engine_and_storage_is_measured(engine, storage):
+    results = RunBenchmark(engine, storage, teamCount=2, playerCount=8, gameCount=3, inningCount=3, historyGames=3)
+    assert len(results) == 6
+    assert {result["team"] for result in results} == {0, 1}
+    for result in results:
+        assert result["seconds"] >= 0 and result["statements"] > 0 and result["commits"] > 0 and result["peakBytes"] > 0
+
+    summary = SummarizeBenchmark(results)
+    assert summary["games"] == 6
+    assert summary["commitsPerGame"] == sum(result["commits"] for result in results) / 6.0
+
+def test_counter_matrix_commits_less_than_the_row_engine():
+    rowSummary = SummarizeBenchmark(RunBenchmark(ROW_ENGINE, ":memory:", gameCount=2, inningCount=3))
+    greedySummary = SummarizeBenchmark(RunBenchmark(GREEDY_MODE, ":memory:", gameCount=2, inningCount=3))
+    assert greedySummary["commitsPerGame"] < rowSummary["commitsPerGame"]
+    assert greedySummary["commitsPerGame"] == 1.0
+    assert greedySummary["statementsPerGame"] < rowSummary["statementsPerGame"]
+
+def test_empty_results_summarize_to_zero():
+    assert SummarizeBenchmark([])["games"] == 0
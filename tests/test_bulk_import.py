@@ -0,0 +1,89 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import json
+import sqlite3
+import pytest
+from SQLiteBenchmark import POSITIONS
+from SQLiteBulkImport import ImportLeague
+from SQLiteConnection import CreateConnection
+from SQLiteCreateTables import CreateAllTables
+
+@pytest.fixture
+def league(tmp_path):
+    conn = CreateConnection(str(tmp_path / "league.db"), reuse=False)
+    CreateAllTables(conn)
+    with conn:
+        conn.executemany("INSERT INTO positions(name, infieldFlag) VALUES(?, ?)", POSITIONS)
+
+    roster = tmp_path / "roster.csv"
+    roster.write_text("firstName,lastName\n" + "".join("F%d,L%d\n" % (i, i) for i in range(1, 6)))
+    games = tmp_path / "games.json"
+    games.write_text(json.dumps([{"date": "2022-05-%02d" % i, "vs": "X", "startTime": "10:00", "homeFlag": i % 2}
+                                 for i in range(1, 4)]))
+    yield conn, tmp_path, str(roster), str(games)
+    conn.close()
+
+def WriteCounters(tmp_path, records):
+    path = tmp_path / "counters.jsonl"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+def test_roster_games_and_counters_are_imported(league):
+    conn, tmp_path, roster, games = league
+    counters = WriteCounters(tmp_path, [{"playerId": 1, "pitcherCounter": 3, "lastPositionId": 2},
+                                        {"playerId": 2, "pitcherCounter": 4}])
+    report = ImportLeague(conn, roster, games, counters)
+    assert (report["players"], report["games"], report["positionCounters"], report["tempCounters"]) == (5, 3, 5, 5)
+    assert report["counterUpdates"] == 4
+    for table in ("positionCounters", "tempCounters"):
+        assert conn.execute("SELECT playerId, pitcherCounter, lastPositionId FROM %s ORDER BY playerId" % table).fetchall() == \
+            [(1, 3, 2), (2, 4, None), (3, 0, None), (4, 0, None), (5, 0, None)]
+
+def test_counter_updates_count_the_rows_changed(league):
+    conn, tmp_path, roster, games = league
+    counters = WriteCounters(tmp_path, [{"playerId": 1, "pitcherCounter": 3}, {"playerId": 99, "pitcherCounter": 3}])
+    assert ImportLeague(conn, roster, games, counters)["counterUpdates"] == 2
+
+@pytest.mark.parametrize("records, message", [([{"pitcherCounter": 3}], "missing: playerId"),
+                                              ([{"playerId": 1, "noSuchCounter": 3}], "Unknown counter")])
+def test_bad_counter_records_are_rejected_before_anything_is_written(league, records, message):
+    conn, tmp_path, roster, games = league
+    with pytest.raises(ValueError, match=message):
+        ImportLeague(conn, roster, games, WriteCounters(tmp_path, records))
+    assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 0
+
+def test_game_without_a_date_is_rejected(league):
+    conn, tmp_path, roster, games = league
+    gamesPath = tmp_path / "undated.json"
+    gamesPath.write_text(json.dumps([{"vs": "X"}]))
+    with pytest.raises(ValueError, match="Game record 1 is missing: date"):
+        ImportLeague(conn, roster, str(gamesPath))
+
+def test_failed_import_keeps_nothing(league):
+    conn, tmp_path, roster, games = league
+    counters = WriteCounters(tmp_path, [{"playerId": 1, "lastPositionId": 99}])
+    with pytest.raises(sqlite3.IntegrityError):
+        ImportLeague(conn, roster, games, counters)
+    assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM positionCounters").fetchone()[0] == 0
+
+def test_empty_csv_cells_keep_the_table_values(league):
+    conn, tmp_path, roster, games = league
+    counters = tmp_path / "counters.csv"
+    counters.write_text("playerId,pitcherCounter,pitcherLastGame\n1,3,\n2,,5\n")
+    report = ImportLeague(conn, roster, games, str(counters))
+    assert report["counterUpdates"] == 4
+    rows = conn.execute("SELECT playerId, pitcherCounter, pitcherLastGame FROM tempCounters WHERE playerId <= 2 ORDER BY playerId").fetchall()
+    assert rows == [(1, 3, 0), (2, 0, 5)]
+
+@pytest.mark.parametrize("text", ["playerId,pitcherCounter\n1,3,7\n", "playerId,pitcherCounter,pitcherLastGame\n1,3\n"])
+def test_ragged_csv_rows_are_rejected(league, text):
+    conn, tmp_path, roster, games = league
+    counters = tmp_path / "counters.csv"
+    counters.write_text(text)
+    with pytest.raises(ValueError, match="record 1"):
+        ImportLeague(conn, roster, games, str(counters))
+    assert conn.execute("SELECT count(*) FROM players").fetchone()[0] == 0
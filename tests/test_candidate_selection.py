@@ -0,0 +1,62 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteBuildSchedule import SelectNextPlayerForPosition, FindNextPlayerForPosition, LoadCandidateCounters
+from SQLiteCounterMatrix import PositionColumns
+
+COLUMNS = PositionColumns(0)
+
+def Row(playerId, counter, lastGame=0, lastInning=0, lastPositionId=2, outfieldFlag=0, positionIndex=0):
+    """ Builds a candidate row with the counters for one position
+    """
+
+    columns = PositionColumns(positionIndex)
+    return {"playerId": playerId, columns[0]: counter, columns[1]: lastGame, columns[2]: lastInning,
+            "lastPositionId": lastPositionId, "lastInningOutfieldFlag": outfieldFlag}
+
+def test_lowest_counter_wins():
+    rows = [Row(1, 3), Row(2, 1), Row(3, 2)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [1, 2, 3], 1) == 2
+
+def test_ties_fall_through_last_game_last_inning_then_table_order():
+    rows = [Row(1, 1, 4, 2), Row(2, 1, 3, 4), Row(3, 1, 3, 1), Row(4, 1, 3, 1)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [1, 2, 3, 4], 1) == 3
+
+def test_player_who_played_the_position_last_is_skipped():
+    rows = [Row(1, 0, lastPositionId=1), Row(2, 5)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [1, 2], 1) == 2
+
+def test_null_last_position_is_never_eligible():
+    rows = [Row(1, 0, lastPositionId=None), Row(2, 5)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [1, 2], 1) == 2
+
+def test_outfield_twice_in_a_row_is_skipped():
+    rows = [Row(1, 0, outfieldFlag=1, positionIndex=6), Row(2, 5, positionIndex=6)]
+    assert SelectNextPlayerForPosition(rows, *PositionColumns(6), [1, 2], 7) == 2
+
+def test_unavailable_players_are_skipped():
+    rows = [Row(1, 0), Row(2, 5)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [2], 1) == 2
+
+def test_falls_back_to_first_player_when_nobody_is_eligible():
+    rows = [Row(1, 0, lastPositionId=1), Row(2, 0, lastPositionId=1)]
+    assert SelectNextPlayerForPosition(rows, *COLUMNS, [2, 1], 1) == 2
+
+def test_no_players_returns_none():
+    assert SelectNextPlayerForPosition([Row(1, 0)], *COLUMNS, [], 1) is None
+
+def test_candidates_are_loaded_in_table_order(team):
+    conn, games = team
+    rows = LoadCandidateCounters(conn, [7, 2, 5])
+    assert [row["playerId"] for row in rows] == [2, 5, 7]
+
+def test_database_selection_matches_in_memory_selection(team):
+    conn, games = team
+    playerIdList = [1, 3, 4, 6, 9]
+    candidateRows = LoadCandidateCounters(conn, playerIdList)
+    for positionIndex in range(8):
+        columns = PositionColumns(positionIndex)
+        expected = SelectNextPlayerForPosition(candidateRows, *columns, playerIdList, positionIndex + 1)
+        assert FindNextPlayerForPosition(conn, *columns, playerIdList, positionIndex + 1) == expected
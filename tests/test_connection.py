@@ -0,0 +1,57 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import gc
+import sqlite3
+import threading
+import weakref
+import pytest
+from SQLiteConnection import CreateConnection, CloseConnections
+
+def test_connections_are_reused_per_thread(teamPath):
+    conn = CreateConnection(teamPath)
+    assert CreateConnection(teamPath) is conn
+    assert CreateConnection(teamPath, reuse=False) is not conn
+    assert CreateConnection(teamPath, {"cache_size": -1000}) is not conn
+    CloseConnections()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+class TrackedConnection(sqlite3.Connection):
+    """ Connection class that can be weakly referenced """
+
+def test_connections_are_released_when_their_thread_exits(teamPath, monkeypatch):
+    connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda *args, **kwargs: connect(*args, factory=TrackedConnection, **kwargs))
+    refs = []
+    mainConnection = CreateConnection(teamPath)
+
+    def Worker():
+        conn = CreateConnection(teamPath)
+        refs.append(weakref.ref(conn))
+        assert conn is not mainConnection
+
+    thread = threading.Thread(target=Worker)
+    thread.start()
+    thread.join()
+    gc.collect()
+    assert refs[0]() is None
+    assert CreateConnection(teamPath) is mainConnection
+    CloseConnections()
+
+def test_pragmas_are_applied(teamPath):
+    conn = CreateConnection(teamPath, reuse=False)
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    with pytest.raises(ValueError):
+        CreateConnection(teamPath, {"cache_size": "1; DROP TABLE players"}, reuse=False)
+    conn.close()
+
+def test_innings_accept_known_positions(team):
+    conn, games = team
+    conn.execute("INSERT INTO innings (gameId, playerId, positionId, inningNumber) VALUES(7, 1, 1, 1)")
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO innings (gameId, playerId, positionId, inningNumber) VALUES(7, 2, 99, 1)")
@@ -0,0 +1,25 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+
+from SQLiteCopyTable import CopyTable
+
+def test_replace_copies_the_primary_counters(team):
+    conn, games = team
+    conn.execute("UPDATE tempCounters SET firstBaseCounter = firstBaseCounter + 5")
+    conn.commit()
+    CopyTable(conn, "tempCounters", replace=True)
+    assert conn.execute("SELECT * FROM tempCounters ORDER BY rowid").fetchall() == \
+        conn.execute("SELECT * FROM positionCounters ORDER BY rowid").fetchall()
+
+@pytest.mark.parametrize("tableName", ["positionCounters", "players", "tempCounters; DROP TABLE players"])
+def test_replace_refuses_unknown_tables(team, tableName):
+    conn, games = team
+    before = conn.execute("SELECT count(*) FROM positionCounters").fetchone()[0]
+    with pytest.raises(ValueError):
+        CopyTable(conn, tableName, replace=True)
+    assert conn.execute("SELECT count(*) FROM positionCounters").fetchone()[0] == before
+    assert conn.execute("SELECT count(*) FROM players").fetchone()[0] > 0
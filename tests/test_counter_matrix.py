@@ -0,0 +1,104 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import random
+
+import pytest
+
+from SQLiteBuildSchedule import SelectNextPlayerForPosition, LoadCandidateCounters
+from SQLiteCounterMatrix import LoadCounterMatrix, SaveCounterMatrix, FindNextPlayerInMatrix, UpdateCounterMatrix
+from SQLiteCounterMatrix import CopyCounterMatrix, GetCounterMatrixCell, PositionColumns, PlayerRows, NULL_POSITION
+from SQLiteSportModel import GetSportModel, LoadSportModel
+
+def test_matrix_holds_the_table(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    row = conn.execute("SELECT %s FROM tempCounters WHERE playerId = 4" % ", ".join(PositionColumns(6))).fetchone()
+    assert GetCounterMatrixCell(matrix, 4, 6) == list(row)
+    assert list(matrix["playerIds"]) == list(range(1, 11))
+
+def test_matrix_selection_matches_row_selection(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    rnd = random.Random(1)
+    for i in range(200):
+        playerIdList = rnd.sample(range(1, 11), rnd.randint(1, 10))
+        positionIndex = rnd.randrange(8)
+        candidateRows = LoadCandidateCounters(conn, playerIdList)
+        expected = SelectNextPlayerForPosition(candidateRows, *PositionColumns(positionIndex), playerIdList,
+                                               positionIndex + 1)
+        assert FindNextPlayerInMatrix(matrix, playerIdList, positionIndex) == expected
+
+def test_null_last_position_is_never_eligible(team):
+    conn, games = team
+    with conn:
+        conn.execute("UPDATE tempCounters SET lastPositionId = NULL WHERE playerId = 1")
+        conn.execute("UPDATE tempCounters SET lastPositionId = 5, firstBaseCounter = 9 WHERE playerId = 2")
+        conn.execute("UPDATE tempCounters SET firstBaseCounter = 0 WHERE playerId = 1")
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    assert matrix["lastPositionIds"][0] == NULL_POSITION
+    assert FindNextPlayerInMatrix(matrix, [1, 2], 0) == 2
+
+def test_update_moves_counter_and_last_position(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    before = GetCounterMatrixCell(matrix, 3, 7)
+    UpdateCounterMatrix(matrix, 99, 3, 7, 2)
+    assert GetCounterMatrixCell(matrix, 3, 7) == [before[0] + 1, 99, 2]
+    assert matrix["lastPositionIds"][2] == 8
+    assert matrix["outfieldFlags"][2] == 1
+    UpdateCounterMatrix(matrix, 99, 3, 0, 3)
+    assert matrix["outfieldFlags"][2] == 0
+
+def test_save_writes_the_matrix_back(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    UpdateCounterMatrix(matrix, 50, 5, 2, 1)
+    with conn:
+        SaveCounterMatrix(conn, matrix, "tempCounters", [5])
+    assert LoadCounterMatrix(conn, "tempCounters")["values"] == matrix["values"]
+
+def test_copy_is_independent(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    copy = CopyCounterMatrix(matrix)
+    UpdateCounterMatrix(copy, 50, 5, 2, 1)
+    assert copy["values"] != matrix["values"]
+
+@pytest.mark.parametrize("sport", ["soccer", "basketball"])
+def test_other_sports_are_pointed_to_the_normalized_tables(team, sport):
+    conn, games = team
+    with pytest.raises(ValueError, match="LoadNormalizedCounterMatrix"):
+        LoadCounterMatrix(conn, "tempCounters", GetSportModel(sport))
+
+def test_team_model_with_the_default_positions_loads(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters", LoadSportModel(conn))
+    assert matrix["values"] == LoadCounterMatrix(conn, "tempCounters")["values"]
+
+def test_packed_keys_order_like_tuples(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    stride = matrix["positionCount"] * 3
+    rnd = random.Random(2)
+    for i in range(200):
+        # Equal values are common so the tie breakers decide, and extreme values must not overflow the key
+        for offset in range(len(matrix["values"])):
+            matrix["values"][offset] = rnd.choice([0, 1, 2, -3, 2 ** 40, 2 ** 63 - 1])
+        playerIdList = rnd.sample(range(1, 11), rnd.randint(1, 10))
+        positionIndex = rnd.randrange(8)
+        rows = [row for row in range(10) if matrix["playerIds"][row] in playerIdList
+                and matrix["lastPositionIds"][row] not in (NULL_POSITION, positionIndex + 1)
+                and not (positionIndex >= 5 and matrix["outfieldFlags"][row])]
+        expected = playerIdList[0] if not rows else matrix["playerIds"][min(
+            rows, key=lambda row: tuple(matrix["values"][row * stride + positionIndex * 3:row * stride + positionIndex * 3 + 3]))]
+        assert FindNextPlayerInMatrix(matrix, playerIdList, positionIndex) == expected
+
+def test_row_index_is_shared_by_copies(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    assert PlayerRows(matrix) == dict((playerId, (playerId - 1,)) for playerId in range(1, 11))
+    assert PlayerRows(CopyCounterMatrix(matrix)) is PlayerRows(matrix)
+    assert GetCounterMatrixCell(matrix, 99, 0) is None
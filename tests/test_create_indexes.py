@@ -0,0 +1,42 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sqlite3
+import pytest
+from SQLiteCreateIndexes import CreateAllIndexes, FindScheduleConflicts
+
+def IndexNames(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+
+def test_all_indexes_are_created(team):
+    conn, games = team
+    assert CreateAllIndexes(conn) == 0
+    assert {"scheduleGameInningPosition", "scheduleGameInningPlayer", "schedulePlayer", "inningsGameInningPosition",
+            "inningsGameInningPlayer", "positionCountersPlayer", "tempCountersPlayer"} <= IndexNames(conn)
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()[0] == 1
+
+def test_unique_indexes_enforce_one_player_per_position_per_inning(team):
+    conn, games = team
+    CreateAllIndexes(conn)
+    conn.execute("INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(7, 1, 1, 1)")
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(7, 2, 1, 1)")
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(7, 1, 2, 1)")
+
+def test_counter_lookups_use_the_player_index(team):
+    conn, games = team
+    CreateAllIndexes(conn)
+    plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN SELECT * FROM tempCounters WHERE playerId = ?", (1,)))
+    assert "tempCountersPlayer" in plan
+
+def test_conflicting_records_are_reported(team):
+    conn, games = team
+    conn.executemany("INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(?, ?, ?, ?)",
+                     [(7, 1, 1, 1), (7, 2, 1, 1)])
+    conn.commit()
+    assert CreateAllIndexes(conn) > 0
+    assert "scheduleGameInningPosition" not in IndexNames(conn)
+    assert FindScheduleConflicts(conn) == [(7, 1, 1, 2, "position")]
@@ -0,0 +1,48 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+from SQLiteBuildSchedule import UpdateSeasonSchedule
+from SQLiteFairnessAnalytics import Gini, Variance, PositionHistory, FairnessReport, sql_select_position_history
+from SQLiteInningAssignment import ScheduleRuleViolations
+
+def test_gini_and_variance():
+    assert Gini([]) == 0.0 and Gini([0, 0]) == 0.0
+    assert Gini([1, 1, 1, 1]) == 0.0
+    assert Gini([0, 0, 0, 4]) == pytest.approx(0.75)
+    assert Variance([1, 3]) == 1.0
+
+def test_sitting_out_an_inning_breaks_a_repeat():
+    # Player 1 plays first base in innings 1 and 3 with inning 2 on the bench; player 2 repeats in 1 and 2
+    scheduleRows = [(7, 1, 1, 1), (7, 1, 1, 3), (7, 2, 2, 1), (7, 2, 2, 2)]
+    assert sorted(PositionHistory(scheduleRows)) == [(1, 1, 2, 0), (2, 2, 2, 1)]
+
+def test_database_and_memory_history_match_the_scheduler_rule(team):
+    conn, games = team
+    scheduleRows = UpdateSeasonSchedule(conn, games)
+    with conn:
+        conn.executemany("INSERT INTO schedule (gameId, playerId, positionId, inningNumber) VALUES(?, ?, ?, ?)",
+                         [(1, 1, 1, 1), (1, 1, 1, 3), (1, 2, 2, 1), (1, 2, 2, 2)])
+    scheduleRows += [(1, 1, 1, 1), (1, 1, 1, 3), (1, 2, 2, 1), (1, 2, 2, 2)]
+
+    history = sorted(conn.execute(sql_select_position_history).fetchall())
+    assert history == sorted(PositionHistory(scheduleRows))
+    assert sum(row[3] for row in history) == ScheduleRuleViolations(scheduleRows)["repeatPositions"]
+
+def test_report_is_cached_until_the_schedule_changes(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games[:2])
+    report = FairnessReport(conn)
+    assert FairnessReport(conn) is report
+    UpdateSeasonSchedule(conn, games[2:])
+    updated = FairnessReport(conn)
+    assert updated is not report
+    assert updated["team"]["innings"] == conn.execute("SELECT COUNT(*) FROM schedule").fetchone()[0]
+
+def test_history_reads_the_schedule_table_once(team):
+    conn, games = team
+    plan = [row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql_select_position_history)]
+    assert not any("CORRELATED" in step for step in plan)
+    assert len([step for step in plan if "schedule" in step and ("SCAN" in step or "SEARCH" in step)]) == 1
@@ -0,0 +1,93 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sqlite3
+
+import pytest
+
+import SQLiteBuildSchedule
+from SQLiteBuildSchedule import FlushScheduleUpdates, UpdateEntireSchedule, ScheduleGameSession
+from SQLiteConnection import CreateConnection
+from SQLiteCounterMatrix import LoadCounterMatrix, UpdateCounterMatrix, CopyCounterMatrix
+from SQLiteScheduleCache import ReplaySchedule
+
+def CountCommits(conn):
+    """ Traces the connection and returns the list the COMMIT statements are collected in
+    """
+
+    commits = []
+    conn.set_trace_callback(lambda statement: commits.append(statement) if statement.upper().startswith("COMMIT") else None)
+    return commits
+
+def test_game_is_written_with_one_commit(team, capsys):
+    conn, games = team
+    gameId, playerIdList, inningCount = games[0]
+    commits = CountCommits(conn)
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    conn.set_trace_callback(None)
+    assert len(commits) == 1
+    count = conn.execute("SELECT count(*) FROM schedule WHERE gameId = ?", (gameId,)).fetchone()[0]
+    assert count == inningCount * min(8, len(playerIdList))
+
+def test_failed_write_keeps_nothing(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    before = conn.execute("SELECT * FROM tempCounters ORDER BY id").fetchall()
+    UpdateCounterMatrix(matrix, 7, 1, 0, 1)
+
+    # The second record references a game that does not exist
+    scheduleRows = [(7, 1, 1, 1), (9999, 2, 2, 1)]
+    with pytest.raises(sqlite3.IntegrityError):
+        FlushScheduleUpdates(conn, scheduleRows, matrix, [1, 2])
+    assert conn.execute("SELECT count(*) FROM schedule").fetchone()[0] == 0
+    assert conn.execute("SELECT * FROM tempCounters ORDER BY id").fetchall() == before
+
+def test_session_rebuilds_after_another_session_wrote_its_players(teamPath, monkeypatch):
+    conn = CreateConnection(teamPath, reuse=False)
+    other = CreateConnection(teamPath, reuse=False)
+    start = LoadCounterMatrix(conn, "tempCounters")
+    original = SQLiteBuildSchedule.ScheduleGameInMatrix
+    otherRows = []
+    builds = []
+
+    # The first build of game 7 is overtaken by a session for game 8 that shares players with it
+    def BuildAfterAnotherSession(matrix, playerIdList, playerCount, gameNumber, inningCount, mode):
+        if gameNumber == 7:
+            builds.append(gameNumber)
+            if not otherRows:
+                otherRows.extend(ScheduleGameSession(other, [1, 2, 4, 5, 7, 8, 9], 7, 8, 2, useCache=False))
+        return original(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+
+    monkeypatch.setattr(SQLiteBuildSchedule, "ScheduleGameInMatrix", BuildAfterAnotherSession)
+    scheduleRows = ScheduleGameSession(conn, [1, 2, 3, 4, 5, 6, 7, 9, 10], 9, 7, 2, useCache=False)
+    assert len(builds) == 2
+
+    # Both games count, as if they had been scheduled one after the other
+    expected = CopyCounterMatrix(start)
+    ReplaySchedule(expected, otherRows)
+    ReplaySchedule(expected, scheduleRows)
+    assert LoadCounterMatrix(conn, "tempCounters")["values"] == expected["values"]
+    assert conn.execute("SELECT count(*) FROM schedule").fetchone()[0] == len(otherRows) + len(scheduleRows)
+    other.close()
+    conn.close()
+
+def test_sessions_for_other_players_do_not_rebuild(teamPath, monkeypatch):
+    conn = CreateConnection(teamPath, reuse=False)
+    other = CreateConnection(teamPath, reuse=False)
+    original = SQLiteBuildSchedule.ScheduleGameInMatrix
+    builds = []
+
+    def BuildAfterAnotherSession(matrix, playerIdList, playerCount, gameNumber, inningCount, mode):
+        if gameNumber == 7:
+            builds.append(gameNumber)
+            if len(builds) == 1:
+                ScheduleGameSession(other, [6, 7, 8], 3, 8, 1, useCache=False)
+        return original(matrix, playerIdList, playerCount, gameNumber, inningCount, mode)
+
+    monkeypatch.setattr(SQLiteBuildSchedule, "ScheduleGameInMatrix", BuildAfterAnotherSession)
+    ScheduleGameSession(conn, [1, 2, 3, 4, 5], 5, 7, 1, useCache=False)
+    assert builds == [7]
+    other.close()
+    conn.close()
@@ -0,0 +1,89 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import itertools
+import random
+
+import pytest
+
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, ScheduleGameInMatrix, CompareAssignmentModes
+from SQLiteCounterMatrix import LoadCounterMatrix
+from SQLiteInningAssignment import MinCostAssignment, InningCostMatrix, FindInningAssignmentInMatrix, ScheduleRuleViolations
+
+def test_assignment_is_optimal():
+    rnd = random.Random(5)
+    for i in range(50):
+        rows = rnd.randint(1, 5)
+        columns = rnd.randint(rows, 6)
+        costs = [[rnd.randint(0, 20) for j in range(columns)] for k in range(rows)]
+        result = MinCostAssignment(costs)
+        assert len(set(result)) == rows
+        best = min(sum(costs[k][column] for k, column in enumerate(choice))
+                   for choice in itertools.permutations(range(columns), rows))
+        assert sum(costs[k][column] for k, column in enumerate(result)) == best
+
+def test_inning_gets_a_different_player_for_every_position(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    assignment = FindInningAssignmentInMatrix(matrix, list(range(1, 11)), list(reversed(range(8))))
+    assert [positionIndex for positionIndex, playerId in assignment] == list(reversed(range(8)))
+    assert len(set(playerId for positionIndex, playerId in assignment)) == 8
+
+def test_matching_never_repeats_when_greedy_does_not_have_to(team):
+    conn, games = team
+    for mode in (GREEDY_MODE, MATCHING_MODE):
+        matrix = LoadCounterMatrix(conn, "tempCounters")
+        scheduleRows = []
+        for gameId, playerIdList, inningCount in games:
+            scheduleRows.extend(ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameId, inningCount, mode))
+        violations = ScheduleRuleViolations(scheduleRows)
+        if mode == GREEDY_MODE:
+            greedy = violations
+    assert sum(violations.values()) <= sum(greedy.values())
+
+@pytest.mark.parametrize("mode", [GREEDY_MODE, MATCHING_MODE])
+def test_player_without_counters_row(team, mode):
+    conn, games = team
+    with conn:
+        conn.execute("INSERT INTO players(id, firstName, lastName) VALUES(99, 'New', 'Player')")
+
+    # Both modes build the game instead of failing on the missing row
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    scheduleRows = ScheduleGameInMatrix(matrix, [99] + list(range(1, 9)), 8, 20, 2, mode)
+    assert len(scheduleRows) == 16
+
+    # With every player needed the new player gets a position
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    scheduleRows = ScheduleGameInMatrix(matrix, [1, 2, 99], 3, 20, 1, mode)
+    assert sorted(playerId for gameId, playerId, positionId, inning in scheduleRows) == [1, 2, 99]
+
+def test_cost_of_player_without_counters_row(team):
+    conn, games = team
+    with conn:
+        conn.execute("UPDATE tempCounters SET lastPositionId = 5, lastInningOutfieldFlag = 0 WHERE playerId = 1")
+    matrix = LoadCounterMatrix(conn, "tempCounters")
+    costs = InningCostMatrix(matrix, [1, 99], [0, 1])
+    assert costs[0][1] == costs[1][1]
+    assert costs[0][1] > costs[0][0]
+
+def test_modes_are_compared_without_writing(team):
+    conn, games = team
+    tables = ("positionCounters", "tempCounters", "schedule")
+    before = [conn.execute("SELECT * FROM %s ORDER BY rowid" % table).fetchall() for table in tables]
+    report = CompareAssignmentModes(conn, games)
+    assert set(report) == {GREEDY_MODE, MATCHING_MODE}
+    for mode, result in report.items():
+        assert set(result) == {"seconds", "repeatPositions", "repeatOutfield"}
+        assert result["seconds"] >= 0
+
+        # The counts are the ones of the schedule the mode builds from positionCounters
+        matrix = LoadCounterMatrix(conn, "positionCounters")
+        scheduleRows = []
+        for gameId, playerIdList, inningCount in games:
+            scheduleRows.extend(ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameId, inningCount, mode))
+        violations = ScheduleRuleViolations(scheduleRows)
+        assert (result["repeatPositions"], result["repeatOutfield"]) == (violations["repeatPositions"], violations["repeatOutfield"])
+    assert [conn.execute("SELECT * FROM %s ORDER BY rowid" % table).fetchall() for table in tables] == before
+    assert not conn.in_transaction
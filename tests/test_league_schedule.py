@@ -0,0 +1,43 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from conftest import OpenTeam
+from SQLiteConnection import CreateConnection
+from SQLiteLeagueSchedule import UnscheduledGames, UpdateLeagueSchedule
+
+def test_every_team_is_scheduled(tmp_path):
+    paths = []
+    teamGames = []
+    for seed in range(3):
+        path = str(tmp_path / ("team%d.db" % seed))
+        conn, games = OpenTeam(path, seed=seed)
+        conn.close()
+        paths.append(path)
+        teamGames.append(games)
+
+    report = UpdateLeagueSchedule([paths[0], (paths[1], teamGames[1]), paths[2]], workers=2)
+    assert report["failed"] == 0
+    assert [result["database"] for result in report["teams"]] == paths
+    assert report["teams"][1]["games"] == len(teamGames[1])
+
+    for path, result in zip(paths, report["teams"]):
+        conn = CreateConnection(path, reuse=False)
+        assert conn.execute("SELECT count(*) FROM schedule").fetchone()[0] == result["rows"]
+        conn.close()
+
+    # Teams without a games list get every game that had no schedule records
+    for path in (paths[0], paths[2]):
+        conn = CreateConnection(path, reuse=False)
+        assert UnscheduledGames(conn, 4) == []
+        conn.close()
+
+def test_a_failing_team_does_not_stop_the_league(tmp_path, teamPath):
+    # The parent directory does not exist, so the database cannot be opened or created
+    broken = tmp_path / "missing" / "broken.db"
+    report = UpdateLeagueSchedule([str(broken), teamPath], workers=1)
+    assert report["failed"] == 1
+    assert report["teams"][0]["error"]
+    assert not broken.parent.exists()
+    assert report["teams"][1]["error"] is None and report["teams"][1]["rows"] > 0
@@ -0,0 +1,56 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteBuildSchedule import UpdateSeasonSchedule
+from SQLiteLineupCards import CreateLineupCards, GetLineupCard
+
+# The scheduleView join for one game, in lineup card order
+SCHEDULE_VIEW = """SELECT schedule.id, games.date, schedule.inningNumber, positions.name, players.firstName
+                   FROM schedule
+                   INNER JOIN games ON games.id = schedule.gameId
+                   INNER JOIN positions ON positions.id = schedule.positionId
+                   INNER JOIN players ON players.id = schedule.playerId
+                   WHERE schedule.gameId = ? ORDER BY schedule.inningNumber, schedule.positionId"""
+
+def AssertCardsMatchView(conn, games):
+    for gameId, playerIdList, inningCount in games:
+        assert GetLineupCard(conn, gameId) == conn.execute(SCHEDULE_VIEW, (gameId,)).fetchall()
+
+def test_existing_schedule_is_materialized(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games[:3])
+    assert CreateLineupCards(conn)
+    assert len(GetLineupCard(conn, games[0][0])) > 0
+    AssertCardsMatchView(conn, games)
+
+def test_schedule_changes_reach_the_cards(team):
+    conn, games = team
+    assert CreateLineupCards(conn)
+    UpdateSeasonSchedule(conn, games)
+    AssertCardsMatchView(conn, games)
+
+    gameId = games[0][0]
+    with conn:
+        conn.execute("UPDATE schedule SET inningNumber = inningNumber + 10 WHERE gameId = ? AND inningNumber = 1", (gameId,))
+        conn.execute("DELETE FROM schedule WHERE gameId = ? AND inningNumber = 2", (gameId,))
+    AssertCardsMatchView(conn, games)
+
+def test_player_game_and_position_changes_reach_the_cards(team):
+    conn, games = team
+    assert CreateLineupCards(conn)
+    UpdateSeasonSchedule(conn, games)
+    with conn:
+        conn.execute("UPDATE players SET firstName = 'Renamed' WHERE id = ?", (games[0][1][0],))
+        conn.execute("UPDATE games SET date = '2022-01-01' WHERE id = ?", (games[1][0],))
+        conn.execute("UPDATE positions SET name = 'Catcher' WHERE id = 5")
+    AssertCardsMatchView(conn, games)
+    assert any(row[4] == "Renamed" for row in GetLineupCard(conn, games[0][0]))
+
+def test_creating_twice_keeps_one_row_per_schedule_record(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games)
+    assert CreateLineupCards(conn)
+    assert CreateLineupCards(conn)
+    assert conn.execute("SELECT COUNT(*) FROM lineupCards").fetchone()[0] == conn.execute("SELECT COUNT(*) FROM schedule").fetchone()[0]
@@ -0,0 +1,77 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+from conftest import OpenTeam
+from SQLiteBuildSchedule import UpdateSeasonSchedule
+from SQLiteConnection import CreateConnection
+from SQLiteCounterMatrix import LoadCounterMatrix
+from SQLiteCreateTables import CreateAllTables
+from SQLiteNormalizedCounters import MigrateWideCounters, LoadNormalizedCounterMatrix, SaveNormalizedCounterMatrix
+from SQLiteNormalizedCounters import UpdateNormalizedSeasonSchedule
+from SQLiteSportModel import GetSportModel
+
+def test_both_counter_sets_survive_migration(team):
+    conn, games = team
+    conn.execute("UPDATE tempCounters SET firstBaseCounter = firstBaseCounter + 5")
+    conn.commit()
+    MigrateWideCounters(conn, "positionCounters")
+    MigrateWideCounters(conn, "tempCounters")
+
+    for tableName in ("positionCounters", "tempCounters"):
+        wide = LoadCounterMatrix(conn, tableName)
+        normalized = LoadNormalizedCounterMatrix(conn, counterSet=tableName)
+        for key in ("rowIds", "playerIds", "values", "outfieldFlags", "lastPositionIds"):
+            assert normalized[key] == wide[key]
+    assert LoadNormalizedCounterMatrix(conn)["values"] != LoadNormalizedCounterMatrix(conn, counterSet="tempCounters")["values"]
+
+def test_unknown_counter_set_is_rejected(team):
+    conn, games = team
+    with pytest.raises(ValueError):
+        LoadNormalizedCounterMatrix(conn, counterSet="players")
+    with pytest.raises(ValueError):
+        SaveNormalizedCounterMatrix(conn, LoadCounterMatrix(conn, "positionCounters"), "players")
+
+def test_normalized_season_matches_wide_season(tmp_path):
+    wideConn, games = OpenTeam(tmp_path / "wide.db")
+    normalizedConn, games = OpenTeam(tmp_path / "normalized.db")
+    MigrateWideCounters(normalizedConn, "positionCounters")
+
+    assert UpdateNormalizedSeasonSchedule(normalizedConn, games) == UpdateSeasonSchedule(wideConn, games)
+    for tableName in ("positionCounters", "tempCounters"):
+        assert LoadNormalizedCounterMatrix(normalizedConn, counterSet=tableName)["values"] == LoadCounterMatrix(wideConn, tableName)["values"]
+    wideConn.close()
+    normalizedConn.close()
+
+@pytest.mark.parametrize("sport", ["soccer", "basketball"])
+def test_other_sports_schedule_without_position_rows(tmp_path, sport):
+    conn = CreateConnection(str(tmp_path / "team.db"), reuse=False)
+    CreateAllTables(conn)
+    with conn:
+        conn.executemany("INSERT INTO players(firstName, lastName) VALUES(?, ?)", [("Player%d" % i, "Team") for i in range(1, 11)])
+        conn.execute("INSERT INTO games(id, date, vs, startTime, homeFlag) VALUES(1, '2021-04-01', 'Opponent', '11:00', 1)")
+        conn.executemany("INSERT INTO positionCounters(playerId) VALUES(?)", [(i,) for i in range(1, 11)])
+    MigrateWideCounters(conn, "positionCounters")
+
+    model = GetSportModel(sport)
+    scheduleRows = UpdateNormalizedSeasonSchedule(conn, [(1, list(range(1, 11)), 4)], model=model)
+    assert len(scheduleRows) == 4 * len(model["scheduled"])
+    assert {row[2] for row in scheduleRows} == {i + 1 for i in model["scheduled"]}
+    assert conn.execute("SELECT COUNT(*) FROM schedule").fetchone()[0] == len(scheduleRows)
+    conn.close()
+
+def test_seeding_a_sport_renames_positions_of_another_sport(team):
+    conn, games = team
+    MigrateWideCounters(conn, "positionCounters")
+    for gameId, sport in ((games[0][0], "soccer"), (games[1][0], "basketball")):
+        model = GetSportModel(sport)
+        UpdateNormalizedSeasonSchedule(conn, [(gameId, list(range(1, 11)), 2)], model=model)
+        positions = conn.execute("SELECT id, name, infieldFlag FROM positions WHERE id <= ? ORDER BY id",
+                                 (model["positionCount"],)).fetchall()
+        assert positions == [(i + 1, name, 0 if model["restricted"][i] else 1) for i, name in enumerate(model["positionNames"])]
+        names = {row[0] for row in conn.execute("""SELECT positions.name FROM schedule
+                                                   INNER JOIN positions ON positions.id = schedule.positionId
+                                                   WHERE schedule.gameId = ?""", (gameId,))}
+        assert names <= set(model["positionNames"])
@@ -0,0 +1,80 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import io
+import json
+import threading
+import pytest
+from SQLiteBuildSchedule import UpdateEntireSchedule, FindNextPlayerForPosition
+from SQLiteCounterMatrix import PositionColumns
+from SQLiteProfiler import PROFILE_STAGES, Profiled, StartProfiling, StopProfiling, ProfileSummary, DumpProfile
+
+def test_profile_reports_every_requested_step(team, tmp_path, capsys):
+    conn, games = team
+    jsonPath = str(tmp_path / "profile.json")
+    assert StartProfiling(conn, 1.0, jsonPath)
+    gameId, playerIdList, inningCount = games[0]
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    summary = StopProfiling()
+
+    assert set(summary["stages"]) == set(PROFILE_STAGES)
+    for stage, entry in summary["stages"].items():
+        assert entry["calls"] > 0, stage
+    assert summary["stages"]["UpdateScheduleWithNextPosition"]["rowsChanged"] == inningCount * min(len(playerIdList), 8)
+    assert summary["stages"]["UpdateTempCountersTable"]["rowsChanged"] == len(playerIdList)
+    assert summary["stages"]["GetCurrentCounters"]["statements"] > 0
+
+    with open(jsonPath) as jsonFile:
+        assert set(json.load(jsonFile)["stages"]) == set(PROFILE_STAGES)
+    assert "FindNextPlayerForPosition" in capsys.readouterr().out
+
+def test_nothing_is_collected_when_profiling_is_off(team):
+    conn, games = team
+    assert not StartProfiling(conn, 0.0)
+    assert ProfileSummary() is None
+    assert StopProfiling() is None
+    output = io.StringIO()
+    DumpProfile(output)
+    assert output.getvalue() == ""
+
+def test_profiles_are_kept_per_thread(team):
+    conn, games = team
+    StartProfiling(conn, 1.0)
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(ProfileSummary()))
+    thread.start()
+    thread.join()
+    assert seen == [None]
+    assert ProfileSummary() is not None
+    StopProfiling()
+
+def test_nested_time_and_rows_stay_with_the_innermost_function(team):
+    conn, games = team
+
+    @Profiled
+    def Inner():
+        conn.execute("UPDATE players SET firstName = firstName")
+
+    @Profiled
+    def Outer():
+        Inner()
+
+    StartProfiling(conn, 1.0)
+    Outer()
+    functions = StopProfiling()["functions"]
+    playerCount = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    assert functions["Inner"]["rowsChanged"] == playerCount and functions["Outer"]["rowsChanged"] == 0
+    assert functions["Inner"]["statements"] > 0 and functions["Outer"]["statements"] == 0
+    assert functions["Outer"]["selfSeconds"] <= functions["Outer"]["seconds"]
+
+def test_selection_errors_are_recorded_and_raised(team):
+    conn, games = team
+    StartProfiling(conn, 1.0)
+    with pytest.raises(KeyError):
+        FindNextPlayerForPosition(conn, "noSuchCounter", "noSuchGame", "noSuchInning", [1, 2, 3], 1)
+    summary = StopProfiling()
+    assert len(summary["functions"]["FindNextPlayerForPosition"]["errors"]) == 1
+    assert len(summary["stages"]["FindNextPlayerForPosition"]["errors"]) == 1
+    assert FindNextPlayerForPosition(conn, *PositionColumns(0), [1, 2, 3], 1) in (1, 2, 3)
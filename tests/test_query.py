@@ -0,0 +1,64 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import csv
+import io
+import json
+import pytest
+from SQLiteBuildSchedule import UpdateSeasonSchedule
+from SQLiteQuery import IterateRows, SelectPage, IteratePages, ExportCsv, ExportJsonLines
+
+# The scheduleView definition from SQLiteCreateViews
+SCHEDULE_VIEW = """CREATE VIEW scheduleView AS
+                   SELECT schedule.id AS 'ID', games.date AS 'Date', schedule.inningNumber AS 'Inning',
+                          positions.name AS 'Position', players.firstName AS 'Player'
+                   FROM schedule
+                   INNER JOIN games ON games.id = schedule.gameId
+                   INNER JOIN positions ON positions.id = schedule.positionId
+                   INNER JOIN players ON players.id = schedule.playerId"""
+
+@pytest.fixture
+def scheduled(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games)
+    conn.execute(SCHEDULE_VIEW)
+    return conn
+
+def test_rows_stream_as_named_tuples(scheduled):
+    rows = IterateRows(scheduled, "SELECT id, firstName FROM players WHERE id <= ? ORDER BY id", (3,), arraySize=2)
+    assert [(row.id, row.firstName) for row in rows] == [(1, "Player1"), (2, "Player2"), (3, "Player3")]
+
+@pytest.mark.parametrize("source, key, table", [("players", "id", "players"), ("schedule", "id", "schedule"),
+                                                ("scheduleView", "ID", "scheduleView")])
+def test_pages_cover_every_row_once_in_key_order(scheduled, source, key, table):
+    expected = scheduled.execute("SELECT * FROM %s ORDER BY %s" % (table, key)).fetchall()
+    pages = list(IteratePages(scheduled, source, pageSize=7))
+    assert [tuple(row) for page in pages for row in page] == expected
+    assert all(len(page) == 7 for page in pages[:-1])
+
+def test_last_full_page_has_no_next_key(scheduled):
+    playerCount = scheduled.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    rows, nextKey = SelectPage(scheduled, "players", pageSize=playerCount)
+    assert len(rows) == playerCount and nextKey == playerCount
+    assert SelectPage(scheduled, "players", nextKey, playerCount) == ([], None)
+
+def test_unknown_source_is_rejected(scheduled):
+    with pytest.raises(ValueError):
+        SelectPage(scheduled, "sqlite_master")
+
+def test_exports_stream_every_row(scheduled):
+    expected = scheduled.execute("SELECT * FROM schedule ORDER BY id").fetchall()
+
+    csvFile = io.StringIO(newline="")
+    assert ExportCsv(scheduled, "schedule", csvFile) == len(expected)
+    lines = list(csv.reader(io.StringIO(csvFile.getvalue())))
+    assert lines[0] == ["id", "gameId", "playerId", "positionId", "inningNumber"]
+    assert [tuple(int(value) for value in line) for line in lines[1:]] == expected
+
+    jsonFile = io.StringIO()
+    assert ExportJsonLines(scheduled, "schedule", jsonFile) == len(expected)
+    records = [json.loads(line) for line in jsonFile.getvalue().splitlines()]
+    assert [(record["id"], record["gameId"], record["playerId"], record["positionId"], record["inningNumber"])
+            for record in records] == expected
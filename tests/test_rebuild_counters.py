@@ -0,0 +1,94 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteBuildSchedule import UpdateEntireSchedule, UpdateSeasonSchedule
+from SQLiteRebuildCounters import VerifyCounters, RebuildCounters
+
+def Counters(conn, tableName):
+    return conn.execute("SELECT * FROM %s ORDER BY id" % tableName).fetchall()
+
+def test_starting_counters_are_kept_with_a_baseline(team):
+    conn, games = team
+    before = Counters(conn, "tempCounters")
+    assert VerifyCounters(conn, baseline=True) == []
+    assert VerifyCounters(conn) != []
+    RebuildCounters(conn, baseline=True)
+    assert Counters(conn, "tempCounters") == before
+
+def test_scheduled_season_stays_in_step(team):
+    conn, games = team
+    RebuildCounters(conn, ["positionCounters", "tempCounters"])
+    UpdateSeasonSchedule(conn, games)
+    assert VerifyCounters(conn, ["positionCounters", "tempCounters"]) == []
+
+def test_counters_behind_the_schedule_are_repaired(team, capsys):
+    conn, games = team
+    gameId, playerIdList, inningCount = games[0]
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    expected = Counters(conn, "tempCounters")
+
+    # Lose every first base counter
+    conn.execute("UPDATE tempCounters SET firstBaseCounter = 0, firstBaseLastGame = 0, firstBaseLastInning = 0")
+    conn.commit()
+    firstBasePlayers = conn.execute("SELECT COUNT(DISTINCT playerId) FROM schedule WHERE positionId = 1").fetchone()[0]
+    differences = VerifyCounters(conn, baseline=True)
+    assert len([difference for difference in differences if difference[2] == "firstBaseCounter"]) == firstBasePlayers
+
+    RebuildCounters(conn, baseline=True)
+    assert VerifyCounters(conn, baseline=True) == []
+    for stored, original in zip(Counters(conn, "tempCounters"), expected):
+        playerId = stored[1]
+        played = conn.execute("SELECT COUNT(*) FROM schedule WHERE playerId = ? AND positionId = 1", (playerId,)).fetchone()[0]
+        if played:
+            assert stored[2:5] == (played,) + original[3:5]
+        assert stored[5:] == original[5:]
+
+def test_only_the_working_counters_are_rebuilt_by_default(team, capsys):
+    conn, games = team
+    gameId, playerIdList, inningCount = games[0]
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    primary = Counters(conn, "positionCounters")
+    RebuildCounters(conn)
+    assert Counters(conn, "positionCounters") == primary
+
+def test_rebuild_derives_from_the_schedule_alone(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games)
+    RebuildCounters(conn)
+    assert VerifyCounters(conn) == []
+    playerId, played = conn.execute("SELECT playerId, COUNT(*) FROM schedule WHERE positionId = 1 GROUP BY playerId LIMIT 1").fetchone()
+    assert conn.execute("SELECT firstBaseCounter FROM tempCounters WHERE playerId = ?", (playerId,)).fetchone()[0] == played
+
+def test_players_without_a_row_are_reported_and_added(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games)
+    playerId = games[0][1][0]
+    conn.execute("DELETE FROM tempCounters WHERE playerId = ?", (playerId,))
+    conn.commit()
+    assert ("tempCounters", playerId, "row", None, "missing") in VerifyCounters(conn)
+    RebuildCounters(conn)
+    assert VerifyCounters(conn) == []
+
+def test_deleted_innings_are_reported_and_taken_back(team, capsys):
+    conn, games = team
+    RebuildCounters(conn)
+    gameId, playerIdList, inningCount = games[0]
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    with conn:
+        conn.execute("DELETE FROM schedule WHERE gameId = ? AND inningNumber >= 3", (gameId,))
+
+    # The counters are ahead of the schedule; a baseline cannot tell that from starting counters
+    differences = VerifyCounters(conn)
+    assert differences and all(difference[3] != difference[4] for difference in differences)
+    assert any(difference[2].endswith("Counter") and difference[3] > difference[4] for difference in differences)
+    assert VerifyCounters(conn, baseline=True) == []
+
+    RebuildCounters(conn)
+    assert VerifyCounters(conn) == []
+    assert conn.execute("SELECT max(firstBaseLastInning) FROM tempCounters").fetchone()[0] <= 2
+    total = conn.execute("SELECT sum(%s) FROM tempCounters" % " + ".join(
+        name + "Counter" for name in ("firstBase", "secondBase", "thirdBase", "shortStop", "pitcher",
+                                      "rightField", "leftField", "centerField", "homeRun"))).fetchone()[0]
+    assert total == conn.execute("SELECT count(*) FROM schedule").fetchone()[0]
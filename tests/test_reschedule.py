@@ -0,0 +1,64 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+from SQLiteBuildSchedule import UpdateEntireSchedule, RescheduleGame
+from SQLiteCounterMatrix import LoadCounterMatrix, GetCounterMatrixCell
+
+def ScheduleFirstGame(conn, games):
+    gameId, playerIdList, inningCount = games[0]
+    UpdateEntireSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList, useCache=False)
+    return gameId, playerIdList, inningCount
+
+def GameRows(conn, gameId, where="1 = 1"):
+    return conn.execute("SELECT gameId, playerId, positionId, inningNumber FROM schedule WHERE gameId = ? AND " + where
+                        + " ORDER BY inningNumber, id", (gameId,)).fetchall()
+
+def AssertCountersMatchSchedule(conn, gameId):
+    # tempCounters started as a copy of positionCounters, so they differ by exactly the records of the game
+    primary = LoadCounterMatrix(conn, "positionCounters")
+    temp = LoadCounterMatrix(conn, "tempCounters")
+    for playerId in temp["playerIds"]:
+        for positionIndex in range(temp["positionCount"]):
+            played = conn.execute("SELECT COUNT(*) FROM schedule WHERE gameId = ? AND playerId = ? AND positionId = ?",
+                                  (gameId, playerId, positionIndex + 1)).fetchone()[0]
+            assert (GetCounterMatrixCell(temp, playerId, positionIndex)[0]
+                    == GetCounterMatrixCell(primary, playerId, positionIndex)[0] + played)
+
+def test_same_roster_rebuilds_the_same_innings(team, capsys):
+    conn, games = team
+    gameId, playerIdList, inningCount = ScheduleFirstGame(conn, games)
+    before = GameRows(conn, gameId)
+    counters = conn.execute("SELECT * FROM tempCounters ORDER BY id").fetchall()
+
+    RescheduleGame(conn, gameId, 3, playerIdList, inningCount)
+    assert GameRows(conn, gameId) == before
+    assert conn.execute("SELECT * FROM tempCounters ORDER BY id").fetchall() == counters
+
+def test_player_leaving_keeps_played_innings_and_counters_in_step(team, capsys):
+    conn, games = team
+    gameId, playerIdList, inningCount = ScheduleFirstGame(conn, games)
+    played = GameRows(conn, gameId, "inningNumber < 3")
+    leaving = playerIdList[0]
+    roster = playerIdList[1:]
+
+    scheduleRows = RescheduleGame(conn, gameId, 3, roster, inningCount)
+    assert GameRows(conn, gameId, "inningNumber < 3") == played
+    assert GameRows(conn, gameId, "inningNumber >= 3") == scheduleRows
+    assert {row[3] for row in scheduleRows} == set(range(3, inningCount + 1))
+    assert leaving not in {row[1] for row in scheduleRows}
+    AssertCountersMatchSchedule(conn, gameId)
+
+def test_player_arriving_is_scheduled(team, capsys):
+    conn, games = team
+    # The second game has fewer players than positions, so everybody plays every inning
+    gameId, playerIdList, inningCount = games[1]
+    assert len(playerIdList) < 8
+    roster = playerIdList[:-1]
+    UpdateEntireSchedule(conn, len(roster), gameId, inningCount, playerIdList=roster, useCache=False)
+
+    scheduleRows = RescheduleGame(conn, gameId, 2, playerIdList, inningCount)
+    assert {row[1] for row in scheduleRows} == set(playerIdList)
+    assert len(scheduleRows) == (inningCount - 1) * len(playerIdList)
+    AssertCountersMatchSchedule(conn, gameId)
@@ -0,0 +1,51 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sqlite3
+
+from SQLiteBuildSchedule import PreviewGameSchedule, ScheduleGameSession
+from SQLiteScheduleCache import ClearScheduleCache, StoreSchedule, LookupSchedule
+
+def CountCommits(conn):
+    """ Traces the connection and returns the list the COMMIT statements are collected in
+    """
+
+    commits = []
+    conn.set_trace_callback(lambda statement: commits.append(statement) if statement.upper().startswith("COMMIT") else None)
+    return commits
+
+def test_cache_table_is_created_with_the_team(team):
+    conn, games = team
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'scheduleCache'").fetchone() is not None
+
+def test_cached_game_is_written_with_one_commit(team):
+    conn, games = team
+    ClearScheduleCache(conn)
+    for gameId, playerIdList, inningCount in games:
+        commits = CountCommits(conn)
+        ScheduleGameSession(conn, playerIdList, len(playerIdList), gameId, inningCount)
+        conn.set_trace_callback(None)
+        assert len(commits) == 1
+    assert conn.execute("SELECT count(*) FROM scheduleCache").fetchone()[0] == 0
+
+def test_previewed_game_is_written_from_the_cache(team):
+    conn, games = team
+    ClearScheduleCache(conn)
+    gameId, playerIdList, inningCount = games[0]
+    preview = PreviewGameSchedule(conn, len(playerIdList), gameId, inningCount, playerIdList=playerIdList)
+    assert conn.execute("SELECT count(*) FROM scheduleCache").fetchone()[0] == 1
+
+    # The memory cache is emptied so the schedule can only come from the table
+    ClearScheduleCache()
+    assert ScheduleGameSession(conn, playerIdList, len(playerIdList), gameId, inningCount) == preview
+    written = conn.execute("SELECT gameId, playerId, positionId, inningNumber FROM schedule WHERE gameId = ?", (gameId,)).fetchall()
+    assert sorted(written) == sorted(preview)
+
+def test_database_without_the_cache_table_keeps_the_schedule_in_memory():
+    conn = sqlite3.connect(":memory:")
+    ClearScheduleCache()
+    StoreSchedule(conn, "key", 7, 1, "greedy", [(7, 1, 1, 1)])
+    assert LookupSchedule(conn, "key") == [(7, 1, 1, 1)]
+    conn.close()
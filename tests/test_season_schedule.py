@@ -0,0 +1,90 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import sqlite3
+
+import pytest
+
+import SQLiteBuildSchedule
+from SQLiteBuildSchedule import GREEDY_MODE, ScheduleGameInMatrix, ScheduleGameSession, UpdateSeasonSchedule
+from SQLiteConnection import CreateConnection
+from SQLiteCounterMatrix import LoadCounterMatrix, CopyCounterMatrix
+from SQLiteLeagueSchedule import UnscheduledGames
+from SQLiteRebuildCounters import VerifyCounters
+
+def test_season_matches_game_by_game_scheduling(team):
+    conn, games = team
+    matrix = LoadCounterMatrix(conn, "positionCounters")
+    expected = []
+    for gameId, playerIdList, inningCount in games:
+        expected.extend(ScheduleGameInMatrix(matrix, playerIdList, len(playerIdList), gameId, inningCount, GREEDY_MODE))
+
+    assert UpdateSeasonSchedule(conn, games) == expected
+    assert conn.execute("SELECT gameId, playerId, positionId, inningNumber FROM schedule ORDER BY id").fetchall() == expected
+    assert LoadCounterMatrix(conn, "positionCounters")["values"] == matrix["values"]
+
+def test_season_keeps_both_counter_tables_in_step(team):
+    conn, games = team
+    UpdateSeasonSchedule(conn, games)
+    primary = conn.execute("SELECT * FROM positionCounters ORDER BY id").fetchall()
+    assert conn.execute("SELECT * FROM tempCounters ORDER BY id").fetchall() == primary
+
+def test_every_player_plays_once_per_inning(team):
+    conn, games = team
+    scheduleRows = UpdateSeasonSchedule(conn, games)
+    players = set()
+    positions = set()
+    for gameId, playerId, positionId, inningNumber in scheduleRows:
+        assert (gameId, playerId, inningNumber) not in players
+        assert (gameId, positionId, inningNumber) not in positions
+        players.add((gameId, playerId, inningNumber))
+        positions.add((gameId, positionId, inningNumber))
+
+def test_season_holds_the_write_lock_while_it_builds(teamPath, monkeypatch):
+    conn = CreateConnection(teamPath, reuse=False)
+    other = CreateConnection(teamPath, reuse=False)
+    other.execute("PRAGMA busy_timeout = 0")
+    games = UnscheduledGames(conn, 2)[:2]
+    assert len(games) == 2
+    blocked = []
+
+    # A session that tries to write while the season is being built must wait for the season's commit
+    def BuildWhileWriting(*args):
+        try:
+            other.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            blocked.append(e)
+        return ScheduleGameInMatrix(*args)
+
+    monkeypatch.setattr(SQLiteBuildSchedule, "ScheduleGameInMatrix", BuildWhileWriting)
+    UpdateSeasonSchedule(conn, games)
+    assert len(blocked) == len(games)
+    assert not conn.in_transaction
+    other.close()
+    conn.close()
+
+def test_season_rolls_back_when_a_game_fails(team):
+    conn, games = team
+    before = conn.execute("SELECT * FROM positionCounters ORDER BY id").fetchall()
+    with pytest.raises(sqlite3.IntegrityError):
+        UpdateSeasonSchedule(conn, games[:1] + [(9999, games[1][1], 2)])
+    assert not conn.in_transaction
+    assert conn.execute("SELECT count(*) FROM schedule").fetchone()[0] == 0
+    assert conn.execute("SELECT * FROM positionCounters ORDER BY id").fetchall() == before
+
+def test_season_builds_on_games_written_by_sessions(team):
+    conn, games = team
+    (firstId, firstPlayers, firstInnings), (secondId, secondPlayers, secondInnings) = games[:2]
+    sessionRows = ScheduleGameSession(conn, firstPlayers, len(firstPlayers), firstId, firstInnings, useCache=False)
+    working = LoadCounterMatrix(conn, "tempCounters")
+    seasonRows = UpdateSeasonSchedule(conn, [(secondId, secondPlayers, secondInnings)])
+
+    # The season's counters include the session's game, and so do both tables
+    expected = CopyCounterMatrix(working)
+    assert seasonRows == ScheduleGameInMatrix(expected, secondPlayers, len(secondPlayers), secondId, secondInnings, GREEDY_MODE)
+    for tableName in ("tempCounters", "positionCounters"):
+        assert LoadCounterMatrix(conn, tableName)["values"] == expected["values"]
+    assert conn.execute("SELECT count(*) FROM schedule WHERE gameId = ?", (firstId,)).fetchone()[0] == len(sessionRows)
+    assert VerifyCounters(conn, baseline=True) == []
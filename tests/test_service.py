@@ -0,0 +1,87 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import asyncio
+import json
+import pytest
+from SQLiteService import ScheduleService
+
+@pytest.fixture
+def service(teamPath):
+    service = ScheduleService({"team": teamPath}, workers=2)
+    yield service
+    service.executor.shutdown(wait=True)
+
+def Request(service, method, path, body=None):
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    return asyncio.run(service.Dispatch(method, path, payload))
+
+def test_game_is_scheduled_and_served_as_a_lineup(service):
+    status, response = Request(service, "POST", "/teams/team/games/7/schedule", {"playerIds": [1, 2, 3, 4, 5, 6, 7, 8], "inningCount": 3})
+    assert status == 200 and len(response["rows"]) == 24
+    status, response = Request(service, "GET", "/teams/team/games/7/lineup")
+    assert status == 200 and len(response["lineup"]) == 24
+
+def test_season_is_scheduled(service):
+    games = [{"gameId": 7, "playerIds": [1, 2, 3, 4, 5, 6, 7, 8, 9]}, {"gameId": "8", "playerIds": [2, 3, 4, 5, 6, 7, 8, 9], "inningCount": 2}]
+    status, response = Request(service, "POST", "/teams/team/schedule", {"games": games, "inningCount": 3})
+    assert status == 200 and len(response["rows"]) == 3 * 8 + 2 * 8
+
+@pytest.mark.parametrize("path, body", [
+    ("/teams/team/schedule", {"inningCount": "four"}),
+    ("/teams/team/schedule", {"inningCount": 0}),
+    ("/teams/team/schedule", {"games": [{"playerIds": [1, 2]}]}),
+    ("/teams/team/schedule", {"games": [{"gameId": 7, "playerIds": [1, 1, 2]}]}),
+    ("/teams/team/schedule", {"games": [{"gameId": 7, "playerIds": [1, 2], "inningCount": 2.5}]}),
+    ("/teams/team/schedule", {"games": {"gameId": 7}}),
+    ("/teams/team/schedule", {"games": [{"gameId": 7, "playerIds": [1, 99]}]}),
+    ("/teams/team/schedule", {"games": [{"gameId": 999, "playerIds": [1, 2]}]}),
+    ("/teams/team/games/7/schedule", {"playerIds": [1, 2], "inningCount": None}),
+    ("/teams/team/games/7/schedule", {"playerIds": [1, True]}),
+    ("/teams/team/games/7/schedule", {"playerIds": [1, 99], "mode": "matching"}),
+    ("/teams/team/games/999/schedule", {"playerIds": [1, 2]}),
+    ("/teams/team/games/7/reschedule", {"playerIds": [1, 2]}),
+    ("/teams/team/games/7/reschedule", {"playerIds": [1, 2], "resumeInning": 5, "inningCount": 4}),
+    ("/teams/team/games/7/reschedule", {"playerIds": [1, 2], "resumeInning": "x"}),
+    ("/teams/team/games/7/schedule", {"mode": "random"}),
+])
+def test_bad_requests_are_answered_with_400(service, path, body):
+    status, response = Request(service, "POST", path, body)
+    assert status == 400, response
+    assert response["error"]
+
+def test_nothing_is_written_for_a_bad_roster(service, teamPath):
+    Request(service, "POST", "/teams/team/games/7/schedule", {"playerIds": [1, 99]})
+    Request(service, "POST", "/teams/team/schedule", {"games": [{"gameId": 7, "playerIds": [1, 2]}, {"gameId": 8, "playerIds": [99]}]})
+    status, response = Request(service, "GET", "/teams/team/games/7/lineup")
+    assert response["lineup"] == []
+
+def test_routing_errors(service):
+    assert Request(service, "GET", "/teams/nobody/games/7/lineup")[0] == 404
+    assert Request(service, "GET", "/nowhere")[0] == 404
+    assert Request(service, "GET", "/teams/team/schedule")[0] == 405
+    assert asyncio.run(service.Dispatch("POST", "/teams/team/schedule", b"{not json"))[0] == 400
+
+def test_unexpected_errors_are_answered_with_500(service, monkeypatch):
+    async def Broken(body):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, "Health", Broken)
+    status, response = Request(service, "GET", "/health")
+    assert status == 500 and "RuntimeError" in response["error"]
+    assert Request(service, "GET", "/health")[0] == 500
+    monkeypatch.undo()
+    assert Request(service, "GET", "/health")[1]["stats"]["errors"] == 2
+
+def test_games_do_not_wait_for_the_team_lock(service):
+    async def ScheduleWhileLocked():
+        async with service.writeLocks["team"]:
+            return await asyncio.wait_for(asyncio.gather(*[
+                service.Dispatch("POST", "/teams/team/games/%d/schedule" % gameId,
+                                 json.dumps({"playerIds": [1, 2, 3, 4], "inningCount": 2}).encode("utf-8"))
+                for gameId in (7, 8)]), 10)
+
+    for status, response in asyncio.run(ScheduleWhileLocked()):
+        assert status == 200 and len(response["rows"]) == 8
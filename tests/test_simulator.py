@@ -0,0 +1,34 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+from SQLiteBuildSchedule import GREEDY_MODE
+from SQLiteSimulator import METRICS, POLICIES, Distribution, SimulateSeason, RunSimulation
+
+SETTINGS = {"sport": "baseball", "playerCount": 10, "gameCount": 6, "inningCount": 4, "minAttendance": 0.6,
+            "maxAttendance": 0.95, "seed": 1}
+
+def test_seasons_are_repeatable_and_measured():
+    season = SimulateSeason(GREEDY_MODE, 3, SETTINGS)
+    assert season == SimulateSeason(GREEDY_MODE, 3, SETTINGS)
+    assert set(season) == set(METRICS)
+    assert SimulateSeason(GREEDY_MODE, 4, SETTINGS) != season
+
+@pytest.mark.parametrize("sport", ["soccer", "basketball"])
+def test_other_sports_can_be_simulated(sport):
+    assert set(SimulateSeason(GREEDY_MODE, 0, dict(SETTINGS, sport=sport))) == set(METRICS)
+
+def test_distribution():
+    distribution = Distribution([4, 1, 3, 2])
+    assert (distribution["min"], distribution["max"], distribution["mean"]) == (1, 4, 2.5)
+    assert distribution["p50"] == 3
+    assert distribution["stdev"] == pytest.approx(1.118, abs=1e-3)
+
+def test_report_does_not_depend_on_the_worker_count():
+    first = RunSimulation(seasons=6, gameCount=4, seed=2, workers=1)
+    second = RunSimulation(seasons=6, gameCount=4, seed=2, workers=2)
+    assert first["policies"] == second["policies"]
+    assert set(first["policies"]) == set(POLICIES)
+    assert first["settings"]["seasons"] == 6
@@ -0,0 +1,92 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+
+import SQLiteSnapshot
+from SQLiteBuildSchedule import GREEDY_MODE, MATCHING_MODE, UpdateSeasonSchedule
+from SQLiteConnection import CreateConnection
+from SQLiteLineupCards import CreateLineupCards
+from SQLiteSnapshot import (CreateSnapshot, PromoteSnapshot, DiscardSnapshot, TryAlternatives, PromoteAlternative,
+                            StaleSnapshotError, SchemaObjects, TableRows)
+
+def DatabaseContents(conn):
+    """ Reads every table of a database, keyed by table name
+    """
+
+    names = sorted(name for kind, name in SchemaObjects(conn) if kind == "table")
+    return {name: TableRows(conn, name)[2] for name in names}
+
+def test_snapshot_does_not_touch_the_database(team):
+    conn, games = team
+    before = DatabaseContents(conn)
+    snapshot = CreateSnapshot(conn)
+    UpdateSeasonSchedule(snapshot["conn"], games[:2])
+    DiscardSnapshot(snapshot)
+    assert DatabaseContents(conn) == before
+
+def test_promoted_snapshot_matches_the_database(team):
+    conn, games = team
+    CreateLineupCards(conn)
+    snapshot = CreateSnapshot(conn)
+    UpdateSeasonSchedule(snapshot["conn"], games[:2])
+    snapshot["conn"].execute("DELETE FROM attendance WHERE gameId = ?", (games[2][0],))
+    snapshot["conn"].execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, note TEXT)")
+    snapshot["conn"].execute("INSERT INTO notes (note) VALUES ('rain delay')")
+    expected = DatabaseContents(snapshot["conn"])
+    PromoteSnapshot(snapshot)
+    assert not conn.in_transaction
+    assert DatabaseContents(conn) == expected
+    assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+
+def test_stale_snapshot_is_refused(teamPath):
+    conn = CreateConnection(teamPath, reuse=False)
+    other = CreateConnection(teamPath, reuse=False)
+    snapshot = CreateSnapshot(conn)
+    UpdateSeasonSchedule(snapshot["conn"], [(7, [1, 2, 3], 1)])
+    with other:
+        other.execute("UPDATE players SET firstName = 'Changed' WHERE id = 1")
+    before = DatabaseContents(conn)
+    with pytest.raises(StaleSnapshotError):
+        PromoteSnapshot(snapshot)
+    assert not conn.in_transaction
+    assert DatabaseContents(conn) == before
+    DiscardSnapshot(snapshot)
+    other.close()
+    conn.close()
+
+def test_promotion_holds_the_write_lock(teamPath, monkeypatch):
+    conn = CreateConnection(teamPath, reuse=False)
+    other = CreateConnection(teamPath, reuse=False)
+    other.execute("PRAGMA busy_timeout = 0")
+    snapshot = CreateSnapshot(conn)
+    UpdateSeasonSchedule(snapshot["conn"], [(7, [1, 2, 3], 1)])
+
+    # A writer that starts while the promotion is writing must wait for it
+    original = SQLiteSnapshot.ApplySnapshot
+    blocked = []
+
+    def ApplyWhileWriting(source, snapshotConn):
+        try:
+            other.execute("BEGIN IMMEDIATE")
+        except Exception as e:
+            blocked.append(e)
+        original(source, snapshotConn)
+
+    monkeypatch.setattr(SQLiteSnapshot, "ApplySnapshot", ApplyWhileWriting)
+    PromoteSnapshot(snapshot)
+    assert len(blocked) == 1
+    assert conn.execute("SELECT count(*) FROM schedule WHERE gameId = 7").fetchone()[0] == 3
+    other.close()
+    conn.close()
+
+def test_only_the_chosen_alternative_is_promoted(team):
+    conn, games = team
+    results = TryAlternatives(conn, [lambda snapshotConn, mode=mode: UpdateSeasonSchedule(snapshotConn, games[:1], mode)
+                                     for mode in (GREEDY_MODE, MATCHING_MODE)])
+    chosen = results[1][1]
+    PromoteAlternative(results, 1)
+    written = conn.execute("SELECT gameId, playerId, positionId, inningNumber FROM schedule").fetchall()
+    assert sorted(written) == sorted(chosen)
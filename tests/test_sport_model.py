@@ -0,0 +1,65 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import json
+
+import pytest
+
+from SQLiteSportModel import (BASEBALL, SOCCER, DEFAULT_MODEL, CompileSportModel, GetSportModel, LoadSportModel,
+                              LoadSportModelFile, IsRestrictedPosition, StaffedPositions)
+
+def test_definitions_are_compiled_once():
+    assert CompileSportModel(json.loads(json.dumps(BASEBALL))) is DEFAULT_MODEL
+    assert GetSportModel("soccer") is CompileSportModel(SOCCER)
+    assert GetSportModel("soccer")["signature"] != DEFAULT_MODEL["signature"]
+
+def test_baseball_fills_the_outfield_first_and_never_schedules_home_run():
+    assert DEFAULT_MODEL["positionCount"] == 9
+    assert 8 not in DEFAULT_MODEL["scheduled"]
+    assert DEFAULT_MODEL["fillOrder"] == (7, 6, 5, 4, 3, 2, 1, 0)
+    assert IsRestrictedPosition(DEFAULT_MODEL, 6) and not IsRestrictedPosition(DEFAULT_MODEL, 1)
+    assert not IsRestrictedPosition(DEFAULT_MODEL, None) and not IsRestrictedPosition(DEFAULT_MODEL, 99)
+
+def test_short_roster_leaves_the_last_positions_empty():
+    assert StaffedPositions(DEFAULT_MODEL, 6) == [5, 4, 3, 2, 1, 0]
+    assert StaffedPositions(GetSportModel("basketball"), 3) == [0, 1, 2]
+
+def test_explicit_fill_order_is_by_name():
+    model = CompileSportModel({"name": "pairs", "positions": [{"name": "A"}, {"name": "B"}], "fillOrder": ["B", "A"]})
+    assert model["fillOrder"] == (1, 0)
+
+@pytest.mark.parametrize("definition", [
+    {"positions": []},
+    {"positions": [{"group": "a"}]},
+    {"positions": [{"name": "A", "group": "a"}], "restrictedGroups": ["b"]},
+    {"positions": [{"name": "A"}, {"name": "B"}], "fillOrder": ["A"]},
+])
+def test_bad_definitions_are_refused(definition):
+    with pytest.raises(ValueError):
+        CompileSportModel(definition)
+
+def test_unknown_sport_is_refused():
+    with pytest.raises(ValueError):
+        GetSportModel("cricket")
+
+def test_definition_file_is_compiled(tmp_path):
+    path = tmp_path / "soccer.json"
+    path.write_text(json.dumps(SOCCER))
+    assert LoadSportModelFile(str(path)) is GetSportModel("soccer")
+
+def test_team_model_comes_from_the_positions_table(team):
+    conn, games = team
+    model = LoadSportModel(conn)
+    assert model["positionNames"] == DEFAULT_MODEL["positionNames"]
+    assert model["restricted"] == DEFAULT_MODEL["restricted"]
+    assert model["scheduled"] == DEFAULT_MODEL["scheduled"]
+    assert model["fillOrder"] == DEFAULT_MODEL["fillOrder"]
+
+def test_positions_with_gaps_are_refused(team):
+    conn, games = team
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute("DELETE FROM positions WHERE id = 3")
+    with pytest.raises(ValueError):
+        LoadSportModel(conn)
@@ -0,0 +1,53 @@
+# Author: Seth Hobbes
+# Created: 10/18/2026
+# Copyright: Springboro Technologies, LLC DBA Monarch Technologies all rights reserved
+# Last Modified: 10/18/2026
+
+import pytest
+
+from SQLiteCounterMatrix import PositionColumns
+from SQLiteStatements import (CheckIdentifiers, SelectCounterColumns, UpdateCounterColumns, SelectCounterRows,
+                              SelectRoster, InsertSchedule, PlayerListParameter, statementCache)
+
+def test_unknown_identifiers_are_refused():
+    CheckIdentifiers(["tempCounters"], ("positionCounters", "tempCounters"), "table")
+    with pytest.raises(ValueError, match="Unknown column"):
+        CheckIdentifiers(["firstBaseCounter", "id; DROP TABLE players"], ["firstBaseCounter"], "column")
+
+@pytest.mark.parametrize("build", [
+    lambda: SelectCounterColumns("players", ["firstBaseCounter"]),
+    lambda: SelectCounterColumns("tempCounters", ["firstName"]),
+    lambda: UpdateCounterColumns("tempCounters", ["playerId"]),
+    lambda: SelectCounterRows("tempCounters WHERE 1 = 1 --"),
+    lambda: SelectRoster("schedule"),
+    lambda: InsertSchedule(("gameId", "id")),
+])
+def test_builders_refuse_unknown_identifiers(build):
+    count = len(statementCache)
+    with pytest.raises(ValueError):
+        build()
+    assert len(statementCache) == count
+
+def test_statements_are_built_once():
+    columns = PositionColumns(0)
+    first = SelectCounterColumns("tempCounters", columns)
+    assert SelectCounterColumns("tempCounters", list(columns)) is first
+    assert SelectCounterColumns("positionCounters", columns) != first
+    assert UpdateCounterColumns("tempCounters", columns) is UpdateCounterColumns("tempCounters", columns)
+    assert InsertSchedule() is InsertSchedule()
+
+def test_built_statements_run(team):
+    conn, games = team
+    columns = PositionColumns(1)
+    conn.execute(UpdateCounterColumns("tempCounters", columns), (5, 7, 2, 1))
+    assert conn.execute(SelectCounterColumns("tempCounters", columns), (1,)).fetchone() == (5, 7, 2)
+    roster = [row[0] for row in conn.execute(SelectRoster("tempCounters"))]
+    assert roster == [row[0] for row in conn.execute("SELECT playerId FROM tempCounters ORDER BY rowid")]
+
+@pytest.mark.parametrize("playerIdList", [[], [3], [5, 1, 3], list(range(1, 11))])
+def test_one_statement_reads_any_number_of_players(team, playerIdList):
+    conn, games = team
+    rows = conn.execute(SelectCounterRows("tempCounters"), (PlayerListParameter(playerIdList),)).fetchall()
+    expected = conn.execute("SELECT * FROM tempCounters WHERE playerId IN (%s) ORDER BY rowid"
+                            % ", ".join(str(playerId) for playerId in playerIdList or [0])).fetchall()
+    assert rows == expected